@@ -7,13 +7,18 @@ Ele baixa o áudio, transcreve usando a API da OpenAI, processa o conteúdo com
 para criar um ebook estruturado e gera um PDF formatado.
 """
 
+import copy
 import json
 import os
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import openai
 import yt_dlp
@@ -22,8 +27,120 @@ from weasyprint import CSS, HTML
 
 # Importa todas as configurações do projeto
 from config import *
+from pipeline import (
+    CHAPTER_SCHEMA,
+    EBOOK_FRAME_SCHEMA,
+    EBOOK_OUTLINE_SCHEMA,
+    EBOOK_SCHEMA,
+    IncrementalJSONParser,
+    JSONTTLCache,
+    LocalWhisperBackend,
+    LRUDiskCache,
+    OpenAITranscriptionBackend,
+    TimeRange,
+    TranscriptionBackend,
+    TranscriptionCheckpoint,
+    WordTimestampStore,
+    assign_outline_spans,
+    caption_track_languages,
+    convert_to_speech_profile,
+    count_message_tokens,
+    count_tokens,
+    cut_segment,
+    cut_segments,
+    detect_silences,
+    ebook_continuation_schema,
+    extract_chapters,
+    find_downloaded_audio,
+    hash_file,
+    is_caption_usable,
+    is_original_caption,
+    json_schema_response_format,
+    make_cache_key,
+    merge_segment_transcripts,
+    missing_ebook_fields,
+    offset_transcription,
+    parse_captions,
+    plan_fixed_segments,
+    plan_segments_by_size,
+    plan_silence_segments,
+    probe_audio,
+    remux_audio,
+    repair_json,
+    resolve_time_range,
+    select_caption_track,
+    slice_transcription,
+    split_transcript,
+)
+from pipeline.settings import (
+    AUDIO_CACHE_DIR,
+    AUDIO_CACHE_ENABLED,
+    AUDIO_CACHE_MAX_SIZE_MB,
+    AUDIO_PASSTHROUGH,
+    AUDIO_PASSTHROUGH_FORMAT,
+    AUDIO_SEGMENT_BITRATE_AWARE,
+    AUDIO_SEGMENT_SIZE_SAFETY_MARGIN,
+    AUDIO_SILENCE_MIN_DURATION,
+    AUDIO_SILENCE_MIN_LAST_SEGMENT_SECONDS,
+    AUDIO_SILENCE_NOISE_DB,
+    AUDIO_SILENCE_SEARCH_WINDOW_SECONDS,
+    AUDIO_SILENCE_SPLIT,
+    AUDIO_SPEECH_BITRATE,
+    AUDIO_SPEECH_PROFILE,
+    AUDIO_SPEECH_SAMPLE_RATE,
+    CAPTIONS_ALLOW_AUTOMATIC,
+    CAPTIONS_FAST_PATH,
+    CAPTIONS_FORMAT,
+    CAPTIONS_LANGUAGES,
+    CAPTIONS_MIN_WORDS_PER_MINUTE,
+    CHAPTER_MAX_WORKERS,
+    CHAPTER_PARALLEL,
+    CHAPTER_PARALLEL_MIN_CHAPTERS,
+    CHAPTER_PARALLEL_MIN_DURATION_MINUTES,
+    COMPLETION_CACHE_BYPASS,
+    COMPLETION_CACHE_DIR,
+    COMPLETION_CACHE_ENABLED,
+    COMPLETION_CACHE_MAX_SIZE_MB,
+    EBOOK_MAP_CHUNK_CHARS,
+    EBOOK_MAP_MAX_WORKERS,
+    EBOOK_MAP_REDUCE,
+    EBOOK_MAP_REDUCE_THRESHOLD_CHARS,
+    EBOOK_OUTLINE_BLOCK_CHARS,
+    EBOOK_OUTLINE_FIRST,
+    EBOOK_OUTLINE_MAX_WORKERS,
+    EBOOK_REPAIR_INVALID,
+    EBOOK_STREAMING,
+    LOCAL_WHISPER_COMPUTE_TYPE,
+    LOCAL_WHISPER_MODEL_SIZE,
+    LOCAL_WHISPER_THREADS,
+    METADATA_CACHE_DIR,
+    METADATA_CACHE_ENABLED,
+    METADATA_CACHE_TTL_HOURS,
+    OPENAI_GPT_CONTEXT_WINDOW,
+    OPENAI_GPT_OUTPUT_COST_PER_1K_TOKENS,
+    OPENAI_STRUCTURED_OUTPUT,
+    PIPELINE_MAX_PENDING_SEGMENTS,
+    TIME_RANGE_CHAPTER,
+    TIME_RANGE_END,
+    TIME_RANGE_START,
+    TRANSCRIPTION_BACKEND,
+    TRANSCRIPTION_CACHE_DIR,
+    TRANSCRIPTION_CACHE_ENABLED,
+    TRANSCRIPTION_CACHE_MAX_SIZE_MB,
+    TRANSCRIPTION_CHECKPOINT_DIR,
+    TRANSCRIPTION_CHECKPOINTS,
+    TRANSCRIPTION_MAX_WORKERS,
+    TRANSCRIPTION_PIPELINE,
+    TRANSCRIPTION_RESPONSE_FORMAT,
+    TRANSCRIPTION_WORD_TIMESTAMPS,
+    YT_DLP_SINGLE_PASS,
+)
+from prompts.system_prompt_chapter import SYSTEM_PROMPT_EBOOK_CHAPTER, SYSTEM_PROMPT_EBOOK_FRAME
 from prompts.system_prompt_ebook import SYSTEM_PROMPT_EBOOK
-from prompts.user_prompt_ebook import get_user_prompt_ebook
+from prompts.system_prompt_outline import SYSTEM_PROMPT_EBOOK_OUTLINE
+from prompts.user_prompt_chapter import get_user_prompt_ebook_chapter, get_user_prompt_ebook_frame
+from prompts.user_prompt_ebook import get_user_prompt_ebook, get_user_prompt_ebook_continuation
+from prompts.user_prompt_outline import get_user_prompt_ebook_outline
 
 # Configura logging usando as configurações centralizadas
 logger = setup_logging()
@@ -35,22 +152,69 @@ openai.api_key = OPENAI_API_KEY
 class YouTubeEbookGenerator:
     """Classe principal para gerar ebooks a partir de vídeos do YouTube."""
 
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, bypass_completion_cache: bool = COMPLETION_CACHE_BYPASS):
         """
         Inicializa o gerador de ebooks.
 
         Args:
             output_dir: Diretório para salvar os arquivos de saída (usa DEFAULT_OUTPUT_DIR se None)
+            bypass_completion_cache: Ignora respostas do GPT em cache e gera o conteúdo de novo
         """
         self.output_dir = Path(output_dir or DEFAULT_OUTPUT_DIR)
         self.output_dir.mkdir(exist_ok=True)
         self.temp_dir = None
         self.total_cost_usd = 0.0
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+        self.audio_cache = LRUDiskCache(AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_SIZE_MB) if AUDIO_CACHE_ENABLED else None
+        self.metadata_cache = (
+            JSONTTLCache(METADATA_CACHE_DIR, METADATA_CACHE_TTL_HOURS * 3600) if METADATA_CACHE_ENABLED else None
+        )
+        # Informações do yt-dlp já resolvidas nesta execução, compartilhadas entre legendas e download
+        self._extracted_info: Dict[str, Dict[str, Any]] = {}
+        self.transcription_backend = self._create_transcription_backend()
+        # Limite global de envios simultâneos ao backend de transcrição, compartilhado entre os
+        # capítulos processados em paralelo e os segmentos de cada capítulo
+        self._transcription_slots = threading.BoundedSemaphore(max(1, TRANSCRIPTION_MAX_WORKERS))
+        self.transcription_cache = (
+            LRUDiskCache(TRANSCRIPTION_CACHE_DIR, TRANSCRIPTION_CACHE_MAX_SIZE_MB)
+            if TRANSCRIPTION_CACHE_ENABLED
+            else None
+        )
+        self.completion_cache = (
+            LRUDiskCache(COMPLETION_CACHE_DIR, COMPLETION_CACHE_MAX_SIZE_MB) if COMPLETION_CACHE_ENABLED else None
+        )
+        self.bypass_completion_cache = bypass_completion_cache
+        self._completion_cache_lock = threading.Lock()
+        # Chave de cache da última resposta de cada par de prompts (a descartada se a resposta for inválida)
+        self._completion_keys: Dict[str, str] = {}
+        self._cost_lock = threading.Lock()
+        # Desligado automaticamente se o modelo não aceitar schemas de resposta
+        self.structured_output = OPENAI_STRUCTURED_OUTPUT
 
         # Verifica se a API key está configurada
         if not openai.api_key:
             raise ValueError('OPENAI_API_KEY não encontrada. Configure a variável de ambiente.')
 
+    def _create_transcription_backend(self) -> TranscriptionBackend:
+        """Cria o backend de transcrição configurado em TRANSCRIPTION_BACKEND."""
+        if TRANSCRIPTION_BACKEND == 'local':
+            return LocalWhisperBackend(
+                LOCAL_WHISPER_MODEL_SIZE,
+                LOCAL_WHISPER_THREADS,
+                LOCAL_WHISPER_COMPUTE_TYPE,
+                TRANSCRIPTION_WORD_TIMESTAMPS,
+            )
+        if TRANSCRIPTION_BACKEND == 'openai':
+            return OpenAITranscriptionBackend(
+                OPENAI_WHISPER_MODEL,
+                TRANSCRIPTION_RESPONSE_FORMAT,
+                TRANSCRIPTION_WORD_TIMESTAMPS,
+                OPENAI_WHISPER_COST_PER_MINUTE,
+                MAX_AUDIO_FILE_SIZE_MB,
+            )
+        raise ValueError(f'TRANSCRIPTION_BACKEND inválido: {TRANSCRIPTION_BACKEND} (use "openai" ou "local")')
+
     def __enter__(self):
         """Context manager para gerenciar arquivos temporários."""
         self.temp_dir = tempfile.mkdtemp()
@@ -64,16 +228,316 @@ class YouTubeEbookGenerator:
             shutil.rmtree(self.temp_dir)
             logger.info(f'Arquivos temporários removidos: {self.temp_dir}')
 
-    def download_audio(self, url: str) -> Dict[str, Any]:
+    def _resolve_video_id(self, url: str) -> Optional[str]:
+        """
+        Resolve o ID do vídeo (extrator + ID) a partir da URL, sem acessar a rede.
+
+        Args:
+            url: URL do vídeo
+
+        Returns:
+            String no formato 'extrator:id' ou None se não for possível identificar
+        """
+        for extractor in yt_dlp.extractor.gen_extractor_classes():
+            if extractor.ie_key() == 'Generic' or not extractor.suitable(url):
+                continue
+            video_id = extractor.get_temp_id(url)
+            if video_id:
+                return f'{extractor.ie_key()}:{video_id}'
+        return None
+
+    def _audio_cache_key(self, video_id: str, *section: object) -> str:
+        """Gera a chave do cache de áudio a partir do ID do vídeo, do trecho e das configurações de áudio."""
+        if AUDIO_PASSTHROUGH or AUDIO_SPEECH_PROFILE:
+            return make_cache_key('audio', video_id, *section, 'passthrough', AUDIO_PASSTHROUGH_FORMAT)
+        return make_cache_key('audio', video_id, *section, YT_DLP_FORMAT, AUDIO_FORMAT, AUDIO_QUALITY)
+
+    def _section_audio_cache_key(
+        self, url: str, start: Optional[str], end: Optional[str], chapter: Optional[str]
+    ) -> Optional[str]:
+        """Chave do cache de áudio do vídeo e trecho selecionado (None se o cache estiver desativado)."""
+        video_id = self._resolve_video_id(url) if self.audio_cache else None
+        if not video_id:
+            return None
+        has_section = start is not None or end is not None or bool(chapter)
+        section = ('section', start, end, chapter) if has_section else ()
+        return self._audio_cache_key(video_id, *section)
+
+    def find_cached_audio(
+        self, url: str, start: Optional[str] = None, end: Optional[str] = None, chapter: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Procura o áudio do vídeo (ou do trecho) no cache, sem acessar a rede.
+
+        Args:
+            url: URL do vídeo do YouTube
+            start: Início do trecho (segundos ou 'hh:mm:ss'), opcional
+            end: Fim do trecho (segundos ou 'hh:mm:ss'), opcional
+            chapter: Número ou título de um capítulo do YouTube, opcional
+
+        Returns:
+            Dict com informações do vídeo e caminho do áudio, ou None em caso de cache miss
+        """
+        cache_key = self._section_audio_cache_key(url, start, end, chapter)
+        return self._load_cached_audio(url, cache_key) if cache_key else None
+
+    def _load_cached_audio(self, url: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Recupera o áudio e as informações do vídeo do cache, se existirem.
+
+        Args:
+            url: URL do vídeo
+            cache_key: Chave do cache de áudio
+
+        Returns:
+            Dict com informações do vídeo ou None em caso de cache miss
+        """
+        entry = self.audio_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        info_file = entry / 'video_info.json'
+        audio_files = [f for f in entry.iterdir() if f.name != 'video_info.json']
+        if not info_file.exists() or not audio_files:
+            self.audio_cache.remove(cache_key)
+            return None
+
+        with open(info_file, 'r', encoding='utf-8') as f:
+            video_info = json.load(f)
+
+        video_info['url'] = url
+        video_info['audio_path'] = str(audio_files[0])
+        video_info['audio_cache_hit'] = True
+        return video_info
+
+    def _store_audio_in_cache(self, video_info: Dict[str, Any], cache_key: str) -> Dict[str, Any]:
         """
-        Baixa o áudio de um vídeo do YouTube.
+        Move o áudio baixado para o cache persistente junto com as informações do vídeo.
+
+        Args:
+            video_info: Informações do vídeo com o caminho do áudio baixado
+            cache_key: Chave do cache de áudio
+
+        Returns:
+            Dict com informações do vídeo apontando para o áudio no cache
+        """
+        info_file = Path(self.temp_dir) / 'video_info.json'
+        cached_info = {k: v for k, v in video_info.items() if k not in ('audio_path', 'audio_cache_hit')}
+        with open(info_file, 'w', encoding='utf-8') as f:
+            json.dump(cached_info, f, ensure_ascii=False, indent=2)
+
+        audio_path = Path(video_info['audio_path'])
+        entry = self.audio_cache.put(cache_key, [audio_path, info_file])
+        video_info['audio_path'] = str(entry / audio_path.name)
+        logger.info(f'Áudio armazenado no cache: {entry}')
+        return video_info
+
+    def _build_video_info(self, info: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Extrai os campos usados pelo pipeline do dict de informações do yt-dlp."""
+        return {
+            'title': info.get('title', 'Vídeo sem título'),
+            'duration': info.get('duration', 0),
+            'uploader': info.get('uploader', 'Desconhecido'),
+            'upload_date': info.get('upload_date', ''),
+            'description': info.get('description', ''),
+            'chapters': extract_chapters(info),
+            # Idiomas de legenda disponíveis, para decidir sem rede se vale tentar as legendas
+            'caption_languages': {
+                'manual': sorted(info.get('subtitles') or {}),
+                'automatic': sorted(info.get('automatic_captions') or {}),
+                'video': info.get('language'),
+            },
+            'url': url,
+        }
+
+    def _cache_metadata(self, url: str, info: Dict[str, Any]) -> None:
+        """Guarda no cache de metadados as informações do vídeo extraídas pelo yt-dlp."""
+        video_id = self._resolve_video_id(url) if self.metadata_cache else None
+        if video_id:
+            self.metadata_cache.put(video_id, self._build_video_info(info, url))
+
+    def _extract_info(self, url: str) -> Dict[str, Any]:
+        """
+        Resolve a página do vídeo com o yt-dlp uma única vez por execução.
+
+        O resultado é compartilhado entre metadados, legendas e download: cada etapa o
+        processa com as próprias opções (process_ie_result), sem resolver a página de novo.
 
         Args:
             url: URL do vídeo do YouTube
 
+        Returns:
+            Dict de informações do yt-dlp
+        """
+        if url not in self._extracted_info:
+            ydl_opts = {'quiet': YT_DLP_QUIET, 'no_warnings': YT_DLP_NO_WARNINGS}
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+            self._extracted_info[url] = info
+            self._cache_metadata(url, info)
+        return self._extracted_info[url]
+
+    def get_video_info(self, url: str) -> Dict[str, Any]:
+        """
+        Obtém as informações do vídeo (título, duração, canal, capítulos) sem baixar o áudio.
+
+        Usa o cache de metadados quando disponível, evitando a ida à rede para vídeos já vistos.
+        Caso contrário, a página é resolvida uma vez e o resultado fica disponível para as
+        legendas e o download da mesma execução.
+
+        Args:
+            url: URL do vídeo do YouTube
+
+        Returns:
+            Dict com informações do vídeo
+        """
+        video_id = self._resolve_video_id(url) if self.metadata_cache else None
+
+        if video_id and url not in self._extracted_info:
+            cached_info = self.metadata_cache.get(video_id)
+            if cached_info:
+                logger.info(f'Metadados encontrados no cache ({video_id})')
+                return {**cached_info, 'url': url}
+
+        return self._build_video_info(self._extract_info(url), url)
+
+    def _apply_time_range(self, video_info: Dict[str, Any], time_range: Optional[TimeRange]) -> Dict[str, Any]:
+        """Registra nas informações do vídeo o trecho selecionado (se houver)."""
+        if time_range:
+            start, end, chapter = time_range
+            if end == float('inf'):
+                end = video_info.get('duration') or start
+            video_info['time_range'] = {'start': start, 'end': end, 'chapter': chapter}
+        return video_info
+
+    def _may_have_captions(self, video_info: Dict[str, Any]) -> bool:
+        """Indica pelos metadados se há legenda em algum idioma aceito (True se não houver registro)."""
+        languages = video_info.get('caption_languages')
+        if languages is None:
+            return True
+        if any(language in (languages.get('manual') or []) for language in CAPTIONS_LANGUAGES):
+            return True
+        if not CAPTIONS_ALLOW_AUTOMATIC:
+            return False
+        # Traduções automáticas não contam: só a faixa no idioma original do vídeo
+        automatic = set(languages.get('automatic') or [])
+        return any(
+            language in automatic and is_original_caption(language, languages.get('video'))
+            for language in caption_track_languages(CAPTIONS_LANGUAGES)
+        )
+
+    def fetch_captions(
+        self, url: str, start: Optional[str] = None, end: Optional[str] = None, chapter: Optional[str] = None
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Tenta obter a transcrição a partir das legendas do YouTube, sem baixar o áudio.
+
+        Legendas manuais têm preferência sobre as automáticas (CAPTIONS_ALLOW_AUTOMATIC),
+        seguindo a ordem de idiomas de CAPTIONS_LANGUAGES. A faixa só é aceita se tiver ao
+        menos CAPTIONS_MIN_WORDS_PER_MINUTE palavras por minuto de vídeo (ou do trecho
+        selecionado, quando houver).
+
+        Args:
+            url: URL do vídeo do YouTube
+            start: Início do trecho (segundos ou 'hh:mm:ss'), opcional
+            end: Fim do trecho (segundos ou 'hh:mm:ss'), opcional
+            chapter: Número ou título de um capítulo do YouTube, opcional
+
+        Returns:
+            Tupla (informações do vídeo, transcrição) ou None se não houver legenda adequada
+        """
+        ydl_opts = {
+            'skip_download': True,
+            'writesubtitles': True,
+            'writeautomaticsub': CAPTIONS_ALLOW_AUTOMATIC,
+            'subtitleslangs': caption_track_languages(CAPTIONS_LANGUAGES),
+            'subtitlesformat': CAPTIONS_FORMAT,
+            'outtmpl': os.path.join(self.temp_dir, 'legenda.%(ext)s'),
+            'quiet': YT_DLP_QUIET,
+            'no_warnings': YT_DLP_NO_WARNINGS,
+        }
+
+        try:
+            # Reaproveita a resolução da página; só os arquivos de legenda são baixados
+            shared_info = copy.deepcopy(self._extract_info(url))
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.process_ie_result(shared_info, download=True)
+        except Exception as e:
+            logger.warning(f'Não foi possível obter legendas ({str(e)}), usando o áudio')
+            return None
+
+        video_info = self._build_video_info(info, url)
+
+        track = select_caption_track(
+            info.get('requested_subtitles'),
+            list(info.get('subtitles') or {}),
+            CAPTIONS_LANGUAGES,
+            info.get('language'),
+        )
+        if not track:
+            logger.info('Nenhuma legenda disponível nos idiomas configurados')
+            return None
+
+        language, subtitle = track
+        kind = 'manual' if language in (info.get('subtitles') or {}) else 'automática'
+        try:
+            transcription = parse_captions(subtitle['filepath'])
+        except Exception as e:
+            logger.warning(f'Erro ao ler a legenda {language} ({str(e)}), usando o áudio')
+            return None
+
+        time_range = resolve_time_range(start, end, chapter, info.get('chapters'), video_info['duration'])
+        self._apply_time_range(video_info, time_range)
+        if time_range:
+            section = video_info['time_range']
+            transcription = slice_transcription(transcription, section['start'], section['end'])
+            duration = transcription['duration']
+        else:
+            duration = video_info['duration']
+            transcription['duration'] = duration or transcription['duration']
+
+        if not is_caption_usable(transcription, duration, CAPTIONS_MIN_WORDS_PER_MINUTE):
+            logger.info(f'Legenda {kind} ({language}) insuficiente, usando o áudio')
+            return None
+
+        video_info['captions'] = {'language': language, 'kind': kind, 'format': subtitle.get('ext')}
+        logger.info(f'Legenda {kind} ({language}) usada: {len(transcription["words"])} palavras')
+        return video_info, transcription
+
+    def download_audio(
+        self, url: str, start: Optional[str] = None, end: Optional[str] = None, chapter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Baixa o áudio de um vídeo do YouTube (inteiro ou apenas um trecho).
+
+        Quando o cache de áudio está ativo, uma nova execução para o mesmo vídeo (e mesmas
+        configurações de formato/codec/qualidade) reutiliza o áudio já baixado, sem acesso
+        à rede nem processamento do FFmpeg. Com YT_DLP_SINGLE_PASS, os metadados e o download
+        vêm de uma única resolução da página pelo yt-dlp. Com AUDIO_PASSTHROUGH ou
+        AUDIO_SPEECH_PROFILE, o áudio é mantido no codec original (apenas remux, se o contêiner
+        não for aceito pelo Whisper): com o perfil de fala, a única recodificação é a conversão
+        para Opus antes da transcrição, sem passar por um MP3 intermediário.
+        Com início/fim ou capítulo, o yt-dlp baixa apenas o trecho (download_ranges), e o
+        trecho resolvido fica em video_info['time_range'].
+
+        Args:
+            url: URL do vídeo do YouTube
+            start: Início do trecho (segundos ou 'hh:mm:ss'), opcional
+            end: Fim do trecho (segundos ou 'hh:mm:ss'), opcional
+            chapter: Número ou título de um capítulo do YouTube, opcional
+
         Returns:
             Dict com informações do vídeo e caminho do arquivo de áudio
         """
+        has_section = start is not None or end is not None or bool(chapter)
+        cache_key = self._section_audio_cache_key(url, start, end, chapter)
+
+        if cache_key:
+            cached_info = self._load_cached_audio(url, cache_key)
+            if cached_info:
+                logger.info(f'Áudio encontrado no cache: {cached_info["title"]}')
+                return cached_info
+
         logger.info(f'Baixando áudio de: {url}')
 
         # Configuração do yt-dlp usando configurações centralizadas
@@ -91,42 +555,134 @@ class YouTubeEbookGenerator:
             'no_warnings': YT_DLP_NO_WARNINGS,
         }
 
+        keep_source_codec = AUDIO_PASSTHROUGH or AUDIO_SPEECH_PROFILE
+        if keep_source_codec:
+            # Seleciona um stream somente de áudio compatível com o Whisper e evita a recodificação
+            ydl_opts['format'] = AUDIO_PASSTHROUGH_FORMAT
+            ydl_opts['postprocessors'] = []
+
+        resolved_range: List[TimeRange] = []
+        if has_section:
+
+            def download_ranges(info_dict, ydl):
+                # Resolve o trecho com os capítulos e a duração da mesma extração de informações
+                time_range = resolve_time_range(
+                    start, end, chapter, info_dict.get('chapters'), info_dict.get('duration')
+                )
+                resolved_range[:] = [time_range]
+                yield {'start_time': time_range[0], 'end_time': time_range[1]}
+
+            ydl_opts['download_ranges'] = download_ranges
+
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extrai informações do vídeo
-                info = ydl.extract_info(url, download=False)
-                video_info = {
-                    'title': info.get('title', 'Vídeo sem título'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Desconhecido'),
-                    'upload_date': info.get('upload_date', ''),
-                    'description': info.get('description', ''),
-                    'url': url,
-                }
+                if url in self._extracted_info:
+                    # Página já resolvida nesta execução (metadados/legendas): apenas baixa o áudio
+                    info = ydl.process_ie_result(copy.deepcopy(self._extracted_info[url]), download=True)
+                elif YT_DLP_SINGLE_PASS:
+                    # Extrai as informações e baixa o áudio na mesma resolução da página
+                    info = ydl.extract_info(url, download=True)
+                else:
+                    # Extrai informações do vídeo
+                    info = ydl.extract_info(url, download=False)
 
-                # Baixa o áudio
-                ydl.download([url])
+                    # Baixa o áudio
+                    ydl.download([url])
+
+                video_info = self._build_video_info(info, url)
 
                 # Encontra o arquivo de áudio baixado
-                audio_files = list(Path(self.temp_dir).glob('*.mp3'))
-                if not audio_files:
+                audio_path = find_downloaded_audio(info, self.temp_dir)
+                if not audio_path:
                     raise FileNotFoundError('Arquivo de áudio não encontrado após download')
 
-                video_info['audio_path'] = str(audio_files[0])
+                if keep_source_codec:
+                    audio_path = remux_audio(audio_path)
+
+                video_info['audio_path'] = audio_path
+                video_info['audio_cache_hit'] = False
+                self._apply_time_range(video_info, resolved_range[0] if resolved_range else None)
                 logger.info(f'Áudio baixado com sucesso: {video_info["title"]}')
 
-                return video_info
+            self._cache_metadata(url, info)
+
+            if cache_key:
+                video_info = self._store_audio_in_cache(video_info, cache_key)
+
+            return video_info
 
         except Exception as e:
             logger.error(f'Erro ao baixar áudio de {url}: {str(e)}')
             raise
 
-    def segment_audio(self, audio_path: str) -> List[str]:
+    def plan_audio_segments(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Planeja a segmentação do áudio antes de qualquer corte.
+
+        Com AUDIO_SEGMENT_BITRATE_AWARE, a duração dos segmentos vem do bitrate real informado
+        pelo ffprobe, resultando no menor número de envios que respeitam MAX_AUDIO_FILE_SIZE_MB
+        com a margem de AUDIO_SEGMENT_SIZE_SAFETY_MARGIN. Caso contrário, usa segmentos de
+        AUDIO_SEGMENT_DURATION_MINUTES.
+
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+
+        Returns:
+            Dict com 'count', 'plan' (lista de (início, duração)), 'estimated_bytes' por segmento,
+            'duration' e 'bit_rate'
+        """
+        import subprocess
+
+        try:
+            probe = probe_audio(audio_path)
+            logger.info(f'Duração do áudio: {probe["duration"]:.2f} segundos ({probe["bit_rate"] / 1000:.0f} kbps)')
+        except subprocess.CalledProcessError as e:
+            logger.error(f'Erro ao obter duração do áudio: {e}')
+            raise
+
+        duration_seconds = probe['duration']
+        bit_rate = probe['bit_rate']
+
+        if AUDIO_SEGMENT_BITRATE_AWARE and bit_rate:
+            size_plan = plan_segments_by_size(
+                duration_seconds,
+                bit_rate,
+                int(MAX_AUDIO_FILE_SIZE_MB * 1024 * 1024),
+                AUDIO_SEGMENT_SIZE_SAFETY_MARGIN,
+                AUDIO_SEGMENT_OVERLAP_SECONDS,
+            )
+            plan = size_plan['plan']
+            max_segment_seconds = size_plan['max_segment_seconds']
+        else:
+            max_segment_seconds = AUDIO_SEGMENT_DURATION_MINUTES * 60
+            plan = plan_fixed_segments(duration_seconds, max_segment_seconds, AUDIO_SEGMENT_OVERLAP_SECONDS)
+
+        if len(plan) > 1 and AUDIO_SILENCE_SPLIT:
+            plan = self._plan_segments_on_silence(audio_path, duration_seconds, max_segment_seconds, plan)
+
+        estimated_bytes = [int(min(length, duration_seconds - start) * bit_rate / 8) for start, length in plan]
+
+        return {
+            'count': len(plan),
+            'plan': plan,
+            'estimated_bytes': estimated_bytes,
+            'duration': duration_seconds,
+            'bit_rate': bit_rate,
+        }
+
+    def segment_audio(self, audio_path: str, segment_plan: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Segmenta um arquivo de áudio em partes menores usando FFmpeg.
 
+        Os cortes são feitos sem recodificação e com trabalho linear no tamanho do arquivo
+        (muxer de segmentos ou busca rápida na entrada). Usado com TRANSCRIPTION_PIPELINE
+        desligado; o pipeline corta cada segmento à parte. Com AUDIO_SILENCE_SPLIT, os cortes
+        são ajustados às pausas da fala e dispensam sobreposição; cortes sem pausa próxima
+        mantêm a sobreposição de AUDIO_SEGMENT_OVERLAP_SECONDS.
+
         Args:
             audio_path: Caminho para o arquivo de áudio original
+            segment_plan: Plano retornado por `plan_audio_segments` (calculado se None)
 
         Returns:
             Lista com caminhos dos segmentos de áudio
@@ -135,113 +691,368 @@ class YouTubeEbookGenerator:
 
         logger.info(f'Segmentando áudio: {audio_path}')
 
-        # Obtém a duração do áudio
-        duration_cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', audio_path]
+        if segment_plan is None:
+            segment_plan = self.plan_audio_segments(audio_path)
+
+        plan = segment_plan['plan']
+        if len(plan) == 1:
+            logger.info('Áudio não precisa ser segmentado')
+            return [audio_path]
+
+        logger.info(f'Segmentando em {len(plan)} partes')
 
         try:
-            duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            duration_seconds = float(duration_result.stdout.strip())
-            logger.info(f'Duração do áudio: {duration_seconds:.2f} segundos')
+            segments = cut_segments(audio_path, plan, self.temp_dir)
         except subprocess.CalledProcessError as e:
-            logger.error(f'Erro ao obter duração do áudio: {e}')
+            logger.error(f'Erro ao criar segmentos: {e}')
             raise
 
-        # Calcula o número de segmentos necessários
-        segment_duration = AUDIO_SEGMENT_DURATION_MINUTES * 60
-        num_segments = int(duration_seconds / segment_duration) + 1
+        for i, segment_path in enumerate(segments, 1):
+            logger.info(f'Segmento {i}/{len(segments)} criado: {segment_path}')
 
-        if num_segments == 1:
-            logger.info('Áudio não precisa ser segmentado')
-            return [audio_path]
+        return segments
 
-        logger.info(f'Segmentando em {num_segments} partes de {AUDIO_SEGMENT_DURATION_MINUTES} minutos cada')
-
-        segments = []
-        base_name = Path(audio_path).stem
-
-        for i in range(num_segments):
-            start_time = i * segment_duration
-            # Adiciona sobreposição exceto no primeiro segmento
-            if i > 0:
-                start_time -= AUDIO_SEGMENT_OVERLAP_SECONDS
-
-            segment_path = os.path.join(self.temp_dir, f'{base_name}_segment_{i + 1:02d}.mp3')
-
-            # Comando FFmpeg para extrair segmento
-            ffmpeg_cmd = [
-                'ffmpeg',
-                '-i',
-                audio_path,
-                '-ss',
-                str(start_time),
-                '-t',
-                str(segment_duration + AUDIO_SEGMENT_OVERLAP_SECONDS),
-                '-acodec',
-                'copy',
-                '-y',
-                segment_path,
-            ]
+    def _plan_segments_on_silence(
+        self,
+        audio_path: str,
+        duration_seconds: float,
+        segment_duration: float,
+        fixed_plan: List[Tuple[float, float]],
+    ) -> List[Tuple[float, float]]:
+        """
+        Ajusta os cortes dos segmentos para as pausas da fala.
 
-            try:
-                subprocess.run(ffmpeg_cmd, capture_output=True, check=True)
-                segments.append(segment_path)
-                logger.info(f'Segmento {i + 1}/{num_segments} criado: {segment_path}')
-            except subprocess.CalledProcessError as e:
-                logger.error(f'Erro ao criar segmento {i + 1}: {e}')
-                raise
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+            duration_seconds: Duração total do áudio
+            segment_duration: Duração máxima de cada segmento em segundos
+            fixed_plan: Plano de duração fixa, usado se a detecção de silêncio falhar
 
-        return segments
+        Returns:
+            Lista de tuplas (início, duração) dos segmentos
+        """
+        import subprocess
 
-    def transcribe_audio_segments(self, segments: List[str]) -> Dict[str, Any]:
+        try:
+            silences = detect_silences(audio_path, AUDIO_SILENCE_NOISE_DB, AUDIO_SILENCE_MIN_DURATION)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f'Detecção de silêncio falhou, usando cortes fixos: {e}')
+            return fixed_plan
+
+        plan = plan_silence_segments(
+            duration_seconds,
+            silences,
+            segment_duration,
+            AUDIO_SEGMENT_OVERLAP_SECONDS,
+            AUDIO_SILENCE_SEARCH_WINDOW_SECONDS,
+            AUDIO_SILENCE_MIN_LAST_SEGMENT_SECONDS,
+        )
+
+        # Compara o volume enviado (segundos de áudio) com o plano de cortes fixos
+        fixed_seconds = sum(min(duration, duration_seconds - start) for start, duration in fixed_plan)
+        silence_seconds = sum(duration for _, duration in plan)
+        logger.info(
+            f'{len(silences)} pausas detectadas; cortes ajustados às pausas economizam '
+            f'{max(0.0, fixed_seconds - silence_seconds):.1f}s de áudio sobreposto'
+        )
+        return plan
+
+    def _estimate_audio_minutes(self, audio_path: str) -> float:
+        """
+        Estima a duração do áudio em minutos para o cálculo de custo do Whisper.
+
+        Usa a duração real do ffprobe, pois a proporção tamanho/duração de
+        AUDIO_SIZE_DURATION_RATIO só vale para o MP3 padrão (não para Opus ou passthrough).
+        """
+        import subprocess
+
+        try:
+            duration = probe_audio(audio_path)['duration']
+            if duration:
+                return duration / 60
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            pass
+
+        file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+        return file_size_mb / AUDIO_SIZE_DURATION_RATIO
+
+    def _transcription_cache_key(self, audio_path: str, *extra: object) -> str:
+        """Gera a chave do cache de transcrição a partir do hash do áudio e do backend (modelo e formato)."""
+        return make_cache_key('transcription', hash_file(audio_path), self.transcription_backend.cache_tag, *extra)
+
+    def _get_cached_transcription(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Busca uma transcrição no cache (None se o cache estiver desativado ou em caso de miss)."""
+        if not cache_key or not self.transcription_cache:
+            return None
+        return self.transcription_cache.get_json(cache_key, 'transcription.json')
+
+    def _transcribe_file(self, audio_path: str) -> Dict[str, Any]:
+        """Envia um arquivo ao backend de transcrição, respeitando o limite de TRANSCRIPTION_MAX_WORKERS envios."""
+        with self._transcription_slots:
+            return self.transcription_backend.transcribe(audio_path)
+
+    def _transcribe_segment(
+        self,
+        index: int,
+        total: int,
+        segment_path: str,
+        checkpoint: Optional[TranscriptionCheckpoint] = None,
+    ) -> Dict[str, Any]:
+        """
+        Transcreve um segmento, repetindo a chamada em caso de falha.
+
+        Args:
+            index: Posição do segmento (a partir de 1)
+            total: Número total de segmentos
+            segment_path: Caminho do segmento de áudio
+            checkpoint: Checkpoint do job, onde o resultado é gravado ao concluir
+
+        Returns:
+            Dict com 'text' e 'duration' do segmento
+        """
+        cache_key = self._transcription_cache_key(segment_path) if self.transcription_cache else None
+        result = self._get_cached_transcription(cache_key)
+        if result:
+            logger.info(f'Segmento {index}/{total} encontrado no cache de transcrições')
+        else:
+            self._add_segment_cost(index, segment_path)
+
+            for attempt in range(MAX_API_RETRIES + 1):
+                try:
+                    result = self._transcribe_file(segment_path)
+                    logger.info(f'Segmento {index}/{total} transcrito com sucesso')
+                    break
+
+                except Exception as e:
+                    logger.warning(f'Segmento {index}: tentativa {attempt + 1} falhou: {e}')
+                    if attempt == MAX_API_RETRIES:
+                        raise
+                    time.sleep(RETRY_DELAY * (attempt + 1))
+
+            if cache_key:
+                self.transcription_cache.put_json(cache_key, 'transcription.json', result)
+
+        if checkpoint:
+            checkpoint.save(index, result)
+        return result
+
+    def transcribe_audio_segments(
+        self,
+        segments: List[str],
+        checkpoint: Optional[TranscriptionCheckpoint] = None,
+        offsets: Optional[List[float]] = None,
+    ) -> Dict[str, Any]:
         """
         Transcreve múltiplos segmentos de áudio e combina os resultados.
 
+        Os segmentos são enviados em paralelo (até TRANSCRIPTION_MAX_WORKERS simultâneos), cada
+        um com suas próprias novas tentativas, e os textos são combinados na ordem original.
+        Segmentos já presentes no checkpoint do job não são enviados novamente.
+
         Args:
             segments: Lista de caminhos para segmentos de áudio
+            checkpoint: Checkpoint do job (opcional) para retomar transcrições interrompidas
+            offsets: Início de cada segmento no áudio original, usado nos timestamps por palavra
 
         Returns:
             Dict com transcrição combinada
         """
-        logger.info(f'Transcrevendo {len(segments)} segmentos de áudio')
-
-        all_transcriptions = []
-        total_duration = 0
+        total = len(segments)
+        workers = max(1, min(TRANSCRIPTION_MAX_WORKERS, total))
+        logger.info(f'Transcrevendo {total} segmentos de áudio ({workers} em paralelo)')
 
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        pending_segments = []
         for i, segment_path in enumerate(segments, 1):
-            logger.info(f'Transcrevendo segmento {i}/{len(segments)}')
+            results[i - 1] = checkpoint.load(i) if checkpoint else None
+            if results[i - 1] is None:
+                pending_segments.append((i, segment_path))
+            else:
+                logger.info(f'Segmento {i}/{total} retomado do checkpoint')
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._transcribe_segment, i, total, segment_path, checkpoint): i
+                for i, segment_path in pending_segments
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i - 1] = future.result()
+                except Exception as e:
+                    logger.error(f'Erro na transcrição do segmento {i}: {str(e)}')
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+        return self._combine_segment_transcriptions(results, offsets)
+
+    def transcribe_audio_pipelined(
+        self,
+        audio_path: str,
+        segment_plan: Dict[str, Any],
+        checkpoint: Optional[TranscriptionCheckpoint] = None,
+    ) -> Dict[str, Any]:
+        """
+        Corta e transcreve os segmentos em pipeline (produtor/consumidor).
 
-            try:
-                with open(segment_path, 'rb') as audio_file:
-                    # Calcula o custo estimado
-                    file_size_mb = os.path.getsize(segment_path) / (1024 * 1024)
-                    estimated_duration_minutes = file_size_mb / AUDIO_SIZE_DURATION_RATIO
-                    estimated_cost = estimated_duration_minutes * OPENAI_WHISPER_COST_PER_MINUTE
-                    self.total_cost_usd += estimated_cost
-
-                    logger.info(f'Segmento {i}: {file_size_mb:.2f}MB - Custo estimado: ${estimated_cost:.4f} USD')
-
-                    # Chama a API da OpenAI
-                    response = openai.audio.transcriptions.create(
-                        model=OPENAI_WHISPER_MODEL,
-                        file=audio_file,
-                        response_format='verbose_json',
-                    )
+        Cada segmento é enviado ao Whisper assim que o FFmpeg termina de gravá-lo, enquanto o
+        próximo ainda está sendo cortado. No máximo PIPELINE_MAX_PENDING_SEGMENTS segmentos
+        ficam em disco ao mesmo tempo, e cada arquivo é removido quando sua transcrição retorna.
+        Segmentos já presentes no checkpoint do job não são cortados nem enviados.
 
-                    all_transcriptions.append(response.text)
-                    total_duration += response.duration if hasattr(response, 'duration') else 0
+        Args:
+            audio_path: Caminho para o arquivo de áudio original
+            segment_plan: Plano retornado por `plan_audio_segments`
+            checkpoint: Checkpoint do job (opcional) para retomar transcrições interrompidas
 
-                    logger.info(f'Segmento {i} transcrito com sucesso')
+        Returns:
+            Dict com transcrição combinada
+        """
+        plan = segment_plan['plan']
+        total = len(plan)
+        workers = max(1, min(TRANSCRIPTION_MAX_WORKERS, total))
+        logger.info(f'Transcrevendo {total} segmentos em pipeline ({workers} envios em paralelo)')
 
-            except Exception as e:
-                logger.error(f'Erro na transcrição do segmento {i}: {str(e)}')
-                raise
+        # Limita o número de segmentos cortados e ainda não transcritos (uso de disco)
+        slots = threading.BoundedSemaphore(max(1, PIPELINE_MAX_PENDING_SEGMENTS))
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+
+        def consume(index: int, segment_path: str) -> Dict[str, Any]:
+            try:
+                return self._transcribe_segment(index, total, segment_path, checkpoint)
+            finally:
+                if os.path.exists(segment_path):
+                    os.remove(segment_path)
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for i, (start, duration) in enumerate(plan, 1):
+                results[i - 1] = checkpoint.load(i) if checkpoint else None
+                if results[i - 1] is not None:
+                    logger.info(f'Segmento {i}/{total} retomado do checkpoint')
+                    continue
+
+                slots.acquire()
+                if any(f.done() and f.exception() for f in futures):
+                    slots.release()
+                    break
+
+                segment_path = cut_segment(audio_path, start, duration, self.temp_dir, i)
+                logger.info(f'Segmento {i}/{total} criado: {segment_path}')
+                futures[executor.submit(consume, i, segment_path)] = i
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i - 1] = future.result()
+                except Exception as e:
+                    logger.error(f'Erro na transcrição do segmento {i}: {str(e)}')
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+        return self._combine_segment_transcriptions(results, [start for start, _ in plan])
+
+    def _add_segment_cost(self, index: int, segment_path: str) -> None:
+        """Soma ao total o custo estimado de transcrição de um segmento."""
+        file_size_mb = os.path.getsize(segment_path) / (1024 * 1024)
+        estimated_cost = self._estimate_audio_minutes(segment_path) * self.transcription_backend.cost_per_minute
+        self._add_cost(estimated_cost)
+        logger.info(f'Segmento {index}: {file_size_mb:.2f}MB - Custo estimado: ${estimated_cost:.4f} USD')
+
+    def _combine_segment_transcriptions(
+        self, results: List[Dict[str, Any]], offsets: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Combina as transcrições dos segmentos na ordem original.
 
-        # Combina todas as transcrições
-        combined_text = ' '.join(all_transcriptions)
+        Com timestamps por palavra, as palavras duplicadas nas regiões de sobreposição são
+        removidas (alinhamento por timestamps e offsets dos segmentos).
+
+        Args:
+            results: Transcrições de cada segmento, na ordem dos segmentos
+            offsets: Início de cada segmento no áudio original (se None, soma as durações)
+
+        Returns:
+            Dict com transcrição combinada
+        """
+        if offsets is None:
+            offsets = []
+            position = 0.0
+            for result in results:
+                offsets.append(position)
+                position += result['duration']
+
+        combined_text = ' '.join(result['text'] for result in results)
+        total_duration = sum(result['duration'] for result in results)
+
+        combined = {'text': combined_text, 'duration': total_duration, 'segments_count': len(results)}
+
+        if TRANSCRIPTION_WORD_TIMESTAMPS and all(result.get('words') for result in results):
+            # Remove as palavras repetidas na sobreposição usando os timestamps de cada segmento
+            merged = merge_segment_transcripts(results, offsets)
+            saved_tokens = count_tokens(combined_text, OPENAI_GPT_MODEL) - count_tokens(
+                merged['text'], OPENAI_GPT_MODEL
+            )
+            combined.update(merged)
+            combined['overlap_tokens_saved'] = saved_tokens
+            logger.info(
+                f'Sobreposição removida: {merged["overlap_words_removed"]} palavras duplicadas '
+                f'(~{saved_tokens} tokens a menos no processamento GPT)'
+            )
+        elif TRANSCRIPTION_WORD_TIMESTAMPS:
+            # Converte os timestamps de cada segmento para a linha do tempo do áudio original
+            combined['words'] = [
+                [word, start + offset, end + offset]
+                for result, offset in zip(results, offsets)
+                for word, start, end in result.get('words', [])
+            ]
 
         logger.info('Todos os segmentos transcritos e combinados com sucesso')
 
-        return {'text': combined_text, 'duration': total_duration, 'segments_count': len(segments)}
+        return combined
+
+    def preprocess_audio(self, audio_path: str) -> str:
+        """
+        Converte o áudio para o perfil de fala (mono, AUDIO_SPEECH_SAMPLE_RATE, Opus em AUDIO_SPEECH_BITRATE).
+
+        Em uma única passagem do FFmpeg, reduz o arquivo a uma fração do tamanho original, o que
+        permite enviar vídeos de várias horas em um único upload. Se a conversão falhar ou não
+        reduzir o arquivo, o áudio original é mantido.
+
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+
+        Returns:
+            Caminho do áudio a ser transcrito
+        """
+        import subprocess
+
+        original_bytes = os.path.getsize(audio_path)
+        logger.info(f'Convertendo áudio para o perfil de fala ({AUDIO_SPEECH_SAMPLE_RATE} Hz, {AUDIO_SPEECH_BITRATE})')
+
+        try:
+            speech_path = convert_to_speech_profile(
+                audio_path, self.temp_dir, AUDIO_SPEECH_SAMPLE_RATE, AUDIO_SPEECH_BITRATE
+            )
+        except subprocess.CalledProcessError as e:
+            logger.warning(f'Conversão para o perfil de fala falhou, usando áudio original: {e}')
+            return audio_path
+
+        speech_bytes = os.path.getsize(speech_path)
+        if speech_bytes >= original_bytes:
+            logger.info('Perfil de fala não reduziu o arquivo, usando áudio original')
+            os.remove(speech_path)
+            return audio_path
+
+        reduction = 1 - speech_bytes / original_bytes
+        logger.info(
+            f'Perfil de fala: {original_bytes / (1024 * 1024):.2f}MB -> {speech_bytes / (1024 * 1024):.2f}MB '
+            f'({reduction:.0%} menor, {(original_bytes - speech_bytes) / (1024 * 1024):.2f}MB a menos no envio)'
+        )
+        return speech_path
 
     def check_audio_size_and_transcribe(self, audio_path: str) -> Dict[str, Any]:
         """
@@ -253,22 +1064,79 @@ class YouTubeEbookGenerator:
         Returns:
             Dict com a transcrição
         """
+        # Uma nova execução do mesmo áudio reaproveita a transcrição completa, sem pré-processar nem segmentar
+        job_key = None
+        if self.transcription_cache or TRANSCRIPTION_CHECKPOINTS:
+            job_key = self._transcription_cache_key(
+                audio_path, 'job', AUDIO_SPEECH_PROFILE, AUDIO_SPEECH_SAMPLE_RATE, AUDIO_SPEECH_BITRATE
+            )
+            cached = self._get_cached_transcription(job_key)
+            if cached:
+                logger.info('Transcrição completa encontrada no cache (etapa de transcrição ignorada)')
+                return cached
+
+        # Checkpoints por segmento sobrevivem a falhas e permitem retomar apenas o que falta
+        checkpoint = (
+            TranscriptionCheckpoint(TRANSCRIPTION_CHECKPOINT_DIR, job_key) if TRANSCRIPTION_CHECKPOINTS else None
+        )
+
+        transcription = self._transcribe_with_segmentation(audio_path, checkpoint)
+
+        if self.transcription_cache:
+            self.transcription_cache.put_json(job_key, 'transcription.json', transcription)
+        if checkpoint:
+            checkpoint.clear()
+        return transcription
+
+    def _transcribe_with_segmentation(
+        self, audio_path: str, checkpoint: Optional[TranscriptionCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """
+        Pré-processa o áudio e transcreve diretamente ou em segmentos, conforme o tamanho.
+
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+            checkpoint: Checkpoint do job usado na transcrição segmentada
+
+        Returns:
+            Dict com a transcrição
+        """
+        if AUDIO_SPEECH_PROFILE:
+            audio_path = self.preprocess_audio(audio_path)
+
         file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
         logger.info(f'Tamanho do arquivo de áudio: {file_size_mb:.2f}MB')
 
-        if file_size_mb > MAX_AUDIO_FILE_SIZE_MB:
-            logger.warning(f'Arquivo muito grande ({file_size_mb:.2f}MB > {MAX_AUDIO_FILE_SIZE_MB}MB)')
+        # Backends locais não têm limite de tamanho e dispensam a segmentação
+        max_file_size_mb = self.transcription_backend.max_file_size_mb
+        if max_file_size_mb is not None and file_size_mb > max_file_size_mb:
+            logger.warning(f'Arquivo muito grande ({file_size_mb:.2f}MB > {max_file_size_mb}MB)')
+
+            # Exibe o plano de segmentação antes de cortar o áudio
+            segment_plan = self.plan_audio_segments(audio_path)
+            estimates = ', '.join(f'{size / (1024 * 1024):.1f}MB' for size in segment_plan['estimated_bytes'])
+            logger.info(f'Plano de segmentação: {segment_plan["count"]} segmentos ({estimates})')
+
+            if checkpoint:
+                resumed = checkpoint.bind_plan(segment_plan['plan'])
+                if resumed:
+                    logger.info(f'Retomando transcrição: {resumed}/{segment_plan["count"]} segmentos já concluídos')
+
+            if TRANSCRIPTION_PIPELINE and segment_plan['count'] > 1:
+                return self.transcribe_audio_pipelined(audio_path, segment_plan, checkpoint)
+
             logger.info('Segmentando áudio antes da transcrição...')
 
-            segments = self.segment_audio(audio_path)
-            return self.transcribe_audio_segments(segments)
+            segments = self.segment_audio(audio_path, segment_plan)
+            offsets = [start for start, _ in segment_plan['plan']] if len(segments) > 1 else None
+            return self.transcribe_audio_segments(segments, checkpoint, offsets)
         else:
             logger.info('Arquivo dentro do limite, transcrevendo diretamente')
             return self.transcribe_audio(audio_path)
 
     def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
         """
-        Transcreve o áudio usando a API da OpenAI.
+        Transcreve o áudio usando o backend configurado (API da OpenAI por padrão).
 
         Args:
             audio_path: Caminho para o arquivo de áudio
@@ -278,28 +1146,26 @@ class YouTubeEbookGenerator:
         """
         logger.info(f'Transcrevendo áudio: {audio_path}')
 
+        cache_key = self._transcription_cache_key(audio_path) if self.transcription_cache else None
+        cached = self._get_cached_transcription(cache_key)
+        if cached:
+            logger.info('Transcrição encontrada no cache (chamada à API ignorada)')
+            return cached
+
         try:
-            with open(audio_path, 'rb') as audio_file:
-                # Calcula o custo estimado usando configurações centralizadas
-                file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-                estimated_duration_minutes = file_size_mb / AUDIO_SIZE_DURATION_RATIO
-                estimated_cost = estimated_duration_minutes * OPENAI_WHISPER_COST_PER_MINUTE
-                self.total_cost_usd += estimated_cost
-
-                logger.info(f'Enviando para transcrição (custo estimado: ${estimated_cost:.4f} USD)')
-
-                # Chama a API da OpenAI usando configurações centralizadas
-                response = openai.audio.transcriptions.create(
-                    model=OPENAI_WHISPER_MODEL,
-                    file=audio_file,
-                    response_format='verbose_json',
-                )
+            # Calcula o custo estimado usando configurações centralizadas
+            estimated_duration_minutes = self._estimate_audio_minutes(audio_path)
+            estimated_cost = estimated_duration_minutes * self.transcription_backend.cost_per_minute
+            self._add_cost(estimated_cost)
 
-                logger.info('Transcrição concluída com sucesso')
-                return {
-                    'text': response.text,
-                    'duration': response.duration if hasattr(response, 'duration') else 0,
-                }
+            logger.info(f'Enviando para transcrição (custo estimado: ${estimated_cost:.4f} USD)')
+
+            result = self._transcribe_file(audio_path)
+            logger.info('Transcrição concluída com sucesso')
+
+            if cache_key:
+                self.transcription_cache.put_json(cache_key, 'transcription.json', result)
+            return result
 
         except Exception as e:
             logger.error(f'Erro na transcrição: {str(e)}')
@@ -309,6 +1175,9 @@ class YouTubeEbookGenerator:
         """
         Salva a transcrição em arquivo JSON para processamento posterior.
 
+        Os timestamps por palavra são gravados à parte, no formato colunar mapeável de
+        `WordTimestampStore` (arquivo `.words`), e o JSON guarda apenas a referência.
+
         Args:
             transcription: Dados da transcrição
             video_info: Informações do vídeo
@@ -321,6 +1190,18 @@ class YouTubeEbookGenerator:
         # Converte a transcrição para formato serializável
         serializable_transcription = {'text': transcription['text'], 'duration': transcription['duration']}
 
+        # Nome do arquivo baseado no título do vídeo
+        safe_title = ''.join(c for c in video_info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        filename = f'transcricao_{safe_title[:30]}.json'
+        filepath = self.output_dir / filename
+
+        # Salva os timestamps por palavra no armazenamento colunar
+        if transcription.get('words'):
+            words_file = filepath.with_suffix('.words')
+            WordTimestampStore.from_words(transcription['words']).save(str(words_file))
+            serializable_transcription['words_file'] = words_file.name
+            serializable_transcription['words_count'] = len(transcription['words'])
+
         # Prepara dados para salvar
         transcription_data = {
             'video_info': video_info,
@@ -328,11 +1209,6 @@ class YouTubeEbookGenerator:
             'generated_at': datetime.now().isoformat(),
         }
 
-        # Nome do arquivo baseado no título do vídeo
-        safe_title = ''.join(c for c in video_info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        filename = f'transcricao_{safe_title[:30]}.json'
-        filepath = self.output_dir / filename
-
         # Salva o arquivo
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(transcription_data, f, ensure_ascii=False, indent=2)
@@ -340,6 +1216,413 @@ class YouTubeEbookGenerator:
         logger.info(f'Transcrição salva em: {filepath}')
         return str(filepath)
 
+    def load_word_timestamps(self, transcription_file: str) -> Optional[WordTimestampStore]:
+        """
+        Carrega (via mmap) os timestamps por palavra de uma transcrição salva.
+
+        Args:
+            transcription_file: Caminho do arquivo de transcrição
+
+        Returns:
+            WordTimestampStore ou None se a transcrição não tiver timestamps por palavra
+        """
+        with open(transcription_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        words_file = data['transcription'].get('words_file')
+        if not words_file:
+            return None
+
+        return WordTimestampStore.load(str(Path(transcription_file).parent / words_file))
+
+    def _add_cost(self, estimated_cost: float) -> None:
+        """Soma um custo estimado ao total (seguro entre threads)."""
+        with self._cost_lock:
+            self.total_cost_usd += estimated_cost
+
+    def _chat_completion(
+        self, system_prompt: str, user_prompt: str, schema: Optional[Tuple[str, Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Envia um prompt ao GPT com retry e contabiliza o custo real da chamada.
+
+        Args:
+            system_prompt: Prompt de sistema
+            user_prompt: Prompt do usuário
+            schema: Tupla (nome, schema JSON) da resposta para o modo de saída estruturada
+
+        Returns:
+            Conteúdo textual da resposta
+        """
+        # Tenta processar com retry em caso de falha usando configurações centralizadas
+        for attempt in range(MAX_API_RETRIES + 1):
+            try:
+                logger.info(f'Tentativa {attempt + 1}/{MAX_API_RETRIES + 1} de processamento GPT')
+                return self._request_completion(system_prompt, user_prompt, schema=schema)
+
+            except Exception as api_error:
+                logger.warning(f'Tentativa {attempt + 1} falhou: {api_error}')
+                if attempt == MAX_API_RETRIES:
+                    raise api_error
+                logger.info(f'Tentando novamente em {RETRY_DELAY} segundos...')
+                time.sleep(RETRY_DELAY)
+
+    def _prompt_tokens(self, system_prompt: str, user_prompt: str) -> int:
+        """Conta localmente os tokens de entrada de uma chamada (mensagens e formatação do chat)."""
+        return count_message_tokens(
+            [{'role': 'system', 'content': system_prompt}, {'role': 'user', 'content': user_prompt}],
+            OPENAI_GPT_MODEL,
+        )
+
+    def _record_usage(self, prompt_tokens: int, completion_tokens: int, source: str) -> None:
+        """
+        Soma ao total os tokens e o custo de uma chamada ao GPT e registra o uso no log.
+
+        Args:
+            prompt_tokens: Tokens de entrada
+            completion_tokens: Tokens de saída
+            source: Origem dos números ('API' para response.usage, 'local' para contagem própria)
+        """
+        cost = (prompt_tokens / 1000) * OPENAI_GPT_COST_PER_1K_TOKENS + (
+            completion_tokens / 1000
+        ) * OPENAI_GPT_OUTPUT_COST_PER_1K_TOKENS
+        with self._cost_lock:
+            self.total_prompt_tokens += prompt_tokens
+            self.total_completion_tokens += completion_tokens
+        self._add_cost(cost)
+
+        logger.info(
+            f'Uso da chamada GPT ({source}): {prompt_tokens} tokens de entrada + '
+            f'{completion_tokens} de saída (${cost:.4f} USD)'
+        )
+
+    def _request_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_text: Optional[Callable[[str], None]] = None,
+        schema: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ) -> str:
+        """
+        Faz uma única chamada ao GPT, com streaming quando `on_text` é informado.
+
+        Com saída estruturada habilitada, o schema da resposta é enviado na requisição e a API
+        retorna sempre JSON válido nesse formato. Se o modelo não aceitar o schema, o modo é
+        desligado e a chamada é repetida sem ele (o parse volta a usar as estratégias de correção).
+
+        Respostas ficam no cache de completions, chaveadas pelos prompts e parâmetros da chamada:
+        regerar o PDF (ex.: após mudar o template) não paga a geração de novo. Um acerto no
+        cache é entregue de uma vez a `on_text`, como se fosse um único pedaço do streaming.
+        Respostas que não formam JSON não são guardadas.
+
+        Args:
+            system_prompt: Prompt de sistema
+            user_prompt: Prompt do usuário
+            on_text: Função chamada com cada pedaço de texto recebido (ativa o streaming)
+            schema: Tupla (nome, schema JSON) da resposta
+
+        Returns:
+            Conteúdo textual da resposta
+        """
+        options = self._completion_options(schema)
+        cache_key = self._completion_cache_key(system_prompt, user_prompt, options)
+        if cache_key and not self.bypass_completion_cache:
+            cached = self.completion_cache.get_json(cache_key, 'completion.json')
+            if cached is not None:
+                logger.info('Resposta do GPT reutilizada do cache (sem custo)')
+                self._remember_completion_key(system_prompt, user_prompt, cache_key)
+                if on_text is not None:
+                    on_text(cached['content'])
+                return cached['content']
+
+        prompt_tokens = self._prompt_tokens(system_prompt, user_prompt)
+        logger.info(
+            f'Enviando para processamento GPT ({prompt_tokens} tokens de entrada, até {OPENAI_GPT_MAX_TOKENS} de saída)'
+        )
+        content, usage = self._create_completion(system_prompt, user_prompt, on_text, options)
+        if usage is not None:
+            self._record_usage(usage.prompt_tokens, usage.completion_tokens, 'API')
+        else:
+            self._record_usage(prompt_tokens, count_tokens(content or '', OPENAI_GPT_MODEL), 'local')
+
+        # Se o schema foi recusado, a resposta veio da chamada sem ele e é guardada com a chave dessa chamada
+        if 'response_format' in options and not self.structured_output:
+            cache_key = self._completion_cache_key(system_prompt, user_prompt, self._completion_options(schema))
+        if cache_key and self._is_json(content):
+            with self._completion_cache_lock:
+                self.completion_cache.put_json(cache_key, 'completion.json', {'content': content})
+            self._remember_completion_key(system_prompt, user_prompt, cache_key)
+        return content
+
+    def _completion_options(self, schema: Optional[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Monta os parâmetros opcionais da chamada (response_format com o schema, se habilitado)."""
+        if schema and self.structured_output:
+            return {'response_format': json_schema_response_format(*schema)}
+        return {}
+
+    def _completion_cache_key(self, system_prompt: str, user_prompt: str, options: Dict[str, Any]) -> Optional[str]:
+        """Chave do cache de completions (None se o cache estiver desativado)."""
+        if not self.completion_cache:
+            return None
+        return make_cache_key(
+            'completion',
+            system_prompt,
+            user_prompt,
+            OPENAI_GPT_MODEL,
+            OPENAI_GPT_TEMPERATURE,
+            OPENAI_GPT_MAX_TOKENS,
+            json.dumps(options.get('response_format'), sort_keys=True),
+        )
+
+    def _remember_completion_key(self, system_prompt: str, user_prompt: str, cache_key: Optional[str]) -> None:
+        """Registra a chave de cache da resposta entregue para um par de prompts."""
+        if cache_key:
+            with self._completion_cache_lock:
+                self._completion_keys[make_cache_key(system_prompt, user_prompt)] = cache_key
+
+    def _discard_cached_completion(self, system_prompt: str, user_prompt: str) -> None:
+        """
+        Remove do cache uma resposta que se mostrou inválida, para que a próxima execução gere de novo.
+
+        A chave removida é a registrada na chamada que produziu a resposta, e não uma recalculada
+        com as opções atuais (que mudam se a saída estruturada for desligada no meio da execução).
+        """
+        with self._completion_cache_lock:
+            cache_key = self._completion_keys.pop(make_cache_key(system_prompt, user_prompt), None)
+            if cache_key:
+                self.completion_cache.remove(cache_key)
+
+    @staticmethod
+    def _is_json(content: str) -> bool:
+        """Verifica se a resposta forma JSON (diretamente ou após a correção tolerante)."""
+        try:
+            json.loads(repair_json(content or ''))
+            return True
+        except json.JSONDecodeError:
+            return False
+
+    def _create_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_text: Optional[Callable[[str], None]],
+        options: Dict[str, Any],
+    ) -> Tuple[str, Any]:
+        """
+        Chama a API de chat da OpenAI (com streaming quando `on_text` é informado).
+
+        Returns:
+            Tupla (conteúdo da resposta, uso de tokens informado pela API ou None)
+        """
+        if on_text is not None:
+            # No streaming, o uso de tokens chega em um último pedaço sem conteúdo
+            options = {**options, 'stream_options': {'include_usage': True}}
+
+        try:
+            # Chama a API da OpenAI usando configurações centralizadas
+            response = openai.chat.completions.create(
+                model=OPENAI_GPT_MODEL,
+                messages=[
+                    {'role': 'system', 'content': system_prompt},
+                    {'role': 'user', 'content': user_prompt},
+                ],
+                temperature=OPENAI_GPT_TEMPERATURE,
+                max_tokens=OPENAI_GPT_MAX_TOKENS,
+                stream=on_text is not None,
+                **options,
+            )
+        except openai.BadRequestError as e:
+            # Só um erro sobre o schema desliga a saída estruturada; outros erros de requisição sobem
+            if 'response_format' not in options or not self._is_schema_error(e):
+                raise
+            logger.warning(f'Modelo {OPENAI_GPT_MODEL} não aceitou saída estruturada ({e}); desativando o modo')
+            self.structured_output = False
+            options = {key: value for key, value in options.items() if key != 'response_format'}
+            return self._create_completion(system_prompt, user_prompt, on_text, options)
+
+        if on_text is None:
+            # Extrai o conteúdo da resposta
+            return response.choices[0].message.content, getattr(response, 'usage', None)
+
+        parts = []
+        usage = None
+        try:
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    on_text(delta)
+                usage = getattr(chunk, 'usage', None) or usage
+        except Exception:
+            # Streaming interrompido: o uso não chega no último pedaço, mas a API cobra o que já gerou
+            self._record_usage(
+                self._prompt_tokens(system_prompt, user_prompt),
+                count_tokens(''.join(parts), OPENAI_GPT_MODEL),
+                'local, resposta interrompida',
+            )
+            raise
+        return ''.join(parts), usage
+
+    @staticmethod
+    def _is_schema_error(error: Exception) -> bool:
+        """Verifica se a API recusou a requisição por causa do response_format (schema não suportado)."""
+        if getattr(error, 'param', None) == 'response_format':
+            return True
+        message = str(error).lower()
+        return 'response_format' in message or 'json_schema' in message
+
+    def _stream_ebook_content(
+        self, system_prompt: str, user_prompt: str, schema: Optional[Tuple[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Gera o ebook em uma chamada com streaming, acompanhando os capítulos à medida que chegam.
+
+        O JSON é lido de forma incremental: cada capítulo é registrado assim que seu objeto
+        fecha. Se a conexão cair ou a resposta vier incompleta, os capítulos e campos já
+        recebidos são mantidos e a nova tentativa pede apenas o que falta.
+
+        Args:
+            system_prompt: Prompt de sistema
+            user_prompt: Prompt do usuário com a transcrição
+            schema: Tupla (nome, schema JSON) da resposta para o modo de saída estruturada
+
+        Returns:
+            Dict com conteúdo estruturado do ebook
+        """
+        fields: Dict[str, Any] = {}
+        chapters: List[Dict[str, Any]] = []
+        prompt = user_prompt
+
+        for attempt in range(MAX_API_RETRIES + 1):
+            parser = IncrementalJSONParser('chapters')
+
+            def on_text(text: str) -> None:
+                for chapter in parser.feed(text):
+                    title = chapter.get('title', '') if isinstance(chapter, dict) else ''
+                    logger.info(f'Capítulo {len(chapters) + len(parser.items)} recebido: {title}')
+
+            try:
+                logger.info(f'Tentativa {attempt + 1}/{MAX_API_RETRIES + 1} de processamento GPT (streaming)')
+                content = self._request_completion(system_prompt, prompt, on_text, schema)
+                parsed = self._parse_json_response(content)
+                if prompt != user_prompt:
+                    # A resposta válida veio do pedido de continuação: é essa que sai do cache se o ebook for inválido
+                    self._remember_completion_key(
+                        system_prompt, user_prompt, self._completion_keys.get(make_cache_key(system_prompt, prompt))
+                    )
+                return {**fields, **parsed, 'chapters': chapters + list(parsed.get('chapters') or [])}
+
+            except Exception as api_error:
+                # Mantém o que chegou completo antes da falha
+                chapters.extend(parser.items)
+                fields.update(parser.fields)
+                logger.warning(
+                    f'Tentativa {attempt + 1} falhou: {api_error} '
+                    f'({len(chapters)} capítulos e {len(fields)} campos recebidos até agora)'
+                )
+                if attempt == MAX_API_RETRIES:
+                    raise api_error
+                prompt = get_user_prompt_ebook_continuation(user_prompt, missing_ebook_fields(fields), chapters)
+                if schema:
+                    # A continuação traz só o que falta: o schema completo exigiria repetir os campos recebidos
+                    schema = ('ebook_continuation', ebook_continuation_schema(fields))
+                logger.info(f'Tentando novamente em {RETRY_DELAY} segundos (pedindo apenas o que falta)...')
+                time.sleep(RETRY_DELAY)
+
+    def _parse_json_response(self, content: str) -> Dict[str, Any]:
+        """
+        Faz o parse do JSON retornado pelo GPT com múltiplas estratégias de correção.
+
+        Args:
+            content: Conteúdo textual da resposta
+
+        Returns:
+            Dict com o JSON da resposta
+
+        Raises:
+            ValueError: Se nenhuma estratégia conseguir fazer o parse (resposta salva para debug)
+        """
+        # Estratégia 1: Parse direto
+        try:
+            parsed = json.loads(content)
+            logger.info('JSON parseado com sucesso na primeira tentativa')
+            return parsed
+        except json.JSONDecodeError as e:
+            logger.warning(f'Primeira tentativa de parse falhou: {e}')
+
+        # Estratégia 2: Correção tolerante em uma única passada
+        try:
+            parsed = json.loads(repair_json(content))
+            logger.info('JSON parseado com sucesso após correção')
+            return parsed
+        except json.JSONDecodeError as e:
+            logger.error(f'Todas as tentativas de parse falharam: {e}')
+
+            # Salva o conteúdo problemático para debug usando configurações centralizadas
+            debug_file = self.output_dir / DEBUG_OPENAI_RESPONSE_FILE
+            with open(debug_file, 'w', encoding='utf-8') as f:
+                f.write(f'Resposta original da OpenAI:\n{content}\n\n')
+                f.write(f'Erro de parse: {e}\n')
+
+            logger.error(f'Resposta problemática salva em: {debug_file}')
+            raise ValueError(
+                f'Não foi possível fazer parse do JSON retornado pela OpenAI. Erro: {e}\nResposta salva em: {debug_file}'
+            )
+
+    def _validate_chapter(self, chapter: Any, index: int) -> bool:
+        """Valida se um capítulo tem a estrutura esperada pelo template."""
+        if not isinstance(chapter, dict):
+            logger.warning(f'Capítulo {index} deve ser um objeto')
+            return False
+
+        chapter_required = ['title', 'content']
+        for field in chapter_required:
+            if field not in chapter:
+                logger.warning(f'Campo obrigatório ausente no capítulo {index}: {field}')
+                return False
+
+        return True
+
+    def _validate_ebook_structure(self, data: dict) -> bool:
+        """Valida se o JSON tem a estrutura esperada do ebook."""
+        required_fields = EBOOK_SCHEMA['required']
+
+        for field in required_fields:
+            if field not in data:
+                logger.warning(f'Campo obrigatório ausente: {field}')
+                return False
+
+        if not isinstance(data['chapters'], list) or len(data['chapters']) == 0:
+            logger.warning('Campo chapters deve ser uma lista não vazia')
+            return False
+
+        return all(self._validate_chapter(chapter, i) for i, chapter in enumerate(data['chapters']))
+
+    def _check_ebook_structure(self, ebook_content: Dict[str, Any]) -> None:
+        """Valida a estrutura do ebook e salva o JSON para debug se for inválida."""
+        if not self._validate_ebook_structure(ebook_content):
+            logger.error('Estrutura do JSON inválida')
+            # Salva para debug mesmo assim usando configurações centralizadas
+            debug_file = self.output_dir / DEBUG_INVALID_STRUCTURE_FILE
+            with open(debug_file, 'w', encoding='utf-8') as f:
+                json.dump(ebook_content, f, ensure_ascii=False, indent=2)
+            logger.error(f'JSON com estrutura inválida salvo em: {debug_file}')
+            raise ValueError(f'JSON retornado pela OpenAI tem estrutura inválida. Arquivo salvo em: {debug_file}')
+
+        logger.info('Estrutura do JSON validada com sucesso')
+
+    def _save_ebook_content(self, ebook_content: Dict[str, Any], video_info: Dict[str, Any]) -> str:
+        """Salva o conteúdo estruturado do ebook em JSON e retorna o caminho do arquivo."""
+        safe_title = ''.join(c for c in video_info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        content_filename = f'ebook_content_{safe_title[:30]}.json'
+        content_filepath = self.output_dir / content_filename
+
+        with open(content_filepath, 'w', encoding='utf-8') as f:
+            json.dump(ebook_content, f, ensure_ascii=False, indent=2)
+
+        logger.info(f'Conteúdo estruturado salvo em: {content_filepath}')
+        return str(content_filepath)
+
     def generate_ebook_content(self, transcription_file: str) -> Dict[str, Any]:
         """
         Processa a transcrição usando OpenAI para gerar conteúdo estruturado do ebook.
@@ -364,172 +1647,466 @@ class YouTubeEbookGenerator:
         user_prompt = get_user_prompt_ebook(video_info, transcription_text, self._format_duration)
 
         try:
-            # Estima tokens para calcular custo
-            estimated_tokens = len(transcription_text) // 3  # Estimativa aproximada
-            estimated_cost = (estimated_tokens / 1000) * OPENAI_GPT_COST_PER_1K_TOKENS
-            self.total_cost_usd += estimated_cost
+            strategy = self._plan_ebook_strategy(system_prompt, user_prompt, transcription_text)
+
+            # Transcrições longas: capítulos gerados em paralelo por partes e uma chamada final menor
+            if strategy == 'map_reduce':
+                ebook_content = self.generate_ebook_content_map_reduce(video_info, transcription_text)
+                self._save_ebook_content(ebook_content, video_info)
+                logger.info('Processamento com OpenAI concluído com sucesso')
+                return ebook_content
+
+            # Esboço curto e capítulos escritos em paralelo
+            if strategy == 'outline':
+                ebook_content = self.generate_ebook_content_outline_first(video_info, transcription_text)
+                self._save_ebook_content(ebook_content, video_info)
+                logger.info('Processamento com OpenAI concluído com sucesso')
+                return ebook_content
+
+            if EBOOK_STREAMING:
+                # Streaming: progresso por capítulo e resultado parcial preservado entre tentativas
+                ebook_content = self._stream_ebook_content(system_prompt, user_prompt, ('ebook', EBOOK_SCHEMA))
+            else:
+                content = self._chat_completion(system_prompt, user_prompt, ('ebook', EBOOK_SCHEMA))
 
-            logger.info(f'Enviando para processamento GPT (custo estimado: ${estimated_cost:.4f} USD)')
+                # Tenta fazer parse do JSON com múltiplas estratégias
+                ebook_content = self._parse_json_response(content)
+            if ebook_content is None:
+                raise ValueError('Falha crítica no processamento do JSON da OpenAI')
 
-            # Tenta processar com retry em caso de falha usando configurações centralizadas
-            ebook_content = None
+            # Regenera apenas capítulos e campos inválidos, mantendo o restante da resposta
+            if EBOOK_REPAIR_INVALID:
+                ebook_content = self._repair_ebook_structure(ebook_content, video_info, transcription_text)
 
-            for attempt in range(MAX_API_RETRIES + 1):
-                try:
-                    logger.info(f'Tentativa {attempt + 1}/{MAX_API_RETRIES + 1} de processamento GPT')
-
-                    # Chama a API da OpenAI usando configurações centralizadas
-                    response = openai.chat.completions.create(
-                        model=OPENAI_GPT_MODEL,
-                        messages=[
-                            {'role': 'system', 'content': system_prompt},
-                            {'role': 'user', 'content': user_prompt},
-                        ],
-                        temperature=OPENAI_GPT_TEMPERATURE,
-                        max_tokens=OPENAI_GPT_MAX_TOKENS,
-                    )
+            # Valida a estrutura do JSON (uma resposta inválida não fica no cache)
+            try:
+                self._check_ebook_structure(ebook_content)
+            except ValueError:
+                self._discard_cached_completion(system_prompt, user_prompt)
+                raise
 
-                    break  # Sai do loop se a chamada foi bem-sucedida
+            # Salva o conteúdo estruturado
+            self._save_ebook_content(ebook_content, video_info)
+            logger.info('Processamento com OpenAI concluído com sucesso')
 
-                except Exception as api_error:
-                    logger.warning(f'Tentativa {attempt + 1} falhou: {api_error}')
-                    if attempt == MAX_API_RETRIES:
-                        raise api_error
-                    logger.info(f'Tentando novamente em {RETRY_DELAY} segundos...')
-                    import time
+            return ebook_content
+
+        except Exception as e:
+            logger.error(f'Erro no processamento com OpenAI: {str(e)}')
+            raise
 
-                    time.sleep(RETRY_DELAY)
+    def _plan_ebook_strategy(self, system_prompt: str, user_prompt: str, transcription_text: str) -> str:
+        """
+        Escolhe antes do envio como gerar o ebook, a partir dos tokens do prompt completo.
 
-            # Extrai o conteúdo da resposta
-            content = response.choices[0].message.content
+        Se o prompt de chamada única mais a saída máxima (OPENAI_GPT_MAX_TOKENS) não couberem
+        na janela de contexto, a transcrição é processada em partes (map-reduce) mesmo que o
+        map-reduce esteja desativado, pois a chamada única falharia. O esboço também envia a
+        transcrição inteira e só é usado quando ela cabe.
 
-            # Função para limpar e corrigir JSON malformado
-            def clean_json_content(json_str: str) -> str:
-                """Limpa e corrige problemas comuns em JSON gerado por IA."""
-                import re
+        Args:
+            system_prompt: Prompt de sistema da chamada única
+            user_prompt: Prompt do usuário da chamada única
+            transcription_text: Texto completo da transcrição
 
-                # Remove markdown code blocks se existirem
-                json_str = re.sub(r'```json\s*', '', json_str)
-                json_str = re.sub(r'```\s*$', '', json_str)
+        Returns:
+            'map_reduce', 'outline' ou 'single'
+        """
+        prompt_tokens = self._prompt_tokens(system_prompt, user_prompt)
+        budget = OPENAI_GPT_CONTEXT_WINDOW - OPENAI_GPT_MAX_TOKENS
+        logger.info(
+            f'Prompt do ebook: {prompt_tokens} tokens de entrada '
+            f'(limite de {budget} para a janela de {OPENAI_GPT_CONTEXT_WINDOW} tokens)'
+        )
+
+        if prompt_tokens > budget:
+            logger.warning('Prompt não cabe na janela de contexto: gerando o ebook em partes')
+            return 'map_reduce'
+        if EBOOK_MAP_REDUCE and len(transcription_text) > EBOOK_MAP_REDUCE_THRESHOLD_CHARS:
+            return 'map_reduce'
+        if EBOOK_OUTLINE_FIRST:
+            return 'outline'
+        return 'single'
+
+    def _repair_ebook_structure(
+        self, ebook_content: Dict[str, Any], video_info: Dict[str, Any], transcription_text: str
+    ) -> Dict[str, Any]:
+        """
+        Corrige um ebook com capítulos ou campos inválidos sem gerar o ebook inteiro de novo.
 
-                # Remove texto antes e depois do JSON
-                json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
+        Os capítulos válidos e os campos presentes são mantidos. Cada capítulo inválido é
+        regenerado por uma chamada própria, só com o trecho proporcional da transcrição
+        (blocos de EBOOK_OUTLINE_BLOCK_CHARS divididos igualmente entre os capítulos), e os
+        campos ausentes vêm de uma chamada curta baseada nos capítulos válidos. Sem nenhum
+        capítulo aproveitável, o conteúdo é devolvido como está e a validação falha.
 
-                # Corrige aspas simples para duplas (problema comum)
-                json_str = re.sub(r"'([^']*)':", r'"\1":', json_str)
+        Args:
+            ebook_content: Conteúdo do ebook retornado pela OpenAI
+            video_info: Informações do vídeo
+            transcription_text: Texto completo da transcrição
 
-                # Corrige trailing commas
-                json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+        Returns:
+            Dict com o conteúdo do ebook corrigido
+        """
+        chapters = ebook_content.get('chapters')
+        if not isinstance(chapters, list) or not chapters:
+            return ebook_content
 
-                # Corrige quebras de linha dentro de strings
-                json_str = re.sub(r'"\s*\n\s*([^"]*)\s*\n\s*"', r'"\1"', json_str)
+        total = len(chapters)
+        invalid = [i for i, chapter in enumerate(chapters) if not self._validate_chapter(chapter, i + 1)]
+        missing = [
+            field for field in EBOOK_SCHEMA['required'] if field != 'chapters' and ebook_content.get(field) is None
+        ]
+        if not invalid and not missing:
+            return ebook_content
+        if len(invalid) == total:
+            logger.warning('Nenhum capítulo válido para aproveitar')
+            return ebook_content
 
-                return json_str
+        logger.warning(
+            f'Regenerando apenas {len(invalid)} capítulo(s) inválido(s) e {len(missing)} campo(s) ausente(s)'
+        )
+        blocks = split_transcript(transcription_text, EBOOK_OUTLINE_BLOCK_CHARS)
+        spans = assign_outline_spans([{} for _ in chapters], len(blocks))
+        valid_chapters = [chapter for i, chapter in enumerate(chapters) if i not in invalid]
+
+        calls = [
+            partial(
+                self.generate_ebook_chapter,
+                video_info,
+                chapters[i].get('title') if isinstance(chapters[i], dict) else None,
+                i + 1,
+                total,
+                ' '.join(blocks[spans[i][0] : spans[i][1]]),
+            )
+            for i in invalid
+        ]
+        if missing:
+            calls.append(partial(self._request_ebook_frame, video_info, valid_chapters))
+        # Mesmo limite de chamadas simultâneas do map-reduce
+        results = self._run_parallel(calls, EBOOK_MAP_MAX_WORKERS, 'correção')
+
+        repaired_chapters = list(chapters)
+        for i, chapter in zip(invalid, results):
+            repaired_chapters[i] = chapter
+        repaired = {**ebook_content, 'chapters': repaired_chapters}
+        if missing:
+            frame = results[-1]
+            repaired.update({field: frame[field] for field in missing if frame.get(field) is not None})
+        return repaired
+
+    def _run_parallel(self, calls: List[Callable[[], Any]], max_workers: int, label: str) -> List[Any]:
+        """
+        Executa chamadas independentes em paralelo e retorna os resultados na ordem original.
 
-            # Tenta fazer parse do JSON com múltiplas estratégias
-            ebook_content = None
-            original_content = content
+        Na primeira falha, as chamadas ainda não iniciadas são canceladas e o erro é propagado.
 
-            # Estratégia 1: Parse direto
-            try:
-                ebook_content = json.loads(content)
-                logger.info('JSON parseado com sucesso na primeira tentativa')
-            except json.JSONDecodeError as e:
-                logger.warning(f'Primeira tentativa de parse falhou: {e}')
+        Args:
+            calls: Funções sem argumentos a executar
+            max_workers: Número máximo de chamadas simultâneas
+            label: Nome de cada item nas mensagens de erro (ex.: 'capítulo')
 
-                # Estratégia 2: Limpar e tentar novamente
+        Returns:
+            Lista com o resultado de cada chamada
+        """
+        results: List[Any] = [None] * len(calls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(call): i for i, call in enumerate(calls)}
+            for future in as_completed(futures):
+                i = futures[future]
                 try:
-                    cleaned_content = clean_json_content(content)
-                    ebook_content = json.loads(cleaned_content)
-                    logger.info('JSON parseado com sucesso após limpeza')
-                except json.JSONDecodeError as e:
-                    logger.warning(f'Segunda tentativa de parse falhou: {e}')
-
-                    # Estratégia 3: Tentar corrigir caracteres problemáticos
-                    try:
-                        # Remove caracteres de controle
-                        import unicodedata
-
-                        cleaned_content = ''.join(
-                            ch for ch in content if unicodedata.category(ch)[0] != 'C' or ch in '\n\r\t'
-                        )
-                        cleaned_content = clean_json_content(cleaned_content)
-                        ebook_content = json.loads(cleaned_content)
-                        logger.info('JSON parseado com sucesso após limpeza de caracteres')
-                    except json.JSONDecodeError as e:
-                        logger.error(f'Todas as tentativas de parse falharam: {e}')
-
-                        # Salva o conteúdo problemático para debug usando configurações centralizadas
-                        debug_file = self.output_dir / DEBUG_OPENAI_RESPONSE_FILE
-                        with open(debug_file, 'w', encoding='utf-8') as f:
-                            f.write(f'Resposta original da OpenAI:\n{original_content}\n\n')
-                            f.write(f'Erro de parse: {e}\n')
-
-                        logger.error(f'Resposta problemática salva em: {debug_file}')
-                        raise ValueError(
-                            f'Não foi possível fazer parse do JSON retornado pela OpenAI. Erro: {e}\nResposta salva em: {debug_file}'
-                        )
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f'Erro no processamento ({label} {i + 1}): {str(e)}')
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+        return results
+
+    def generate_ebook_content_map_reduce(self, video_info: Dict[str, Any], transcription_text: str) -> Dict[str, Any]:
+        """
+        Gera o ebook em map-reduce para transcrições que não cabem bem em um único prompt.
 
-            if ebook_content is None:
-                raise ValueError('Falha crítica no processamento do JSON da OpenAI')
+        Map: a transcrição é dividida em partes (EBOOK_MAP_CHUNK_CHARS) e cada parte vira um
+        capítulo do ebook, com até EBOOK_MAP_MAX_WORKERS chamadas simultâneas. Reduce: uma
+        chamada menor, só com o resumo dos capítulos, gera título, descrição, conclusão e
+        pontos-chave. O resultado segue o mesmo formato JSON do modo de chamada única.
 
-            # Valida a estrutura do JSON
-            def validate_ebook_structure(data: dict) -> bool:
-                """Valida se o JSON tem a estrutura esperada do ebook."""
-                required_fields = ['title', 'subtitle', 'author', 'description', 'chapters', 'conclusion', 'key_points']
-
-                for field in required_fields:
-                    if field not in data:
-                        logger.warning(f'Campo obrigatório ausente: {field}')
-                        return False
-
-                if not isinstance(data['chapters'], list) or len(data['chapters']) == 0:
-                    logger.warning('Campo chapters deve ser uma lista não vazia')
-                    return False
-
-                for i, chapter in enumerate(data['chapters']):
-                    if not isinstance(chapter, dict):
-                        logger.warning(f'Capítulo {i} deve ser um objeto')
-                        return False
-
-                    chapter_required = ['title', 'content']
-                    for field in chapter_required:
-                        if field not in chapter:
-                            logger.warning(f'Campo obrigatório ausente no capítulo {i}: {field}')
-                            return False
-
-                return True
-
-            # Valida a estrutura
-            if not validate_ebook_structure(ebook_content):
-                logger.error('Estrutura do JSON inválida')
-                # Salva para debug mesmo assim usando configurações centralizadas
-                debug_file = self.output_dir / DEBUG_INVALID_STRUCTURE_FILE
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    json.dump(ebook_content, f, ensure_ascii=False, indent=2)
-                logger.error(f'JSON com estrutura inválida salvo em: {debug_file}')
-                raise ValueError(f'JSON retornado pela OpenAI tem estrutura inválida. Arquivo salvo em: {debug_file}')
-
-            logger.info('Estrutura do JSON validada com sucesso')
+        Args:
+            video_info: Informações do vídeo
+            transcription_text: Texto completo da transcrição
 
-            # Salva o conteúdo estruturado
-            safe_title = ''.join(c for c in video_info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            content_filename = f'ebook_content_{safe_title[:30]}.json'
-            content_filepath = self.output_dir / content_filename
+        Returns:
+            Dict com conteúdo estruturado do ebook
+        """
+        chunks = split_transcript(transcription_text, EBOOK_MAP_CHUNK_CHARS)
+        total = len(chunks)
+        logger.info(
+            f'Transcrição longa: gerando o ebook em map-reduce ({total} partes, {EBOOK_MAP_MAX_WORKERS} workers)'
+        )
+
+        chapters = self._run_parallel(
+            [
+                partial(self.generate_ebook_chapter, video_info, None, i, total, chunk)
+                for i, chunk in enumerate(chunks, 1)
+            ],
+            EBOOK_MAP_MAX_WORKERS,
+            'parte',
+        )
+        return self.generate_ebook_frame(video_info, chapters)
+
+    def generate_ebook_content_outline_first(
+        self, video_info: Dict[str, Any], transcription_text: str
+    ) -> Dict[str, Any]:
+        """
+        Gera o ebook em duas fases: esboço curto e capítulos escritos em paralelo.
 
-            with open(content_filepath, 'w', encoding='utf-8') as f:
-                json.dump(ebook_content, f, ensure_ascii=False, indent=2)
+        Fase 1: a transcrição é numerada em blocos (EBOOK_OUTLINE_BLOCK_CHARS) e uma chamada
+        curta gera título, subtítulo, descrição e o esboço dos capítulos, com o intervalo de
+        blocos que cada um cobre. Fase 2: cada capítulo é escrito por uma chamada própria,
+        só com os blocos do seu intervalo, em paralelo com a chamada que gera a conclusão e os
+        pontos-chave a partir do esboço. O tempo total se aproxima do capítulo mais longo.
 
-            logger.info(f'Conteúdo estruturado salvo em: {content_filepath}')
-            logger.info('Processamento com OpenAI concluído com sucesso')
+        Args:
+            video_info: Informações do vídeo
+            transcription_text: Texto completo da transcrição
 
-            return ebook_content
+        Returns:
+            Dict com conteúdo estruturado do ebook
+        """
+        blocks = split_transcript(transcription_text, EBOOK_OUTLINE_BLOCK_CHARS)
+        user_prompt = get_user_prompt_ebook_outline(video_info, blocks, self._format_duration)
+        outline = self._parse_json_response(
+            self._chat_completion(SYSTEM_PROMPT_EBOOK_OUTLINE, user_prompt, ('ebook_outline', EBOOK_OUTLINE_SCHEMA))
+        )
+
+        outline_chapters = [c for c in outline.get('chapters') or [] if isinstance(c, dict) and c.get('title')]
+        if not outline_chapters:
+            raise ValueError('Esboço retornado pela OpenAI não tem capítulos')
+
+        spans = assign_outline_spans(outline_chapters, len(blocks))
+        total = len(outline_chapters)
+        logger.info(f'Esboço com {total} capítulos, escrevendo em paralelo ({EBOOK_OUTLINE_MAX_WORKERS} workers)')
+
+        chapter_calls = [
+            partial(
+                self.generate_ebook_chapter,
+                video_info,
+                chapter['title'],
+                i,
+                total,
+                ' '.join(blocks[start:end]),
+                chapter.get('summary'),
+            )
+            for i, (chapter, (start, end)) in enumerate(zip(outline_chapters, spans), 1)
+        ]
+        results = self._run_parallel(
+            [partial(self._request_ebook_frame, video_info, outline_chapters)] + chapter_calls,
+            EBOOK_OUTLINE_MAX_WORKERS,
+            'capítulo',
+        )
+
+        # Título e descrição vêm do esboço (que viu a transcrição inteira); conclusão e pontos-chave, da fase 2
+        frame = {
+            **results[0],
+            **{k: outline[k] for k in ('title', 'subtitle', 'author', 'description') if outline.get(k)},
+        }
+        return self._assemble_ebook(video_info, frame, results[1:])
+
+    def _use_chapter_mode(self, video_info: Dict[str, Any]) -> bool:
+        """Decide se o vídeo deve ser processado por capítulos do YouTube, em paralelo."""
+        chapters = video_info.get('chapters') or []
+        return (
+            CHAPTER_PARALLEL
+            and not video_info.get('time_range')
+            and len(chapters) >= CHAPTER_PARALLEL_MIN_CHAPTERS
+            and (video_info.get('duration') or 0) >= CHAPTER_PARALLEL_MIN_DURATION_MINUTES * 60
+        )
+
+    def generate_ebook_chapter(
+        self,
+        video_info: Dict[str, Any],
+        chapter_title: Optional[str],
+        chapter_number: int,
+        total: int,
+        text: str,
+        summary: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Expande a transcrição de um capítulo do vídeo em um capítulo do ebook.
 
-        except Exception as e:
-            logger.error(f'Erro no processamento com OpenAI: {str(e)}')
-            raise
+        Args:
+            video_info: Informações do vídeo
+            chapter_title: Título do capítulo no YouTube (None para uma parte da transcrição)
+            chapter_number: Número do capítulo (a partir de 1)
+            total: Total de capítulos
+            text: Transcrição do capítulo
+            summary: Resumo do capítulo definido no esboço (opcional)
+
+        Returns:
+            Dict do capítulo no formato esperado pelo template
+        """
+        user_prompt = get_user_prompt_ebook_chapter(video_info, chapter_title, chapter_number, total, text, summary)
+        chapter = self._parse_json_response(
+            self._chat_completion(SYSTEM_PROMPT_EBOOK_CHAPTER, user_prompt, ('ebook_chapter', CHAPTER_SCHEMA))
+        )
+
+        if not self._validate_chapter(chapter, chapter_number):
+            self._discard_cached_completion(SYSTEM_PROMPT_EBOOK_CHAPTER, user_prompt)
+            raise ValueError(f'Capítulo {chapter_number} retornado pela OpenAI tem estrutura inválida')
+        logger.info(f'Capítulo {chapter_number}/{total} gerado: {chapter["title"]}')
+        return chapter
+
+    def generate_ebook_frame(self, video_info: Dict[str, Any], chapters: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Gera título, subtítulo, descrição, conclusão e pontos-chave a partir dos capítulos prontos.
+
+        Args:
+            video_info: Informações do vídeo
+            chapters: Capítulos do ebook, em ordem
+
+        Returns:
+            Dict com o conteúdo completo do ebook (incluindo os capítulos)
+        """
+        return self._assemble_ebook(video_info, self._request_ebook_frame(video_info, chapters), chapters)
+
+    def _request_ebook_frame(self, video_info: Dict[str, Any], chapters: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pede ao GPT título, descrição, conclusão e pontos-chave a partir dos capítulos (ou do esboço)."""
+        user_prompt = get_user_prompt_ebook_frame(video_info, chapters, self._format_duration)
+        return self._parse_json_response(
+            self._chat_completion(SYSTEM_PROMPT_EBOOK_FRAME, user_prompt, ('ebook_frame', EBOOK_FRAME_SCHEMA))
+        )
+
+    def _assemble_ebook(
+        self, video_info: Dict[str, Any], frame: Dict[str, Any], chapters: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Monta e valida o conteúdo do ebook no formato esperado pelo template."""
+        ebook_content = {
+            'title': frame.get('title', video_info['title']),
+            'subtitle': frame.get('subtitle', 'Ebook gerado automaticamente'),
+            'author': frame.get('author', video_info['uploader']),
+            'description': frame.get('description', ''),
+            'chapters': chapters,
+            'conclusion': frame.get('conclusion', ''),
+            'key_points': frame.get('key_points', []),
+        }
+        self._check_ebook_structure(ebook_content)
+        return ebook_content
+
+    def _process_chapter(
+        self,
+        index: int,
+        total: int,
+        chapter: Dict[str, Any],
+        video_info: Dict[str, Any],
+        audio_path: Optional[str] = None,
+        transcription: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Transcreve um capítulo (ou recorta a transcrição existente) e o expande em capítulos do ebook.
+
+        Um capítulo cujo prompt não cabe na janela de contexto é dividido em partes, cada uma
+        expandida em um capítulo do ebook ('Título (parte 1/2)', ...).
+        """
+        if audio_path:
+            chapter_transcription = self.check_audio_size_and_transcribe(audio_path)
+            chapter_transcription = offset_transcription(chapter_transcription, chapter['start_time'])
+        else:
+            chapter_transcription = slice_transcription(transcription, chapter['start_time'], chapter['end_time'])
+
+        logger.info(f'Capítulo {index}/{total} transcrito: {chapter["title"]}')
+        parts = self._split_chapter_to_budget(video_info, chapter['title'], index, total, chapter_transcription['text'])
+        ebook_chapters = [
+            self.generate_ebook_chapter(
+                video_info,
+                chapter['title'] if len(parts) == 1 else f'{chapter["title"]} (parte {k}/{len(parts)})',
+                index,
+                total,
+                part,
+            )
+            for k, part in enumerate(parts, 1)
+        ]
+        return chapter_transcription, ebook_chapters
+
+    def _split_chapter_to_budget(
+        self, video_info: Dict[str, Any], chapter_title: str, chapter_number: int, total: int, text: str
+    ) -> List[str]:
+        """
+        Divide a transcrição de um capítulo para que cada prompt caiba na janela de contexto.
+
+        Mesma verificação de `_plan_ebook_strategy`: tokens de entrada contados localmente contra
+        OPENAI_GPT_CONTEXT_WINDOW menos OPENAI_GPT_MAX_TOKENS. O tamanho das partes em caracteres
+        é estimado pela proporção de caracteres por token do próprio texto.
+
+        Returns:
+            Lista de partes da transcrição (só o texto original se o prompt couber)
+        """
+        budget = OPENAI_GPT_CONTEXT_WINDOW - OPENAI_GPT_MAX_TOKENS
+        user_prompt = get_user_prompt_ebook_chapter(video_info, chapter_title, chapter_number, total, text)
+        prompt_tokens = self._prompt_tokens(SYSTEM_PROMPT_EBOOK_CHAPTER, user_prompt)
+        if prompt_tokens <= budget or not text:
+            return [text]
+
+        overhead = prompt_tokens - count_tokens(text, OPENAI_GPT_MODEL)
+        text_budget = max(1, budget - overhead)
+        max_chars = max(1, len(text) * text_budget // max(1, prompt_tokens - overhead))
+        parts = split_transcript(text, max_chars)
+        logger.warning(
+            f'Capítulo {chapter_number}/{total}: prompt de {prompt_tokens} tokens não cabe no limite de '
+            f'{budget}, dividido em {len(parts)} partes'
+        )
+        return parts
+
+    def process_chapters(
+        self, video_info: Dict[str, Any], transcription: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Processa um vídeo longo por capítulos do YouTube, em paralelo.
+
+        Cada capítulo tem o áudio cortado, segmentado e transcrito (ou, se a transcrição já
+        existir, por exemplo vinda das legendas, apenas recortada) e é expandido em um capítulo
+        do ebook assim que sua transcrição termina. Os capítulos são montados na ordem original
+        e uma última chamada gera título, descrição, conclusão e pontos-chave.
+
+        Args:
+            video_info: Informações do vídeo com 'chapters' (e 'audio_path' se não houver transcrição)
+            transcription: Transcrição do vídeo inteiro (opcional)
+
+        Returns:
+            Tupla (transcrição do vídeo inteiro, conteúdo estruturado do ebook)
+        """
+        chapters = video_info['chapters']
+        total = len(chapters)
+        logger.info(f'Processando {total} capítulos em paralelo ({CHAPTER_MAX_WORKERS} workers)')
+
+        audio_paths: List[Optional[str]] = [None] * total
+        if transcription is None:
+            chapters_dir = Path(self.temp_dir) / 'capitulos'
+            chapters_dir.mkdir(exist_ok=True)
+            plan = [(chapter['start_time'], chapter['end_time'] - chapter['start_time']) for chapter in chapters]
+            audio_paths = cut_segments(video_info['audio_path'], plan, str(chapters_dir))
+
+        results = self._run_parallel(
+            [
+                partial(self._process_chapter, i, total, chapter, video_info, audio_paths[i - 1], transcription)
+                for i, chapter in enumerate(chapters, 1)
+            ],
+            CHAPTER_MAX_WORKERS,
+            'capítulo',
+        )
+
+        chapter_transcriptions = [result[0] for result in results]
+        full_transcription = {
+            'text': ' '.join(t['text'] for t in chapter_transcriptions),
+            'duration': sum(t.get('duration', 0) for t in chapter_transcriptions),
+        }
+        if all('words' in t for t in chapter_transcriptions):
+            full_transcription['words'] = [word for t in chapter_transcriptions for word in t['words']]
+
+        ebook_chapters = [ebook_chapter for result in results for ebook_chapter in result[1]]
+        ebook_content = self.generate_ebook_frame(video_info, ebook_chapters)
+        self._save_ebook_content(ebook_content, video_info)
+        return full_transcription, ebook_content
 
     def _process_markdown(self, text: str) -> str:
         """
@@ -695,16 +2272,24 @@ class YouTubeEbookGenerator:
         print('\n' + '=' * 50)
         print('RESUMO DE CUSTOS DA API OPENAI')
         print('=' * 50)
+        print(f'Tokens GPT: {self.total_prompt_tokens:,} de entrada + {self.total_completion_tokens:,} de saída')
         print(f'Custo total (USD): ${self.total_cost_usd:.4f}')
         print(f'Custo total (BRL): R$ {cost_brl:.2f}')
         print(f'Cotação utilizada: 1 USD = R$ {USD_TO_BRL}')
         print('=' * 50)
 
-    def process_video(self, url: str, output_filename: Optional[str] = None) -> str:
+    def process_video(
+        self,
+        url: str,
+        output_filename: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        chapter: Optional[str] = None,
+    ) -> str:
         """
         Processa um vídeo do YouTube seguindo o novo fluxo:
         1. Download do áudio
-        2. Transcrição com OpenAI Whisper
+        2. Transcrição com OpenAI Whisper (etapas 1-2 dispensadas se houver legenda adequada)
         3. Salvamento da transcrição
         4. Processamento com OpenAI GPT para gerar conteúdo estruturado
         5. Geração do ebook com template
@@ -712,6 +2297,9 @@ class YouTubeEbookGenerator:
         Args:
             url: URL do vídeo do YouTube
             output_filename: Nome do arquivo de saída (opcional)
+            start: Início do trecho a processar (segundos ou 'hh:mm:ss'), opcional
+            end: Fim do trecho a processar (segundos ou 'hh:mm:ss'), opcional
+            chapter: Número ou título de um capítulo do YouTube a processar, opcional
 
         Returns:
             Caminho do arquivo PDF gerado
@@ -719,21 +2307,51 @@ class YouTubeEbookGenerator:
         logger.info(f'Iniciando processamento do vídeo: {url}')
 
         try:
-            # Etapa 1: Download do áudio
-            logger.info('Etapa 1/5: Download do áudio')
-            video_info = self.download_audio(url)
-
-            # Etapa 2: Transcrição (com verificação de tamanho automática)
-            logger.info('Etapa 2/5: Transcrição com OpenAI Whisper')
-            transcription = self.check_audio_size_and_transcribe(video_info['audio_path'])
+            # Áudio já em cache: nenhuma ida à rede (as legendas não trariam ganho)
+            cached_audio = self.find_cached_audio(url, start, end, chapter)
+
+            # Atalho: legendas do YouTube dispensam o download do áudio e a transcrição. Os
+            # metadados (cache ou uma única resolução da página) dizem se há legenda a tentar
+            captions = None
+            if not cached_audio and CAPTIONS_FAST_PATH and self._may_have_captions(self.get_video_info(url)):
+                captions = self.fetch_captions(url, start, end, chapter)
+
+            if captions:
+                logger.info('Etapas 1-2/5: Transcrição obtida das legendas do vídeo')
+                video_info, transcription = captions
+            else:
+                # Etapa 1: Download do áudio
+                logger.info('Etapa 1/5: Download do áudio')
+                video_info = cached_audio or self.download_audio(url, start, end, chapter)
+                if video_info.get('audio_cache_hit'):
+                    logger.info('Cache de áudio: HIT (download e conversão ignorados)')
+                else:
+                    logger.info('Cache de áudio: MISS')
+                transcription = None
+
+            # Vídeos longos com capítulos: transcrição e estruturação de cada capítulo em paralelo
+            chapter_mode = self._use_chapter_mode(video_info)
+            ebook_content = None
+            if chapter_mode:
+                logger.info('Etapas 2-4/5: Transcrição e estruturação por capítulos do YouTube, em paralelo')
+                transcription, ebook_content = self.process_chapters(video_info, transcription)
+            elif transcription is None:
+                # Etapa 2: Transcrição (com verificação de tamanho automática)
+                logger.info('Etapa 2/5: Transcrição com OpenAI Whisper')
+                transcription = self.check_audio_size_and_transcribe(video_info['audio_path'])
+
+                # Timestamps do trecho passam para a linha do tempo do vídeo original
+                if video_info.get('time_range'):
+                    transcription = offset_transcription(transcription, video_info['time_range']['start'])
 
             # Etapa 3: Salvamento da transcrição
             logger.info('Etapa 3/5: Salvamento da transcrição')
             transcription_file = self.save_transcription(transcription, video_info)
 
             # Etapa 4: Processamento com OpenAI para gerar conteúdo estruturado
-            logger.info('Etapa 4/5: Processamento com OpenAI GPT para estruturar conteúdo')
-            ebook_content = self.generate_ebook_content(transcription_file)
+            if not chapter_mode:
+                logger.info('Etapa 4/5: Processamento com OpenAI GPT para estruturar conteúdo')
+                ebook_content = self.generate_ebook_content(transcription_file)
 
             # Etapa 5: Geração do ebook
             logger.info('Etapa 5/5: Geração do ebook')
@@ -791,7 +2409,9 @@ def main():
 
         # Processa o vídeo
         with YouTubeEbookGenerator() as generator:
-            pdf_path = generator.process_video(test_url)
+            pdf_path = generator.process_video(
+                test_url, start=TIME_RANGE_START, end=TIME_RANGE_END, chapter=TIME_RANGE_CHAPTER
+            )
 
         print('\n✅ Ebook gerado com sucesso!')
         print(f'📁 Arquivo salvo em: {pdf_path}')
@@ -0,0 +1,104 @@
+"""
+Módulo de otimizações do pipeline do Content Video Generator.
+
+Este módulo contém os componentes de cache, áudio, legendas, transcrição e desempenho usados pelo gerador de ebooks.
+"""
+
+from .audio import (
+    convert_to_speech_profile,
+    cut_segment,
+    cut_segments,
+    detect_silences,
+    find_downloaded_audio,
+    is_whisper_compatible,
+    plan_fixed_segments,
+    plan_segments_by_size,
+    plan_silence_segments,
+    probe_audio,
+    remux_audio,
+)
+from .cache import JSONTTLCache, LRUDiskCache, hash_file, make_cache_key
+from .captions import (
+    caption_track_languages,
+    is_caption_usable,
+    is_original_caption,
+    parse_captions,
+    parse_srv,
+    parse_vtt,
+    select_caption_track,
+)
+from .checkpoint import TranscriptionCheckpoint
+from .chunking import assign_outline_spans, split_transcript
+from .json_repair import repair_json
+from .merge import merge_segment_transcripts
+from .ranges import (
+    TimeRange,
+    extract_chapters,
+    offset_transcription,
+    parse_time,
+    resolve_time_range,
+    slice_transcription,
+)
+from .schemas import (
+    CHAPTER_SCHEMA,
+    EBOOK_FRAME_SCHEMA,
+    EBOOK_OUTLINE_SCHEMA,
+    EBOOK_SCHEMA,
+    ebook_continuation_schema,
+    json_schema_response_format,
+    missing_ebook_fields,
+)
+from .streaming import IncrementalJSONParser
+from .timestamps import WordTimestampStore
+from .tokens import count_message_tokens, count_tokens
+from .transcription import LocalWhisperBackend, OpenAITranscriptionBackend, TranscriptionBackend
+
+__all__ = [
+    'CHAPTER_SCHEMA',
+    'EBOOK_FRAME_SCHEMA',
+    'EBOOK_OUTLINE_SCHEMA',
+    'EBOOK_SCHEMA',
+    'IncrementalJSONParser',
+    'JSONTTLCache',
+    'LRUDiskCache',
+    'LocalWhisperBackend',
+    'OpenAITranscriptionBackend',
+    'TimeRange',
+    'TranscriptionBackend',
+    'TranscriptionCheckpoint',
+    'WordTimestampStore',
+    'assign_outline_spans',
+    'caption_track_languages',
+    'convert_to_speech_profile',
+    'count_message_tokens',
+    'count_tokens',
+    'cut_segment',
+    'cut_segments',
+    'detect_silences',
+    'ebook_continuation_schema',
+    'extract_chapters',
+    'find_downloaded_audio',
+    'hash_file',
+    'is_caption_usable',
+    'is_original_caption',
+    'is_whisper_compatible',
+    'json_schema_response_format',
+    'make_cache_key',
+    'merge_segment_transcripts',
+    'missing_ebook_fields',
+    'offset_transcription',
+    'parse_captions',
+    'parse_srv',
+    'parse_time',
+    'parse_vtt',
+    'plan_fixed_segments',
+    'plan_segments_by_size',
+    'plan_silence_segments',
+    'probe_audio',
+    'remux_audio',
+    'repair_json',
+    'resolve_time_range',
+    'select_caption_track',
+    'slice_transcription',
+    'split_transcript',
+]
@@ -0,0 +1,473 @@
+"""
+Utilitários de áudio baseados no FFmpeg/ffprobe.
+
+Concentra as operações sobre os arquivos de áudio baixados: inspeção de formato,
+remux sem recodificação, localização do arquivo gerado pelo yt-dlp e segmentação
+(com cortes de duração fixa ou ajustados às pausas da fala).
+"""
+
+import json
+import logging
+import math
+import re
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Extensões aceitas pela API de transcrição da OpenAI
+WHISPER_COMPATIBLE_EXTENSIONS = ('flac', 'm4a', 'mp3', 'mp4', 'mpeg', 'mpga', 'oga', 'ogg', 'wav', 'webm')
+
+# Contêiner compatível com o Whisper para cada codec, usado no remux sem recodificação
+CODEC_CONTAINERS = {
+    'aac': 'm4a',
+    'alac': 'm4a',
+    'mp3': 'mp3',
+    'opus': 'ogg',
+    'vorbis': 'ogg',
+    'flac': 'flac',
+}
+
+# Linhas do filtro silencedetect: "silence_start: 12.34" / "silence_end: 13.56"
+SILENCE_LOG_PATTERN = re.compile(r'silence_(start|end):\s*(-?[\d.]+)')
+
+
+def is_whisper_compatible(audio_path: str) -> bool:
+    """Verifica se a extensão do arquivo é aceita pela API de transcrição."""
+    return Path(audio_path).suffix.lower().lstrip('.') in WHISPER_COMPATIBLE_EXTENSIONS
+
+
+def probe_audio(audio_path: str) -> Dict[str, Any]:
+    """
+    Obtém duração, bitrate e codec do primeiro stream de áudio usando ffprobe.
+
+    Args:
+        audio_path: Caminho do arquivo de áudio
+
+    Returns:
+        Dict com 'duration' (segundos), 'bit_rate' (bits/s), 'codec_name' e 'size' (bytes)
+    """
+    probe_cmd = [
+        'ffprobe',
+        '-v',
+        'quiet',
+        '-print_format',
+        'json',
+        '-show_entries',
+        'format=duration,bit_rate,size:stream=codec_name,bit_rate',
+        '-select_streams',
+        'a:0',
+        audio_path,
+    ]
+    result = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout or '{}')
+    fmt = data.get('format', {})
+    stream = (data.get('streams') or [{}])[0]
+
+    size = int(fmt.get('size') or Path(audio_path).stat().st_size)
+    duration = float(fmt.get('duration') or 0)
+    bit_rate = int(fmt.get('bit_rate') or stream.get('bit_rate') or 0)
+    if not bit_rate and duration:
+        bit_rate = int(size * 8 / duration)
+
+    return {
+        'duration': duration,
+        'bit_rate': bit_rate,
+        'codec_name': stream.get('codec_name', ''),
+        'size': size,
+    }
+
+
+def remux_audio(audio_path: str) -> str:
+    """
+    Troca o contêiner do áudio para um formato aceito pelo Whisper sem recodificar.
+
+    Args:
+        audio_path: Caminho do arquivo de áudio original
+
+    Returns:
+        Caminho do arquivo remuxado (ou o original, se já for compatível)
+    """
+    if is_whisper_compatible(audio_path):
+        return audio_path
+
+    codec = probe_audio(audio_path)['codec_name']
+    container = CODEC_CONTAINERS.get(codec)
+    if not container:
+        raise ValueError(f'Codec de áudio sem contêiner compatível para remux: {codec or "desconhecido"}')
+
+    output_path = str(Path(audio_path).with_suffix(f'.{container}'))
+    remux_cmd = ['ffmpeg', '-v', 'quiet', '-i', audio_path, '-vn', '-acodec', 'copy', '-y', output_path]
+    subprocess.run(remux_cmd, capture_output=True, check=True)
+    Path(audio_path).unlink(missing_ok=True)
+
+    logger.info(f'Áudio remuxado sem recodificação ({codec} -> .{container}): {output_path}')
+    return output_path
+
+
+def find_downloaded_audio(info: Dict[str, Any], download_dir: str) -> Optional[str]:
+    """
+    Localiza o arquivo de áudio gerado pelo yt-dlp.
+
+    Usa o caminho final informado pelo yt-dlp (após os pós-processadores) e, como
+    alternativa, procura qualquer arquivo de áudio compatível no diretório de download.
+
+    Args:
+        info: Dict de informações retornado por `extract_info`
+        download_dir: Diretório onde o download foi feito
+
+    Returns:
+        Caminho do arquivo de áudio ou None se não encontrado
+    """
+    for download in info.get('requested_downloads') or []:
+        filepath = download.get('filepath')
+        if filepath and Path(filepath).exists():
+            return filepath
+
+    candidates = [
+        f
+        for f in Path(download_dir).iterdir()
+        if f.is_file() and f.suffix.lower().lstrip('.') in WHISPER_COMPATIBLE_EXTENSIONS + ('opus', 'weba', 'aac')
+    ]
+    return str(candidates[0]) if candidates else None
+
+
+def plan_fixed_segments(
+    duration_seconds: float, segment_seconds: float, overlap_seconds: float
+) -> List[Tuple[float, float]]:
+    """
+    Planeja segmentos de duração fixa com sobreposição.
+
+    Cada segmento (exceto o primeiro) começa `overlap_seconds` antes do seu limite nominal
+    e dura `segment_seconds + overlap_seconds`, mantendo a semântica de
+    AUDIO_SEGMENT_OVERLAP_SECONDS.
+
+    Args:
+        duration_seconds: Duração total do áudio
+        segment_seconds: Duração nominal de cada segmento
+        overlap_seconds: Sobreposição entre segmentos consecutivos
+
+    Returns:
+        Lista de tuplas (início, duração) em segundos
+    """
+    # Tolerância evita um segmento extra vazio por erro de arredondamento
+    num_segments = max(1, math.ceil(duration_seconds / segment_seconds - 1e-9))
+    plan = []
+    for i in range(num_segments):
+        start = i * segment_seconds
+        if i > 0:
+            start = max(0.0, start - overlap_seconds)
+        plan.append((start, segment_seconds + overlap_seconds))
+    return plan
+
+
+def _segment_path(output_dir: str, base_name: str, index: int, ext: str) -> str:
+    """Retorna o caminho padronizado de um segmento (índice a partir de 1)."""
+    return str(Path(output_dir) / f'{base_name}_segment_{index:02d}{ext}')
+
+
+def cut_segments(
+    audio_path: str,
+    plan: List[Tuple[float, float]],
+    output_dir: str,
+    batch_size: int = 16,
+) -> List[str]:
+    """
+    Corta o áudio nos segmentos planejados sem recodificar, com trabalho linear no tamanho do arquivo.
+
+    Sem sobreposição, usa o muxer `segment` do FFmpeg: um único processo lê o arquivo uma vez
+    e grava todos os segmentos. Com sobreposição, usa busca rápida na entrada (`-ss` antes de
+    `-i`), agrupando vários segmentos por processo, de modo que cada trecho do arquivo é lido
+    apenas pelo segmento que o contém (em vez de decodificar desde o início a cada corte).
+
+    Usado com o pipeline de transcrição desligado (TRANSCRIPTION_PIPELINE) e no corte dos
+    capítulos; o pipeline corta um segmento por vez com `cut_segment`.
+
+    Args:
+        audio_path: Caminho do áudio original
+        plan: Lista de tuplas (início, duração) em segundos
+        output_dir: Diretório onde os segmentos serão gravados
+        batch_size: Número máximo de segmentos por processo FFmpeg no modo com sobreposição
+
+    Returns:
+        Lista com os caminhos dos segmentos, na ordem do plano
+    """
+    ext = Path(audio_path).suffix
+    base_name = Path(audio_path).stem
+    has_overlap = any(
+        abs(start - (prev_start + prev_duration)) > 1e-6
+        for (prev_start, prev_duration), (start, _) in zip(plan, plan[1:])
+    )
+
+    if not has_overlap:
+        # Muxer de segmentos: uma passada, cortes nos limites planejados
+        boundaries = ','.join(f'{start:.3f}' for start, _ in plan[1:])
+        pattern = str(Path(output_dir) / f'{base_name}_segment_%02d{ext}')
+        segment_cmd = ['ffmpeg', '-v', 'error', '-i', audio_path, '-map', '0:a', '-c', 'copy', '-f', 'segment']
+        if boundaries:
+            segment_cmd += ['-segment_times', boundaries]
+        segment_cmd += ['-segment_start_number', '1', '-reset_timestamps', '1', '-y', pattern]
+        subprocess.run(segment_cmd, capture_output=True, check=True)
+        return [_segment_path(output_dir, base_name, i + 1, ext) for i in range(len(plan))]
+
+    segments = []
+    for batch_start in range(0, len(plan), batch_size):
+        batch = plan[batch_start : batch_start + batch_size]
+        inputs: List[str] = []
+        outputs: List[str] = []
+        for offset, (start, duration) in enumerate(batch):
+            index = batch_start + offset + 1
+            segment_path = _segment_path(output_dir, base_name, index, ext)
+            # Busca rápida na entrada: o FFmpeg salta direto para o ponto de início
+            inputs += ['-ss', f'{start:.3f}', '-t', f'{duration:.3f}', '-i', audio_path]
+            outputs += ['-map', f'{offset}:a', '-c', 'copy', '-y', segment_path]
+            segments.append(segment_path)
+
+        subprocess.run(['ffmpeg', '-v', 'error', *inputs, *outputs], capture_output=True, check=True)
+
+    return segments
+
+
+def detect_silences(audio_path: str, noise_db: float, min_duration: float) -> List[Tuple[float, float]]:
+    """
+    Detecta os trechos de silêncio do áudio com o filtro `silencedetect` do FFmpeg.
+
+    Args:
+        audio_path: Caminho do arquivo de áudio
+        noise_db: Nível (dB) abaixo do qual o áudio é considerado silêncio
+        min_duration: Duração mínima (segundos) de uma pausa
+
+    Returns:
+        Lista de tuplas (início, fim) de cada silêncio, em segundos
+    """
+    detect_cmd = [
+        'ffmpeg',
+        '-hide_banner',
+        '-nostats',
+        '-vn',
+        '-i',
+        audio_path,
+        '-af',
+        f'silencedetect=noise={noise_db}dB:duration={min_duration}',
+        '-f',
+        'null',
+        '-',
+    ]
+    result = subprocess.run(detect_cmd, capture_output=True, text=True, check=True)
+
+    silences = []
+    silence_start = None
+    for match in SILENCE_LOG_PATTERN.finditer(result.stderr):
+        kind, value = match.group(1), float(match.group(2))
+        if kind == 'start':
+            silence_start = max(0.0, value)
+        elif silence_start is not None:
+            silences.append((silence_start, value))
+            silence_start = None
+
+    return silences
+
+
+def plan_silence_segments(
+    duration_seconds: float,
+    silences: List[Tuple[float, float]],
+    max_segment_seconds: float,
+    overlap_seconds: float,
+    search_window_seconds: float,
+    min_last_segment_seconds: float = 0.0,
+) -> List[Tuple[float, float]]:
+    """
+    Planeja segmentos cortando no meio das pausas mais próximas do limite de duração.
+
+    Para cada corte, procura a pausa mais tardia dentro da janela que antecede o limite
+    `max_segment_seconds`. Cortes feitos em pausas não precisam de sobreposição; quando não
+    há pausa na janela, o corte é feito no limite e recebe `overlap_seconds` de sobreposição.
+    Um último segmento mais curto que `min_last_segment_seconds` é juntado ao anterior. Como a
+    junção sempre passa do limite (senão não haveria o último corte), o trecho é dividido de
+    novo na pausa mais tardia que deixa o último segmento com a duração mínima, ou ao meio,
+    com sobreposição, se não houver pausa.
+
+    Args:
+        duration_seconds: Duração total do áudio
+        silences: Lista de silêncios (início, fim) retornada por `detect_silences`
+        max_segment_seconds: Duração máxima de cada segmento
+        overlap_seconds: Sobreposição usada apenas nos cortes sem pausa
+        search_window_seconds: Janela antes do limite onde uma pausa é aceita
+        min_last_segment_seconds: Duração mínima do último segmento
+
+    Returns:
+        Lista de tuplas (início, duração) em segundos
+    """
+    cut_points = [(start + end) / 2 for start, end in silences]
+    plan = []
+    start = 0.0
+
+    while duration_seconds - start > max_segment_seconds:
+        limit = start + max_segment_seconds
+        candidates = [p for p in cut_points if limit - search_window_seconds <= p <= limit and p > start]
+
+        if candidates:
+            cut = max(candidates)
+            plan.append((start, cut - start))
+            start = cut
+        else:
+            cut = limit - overlap_seconds
+            plan.append((start, max_segment_seconds))
+            start = cut
+
+    plan.append((start, duration_seconds - start))
+
+    if len(plan) > 1 and plan[-1][1] < min_last_segment_seconds:
+        merged_start = plan[-2][0]
+        del plan[-2:]
+        candidates = [
+            p
+            for p in cut_points
+            if duration_seconds - max_segment_seconds <= p <= merged_start + max_segment_seconds
+            and p <= duration_seconds - min_last_segment_seconds
+        ]
+        if candidates:
+            cut = max(candidates)
+            plan.extend([(merged_start, cut - merged_start), (cut, duration_seconds - cut)])
+        else:
+            middle = (merged_start + duration_seconds) / 2
+            next_start = middle - overlap_seconds
+            plan.extend([(merged_start, middle - merged_start), (next_start, duration_seconds - next_start)])
+
+    return plan
+
+
+def plan_segments_by_size(
+    duration_seconds: float,
+    bit_rate: int,
+    max_bytes: int,
+    safety_margin: float,
+    overlap_seconds: float,
+) -> Dict[str, Any]:
+    """
+    Calcula o menor número de segmentos que cabem no limite de tamanho da API.
+
+    A duração máxima de cada segmento vem do bitrate real do arquivo e do limite em bytes
+    reduzido pela margem de segurança. Os segmentos são distribuídos de forma equilibrada,
+    já considerando a sobreposição entre eles.
+
+    Args:
+        duration_seconds: Duração total do áudio
+        bit_rate: Bitrate do arquivo em bits por segundo
+        max_bytes: Tamanho máximo aceito pela API em bytes
+        safety_margin: Fração do limite reservada como margem (ex.: 0.1 = 10%)
+        overlap_seconds: Sobreposição entre segmentos consecutivos
+
+    Returns:
+        Dict com 'count', 'segment_seconds' (duração nominal), 'max_segment_seconds'
+        (duração máxima que respeita o limite), 'estimated_bytes' (lista por segmento)
+        e 'plan' (lista de tuplas (início, duração))
+    """
+    usable_bytes = max_bytes * (1 - safety_margin)
+    max_segment_seconds = usable_bytes * 8 / bit_rate
+
+    if max_segment_seconds <= overlap_seconds:
+        raise ValueError(f'Bitrate muito alto para o limite da API: {bit_rate / 1000:.0f} kbps')
+
+    if duration_seconds <= max_segment_seconds:
+        count = 1
+    else:
+        count = math.ceil(duration_seconds / (max_segment_seconds - overlap_seconds))
+
+    segment_seconds = duration_seconds / count
+    if count > 1:
+        plan = plan_fixed_segments(duration_seconds, segment_seconds, overlap_seconds)
+    else:
+        plan = [(0.0, duration_seconds)]
+    estimated_bytes = [int(min(length, duration_seconds - start) * bit_rate / 8) for start, length in plan]
+
+    return {
+        'count': count,
+        'segment_seconds': segment_seconds,
+        'max_segment_seconds': max_segment_seconds,
+        'estimated_bytes': estimated_bytes,
+        'plan': plan,
+    }
+
+
+def convert_to_speech_profile(audio_path: str, output_dir: str, sample_rate: int, bitrate: str) -> str:
+    """
+    Converte o áudio para um perfil otimizado para fala (mono, Opus de baixo bitrate).
+
+    O Whisper trabalha internamente com áudio mono de 16 kHz, então reduzir canais, taxa de
+    amostragem e bitrate não afeta a transcrição e diminui muito o volume enviado.
+
+    Args:
+        audio_path: Caminho do áudio original
+        output_dir: Diretório onde o arquivo convertido será gravado
+        sample_rate: Taxa de amostragem de saída em Hz
+        bitrate: Bitrate do Opus no formato do FFmpeg (ex.: '24k')
+
+    Returns:
+        Caminho do arquivo convertido (.ogg)
+    """
+    output_path = str(Path(output_dir) / f'{Path(audio_path).stem}_fala.ogg')
+    convert_cmd = [
+        'ffmpeg',
+        '-v',
+        'error',
+        '-i',
+        audio_path,
+        '-vn',
+        '-ac',
+        '1',
+        '-ar',
+        str(sample_rate),
+        '-c:a',
+        'libopus',
+        '-b:a',
+        bitrate,
+        '-application',
+        'voip',
+        '-y',
+        output_path,
+    ]
+    subprocess.run(convert_cmd, capture_output=True, check=True)
+    return output_path
+
+
+def cut_segment(audio_path: str, start: float, duration: float, output_dir: str, index: int) -> str:
+    """
+    Corta um único segmento sem recodificar, com busca rápida na entrada.
+
+    Usado pelo pipeline de transcrição, que envia cada segmento assim que ele é gravado. O
+    muxer de `cut_segments` grava todos os segmentos de uma vez e não respeitaria o limite de
+    segmentos em disco (PIPELINE_MAX_PENDING_SEGMENTS); com a busca rápida na entrada, cada
+    corte lê apenas o seu trecho e o total lido continua linear no tamanho do arquivo.
+
+    Args:
+        audio_path: Caminho do áudio original
+        start: Início do segmento em segundos
+        duration: Duração do segmento em segundos
+        output_dir: Diretório onde o segmento será gravado
+        index: Posição do segmento (a partir de 1), usada no nome do arquivo
+
+    Returns:
+        Caminho do segmento gravado
+    """
+    segment_path = _segment_path(output_dir, Path(audio_path).stem, index, Path(audio_path).suffix)
+    cut_cmd = [
+        'ffmpeg',
+        '-v',
+        'error',
+        '-ss',
+        f'{start:.3f}',
+        '-t',
+        f'{duration:.3f}',
+        '-i',
+        audio_path,
+        '-map',
+        '0:a',
+        '-c',
+        'copy',
+        '-y',
+        segment_path,
+    ]
+    subprocess.run(cut_cmd, capture_output=True, check=True)
+    return segment_path
@@ -0,0 +1,279 @@
+"""
+Caches em disco usados pelo pipeline.
+
+`LRUDiskCache` guarda arquivos com despejo LRU limitado por tamanho. Cada entrada é um
+diretório nomeado pelo hash da chave, contendo um ou mais arquivos. O horário de modificação
+do diretório marca o último acesso, o que permite despejar as entradas menos usadas
+recentemente quando o limite de tamanho é ultrapassado. Documentos JSON (ex.: respostas
+do GPT) podem ser guardados diretamente com `put_json`/`get_json`.
+
+`JSONTTLCache` guarda documentos JSON pequenos com tempo de expiração (ex.: metadados do yt-dlp).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: object) -> str:
+    """Gera uma chave estável (SHA-256) a partir das partes informadas."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calcula o SHA-256 de um arquivo lendo em blocos (sem carregar o arquivo inteiro na memória).
+
+    Args:
+        path: Caminho do arquivo
+        chunk_size: Tamanho de cada bloco lido em bytes
+
+    Returns:
+        Hash hexadecimal do conteúdo
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LRUDiskCache:
+    """Cache de arquivos em disco com limite de tamanho e despejo LRU."""
+
+    def __init__(self, cache_dir: str, max_size_mb: float):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache_dir: Diretório onde as entradas serão armazenadas
+            max_size_mb: Tamanho máximo total do cache em MB (0 desativa o limite)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+    def entry_dir(self, key: str) -> Path:
+        """Retorna o diretório de uma entrada (existente ou não)."""
+        return self.cache_dir / key
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Busca uma entrada no cache e marca o acesso.
+
+        Args:
+            key: Chave da entrada
+
+        Returns:
+            Diretório da entrada ou None se não existir
+        """
+        entry = self.entry_dir(key)
+        if not entry.is_dir() or not any(entry.iterdir()):
+            return None
+
+        self._touch(entry)
+        return entry
+
+    def put(self, key: str, files: Iterable[Path]) -> Path:
+        """
+        Move arquivos para uma nova entrada do cache e aplica o limite de tamanho.
+
+        Args:
+            key: Chave da entrada
+            files: Arquivos a serem movidos para a entrada
+
+        Returns:
+            Diretório da entrada criada
+        """
+        entry = self.entry_dir(key)
+        tmp_entry = self.cache_dir / f'.{key}.tmp'
+        if tmp_entry.exists():
+            shutil.rmtree(tmp_entry)
+        tmp_entry.mkdir(parents=True)
+
+        for file_path in files:
+            shutil.move(str(file_path), str(tmp_entry / Path(file_path).name))
+
+        # Publica a entrada de forma atômica para não expor entradas incompletas
+        if entry.exists():
+            shutil.rmtree(entry)
+        os.replace(tmp_entry, entry)
+        self._touch(entry)
+
+        self.evict(keep={key})
+        return entry
+
+    def get_json(self, key: str, name: str) -> Optional[Any]:
+        """
+        Lê um documento JSON de uma entrada do cache e marca o acesso.
+
+        Args:
+            key: Chave da entrada
+            name: Nome do arquivo dentro da entrada
+
+        Returns:
+            Documento armazenado ou None se ausente ou corrompido
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        try:
+            with open(entry / name, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put_json(self, key: str, name: str, data: Any) -> Path:
+        """
+        Grava um documento JSON como nova entrada do cache e aplica o limite de tamanho.
+
+        Args:
+            key: Chave da entrada
+            name: Nome do arquivo dentro da entrada
+            data: Documento serializável em JSON
+
+        Returns:
+            Diretório da entrada criada
+        """
+        # Diretórios iniciados por '.' não são listados como entradas
+        tmp_dir = Path(tempfile.mkdtemp(prefix='.', dir=self.cache_dir))
+        try:
+            with open(tmp_dir / name, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            return self.put(key, [tmp_dir / name])
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def remove(self, key: str) -> None:
+        """Remove uma entrada do cache, se existir."""
+        entry = self.entry_dir(key)
+        if entry.exists():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def size_bytes(self) -> int:
+        """Retorna o tamanho total ocupado pelo cache."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep: Iterable[str] = ()) -> List[str]:
+        """
+        Remove as entradas menos usadas até respeitar o limite de tamanho.
+
+        Args:
+            keep: Chaves que não devem ser removidas (ex.: a entrada recém-criada)
+
+        Returns:
+            Lista com as chaves removidas
+        """
+        if self.max_size_bytes <= 0:
+            return []
+
+        keep = set(keep)
+        entries = sorted(self._entries(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in entries)
+        removed = []
+
+        for entry, size, _ in entries:
+            if total <= self.max_size_bytes:
+                break
+            if entry.name in keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed.append(entry.name)
+            logger.info(f'Entrada removida do cache (LRU): {entry.name[:12]}')
+
+        return removed
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """Lista as entradas como (diretório, tamanho em bytes, último acesso)."""
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if not entry.is_dir() or entry.name.startswith('.'):
+                continue
+            size = sum(f.stat().st_size for f in entry.rglob('*') if f.is_file())
+            entries.append((entry, size, entry.stat().st_mtime))
+        return entries
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        """Atualiza o horário de acesso de uma entrada."""
+        try:
+            os.utime(entry, None)
+        except OSError:
+            pass
+
+
+class JSONTTLCache:
+    """Cache de documentos JSON em disco com tempo de expiração."""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache_dir: Diretório onde os documentos serão armazenados
+            ttl_seconds: Tempo de validade de cada documento em segundos (0 desativa a expiração)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        """Retorna o caminho do arquivo de uma chave."""
+        return self.cache_dir / f'{make_cache_key(key)}.json'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um documento válido no cache.
+
+        Args:
+            key: Chave do documento
+
+        Returns:
+            Documento armazenado ou None se ausente, expirado ou corrompido
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if self.ttl_seconds > 0 and time.time() - record.get('stored_at', 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        return record.get('data')
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Armazena um documento no cache.
+
+        Args:
+            key: Chave do documento
+            data: Documento serializável em JSON
+        """
+        path = self._path(key)
+        # Arquivo temporário exclusivo: gravações simultâneas da mesma chave não se misturam
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'stored_at': time.time(), 'key': key, 'data': data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
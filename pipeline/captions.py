@@ -0,0 +1,246 @@
+"""
+Legendas do YouTube como atalho para a transcrição.
+
+Converte legendas (manuais ou automáticas) nos formatos WebVTT e SRV (XML timedtext)
+para a mesma estrutura produzida pelos backends de transcrição: 'text', 'duration' e
+'words' como lista de [texto, início, fim]. Legendas automáticas do YouTube trazem o
+tempo de cada palavra; nas manuais, o tempo de cada bloco é dividido entre suas palavras.
+"""
+
+import html
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_VTT_TIMING_PATTERN = re.compile(r'((?:\d+:)?\d{2}:\d{2}\.\d{3})\s+-->\s+((?:\d+:)?\d{2}:\d{2}\.\d{3})')
+_VTT_INLINE_TIME_PATTERN = re.compile(r'<((?:\d+:)?\d{2}:\d{2}\.\d{3})>')
+_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+
+def _parse_timestamp(value: str) -> float:
+    """Converte 'hh:mm:ss.mmm' ou 'mm:ss.mmm' em segundos."""
+    seconds = 0.0
+    for part in value.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _clean_text(text: str) -> str:
+    """Remove tags e entidades HTML de um trecho de legenda."""
+    return html.unescape(_TAG_PATTERN.sub('', text)).strip()
+
+
+def _spread_words(text: str, start: float, end: float) -> List[List[Any]]:
+    """Divide igualmente o intervalo de um trecho entre as suas palavras."""
+    tokens = text.split()
+    if not tokens:
+        return []
+    step = max(end - start, 0) / len(tokens)
+    return [[token, start + i * step, start + (i + 1) * step] for i, token in enumerate(tokens)]
+
+
+def _build_transcription(words: List[List[Any]]) -> Dict[str, Any]:
+    """Monta a estrutura de transcrição a partir das palavras."""
+    return {
+        'text': ' '.join(word[0] for word in words),
+        'duration': words[-1][2] if words else 0,
+        'words': words,
+    }
+
+
+def _parse_vtt_cues(content: str) -> List[Tuple[float, float, List[str]]]:
+    """Separa um arquivo WebVTT em blocos (início, fim, linhas brutas)."""
+    cues = []
+    # Linhas só com espaços não separam blocos (o YouTube as usa dentro das legendas automáticas)
+    for block in re.split(r'\r?\n\r?\n', content):
+        lines = block.strip().splitlines()
+        for i, line in enumerate(lines):
+            match = _VTT_TIMING_PATTERN.search(line)
+            if match:
+                start, end = (_parse_timestamp(value) for value in match.groups())
+                cues.append((start, end, lines[i + 1 :]))
+                break
+    return cues
+
+
+def parse_vtt(content: str) -> Dict[str, Any]:
+    """
+    Converte uma legenda WebVTT na estrutura de transcrição.
+
+    Nas legendas automáticas do YouTube, cada bloco repete a linha anterior sem marcações
+    e traz a linha nova com o tempo de cada palavra (`<00:00:01.599><c> palavra</c>`);
+    apenas as linhas com tempos por palavra são usadas. Nas demais legendas, linhas
+    repetidas entre blocos consecutivos (legendas "roladas") são descartadas.
+
+    Args:
+        content: Conteúdo do arquivo .vtt
+
+    Returns:
+        Dict com 'text', 'duration' e 'words'
+    """
+    cues = _parse_vtt_cues(content)
+    has_word_timing = any(_VTT_INLINE_TIME_PATTERN.search(line) for _, _, lines in cues for line in lines)
+
+    words: List[List[Any]] = []
+    previous_lines: List[str] = []
+    for start, end, lines in cues:
+        if has_word_timing:
+            for line in lines:
+                if not _VTT_INLINE_TIME_PATTERN.search(line):
+                    continue
+                # Alterna texto e tempo: o primeiro trecho começa no início do bloco
+                parts = _VTT_INLINE_TIME_PATTERN.split(line)
+                times = [start] + [_parse_timestamp(value) for value in parts[1::2]]
+                texts = parts[0::2]
+                for i, text in enumerate(texts):
+                    word_end = times[i + 1] if i + 1 < len(times) else end
+                    words.extend(_spread_words(_clean_text(text), times[i], word_end))
+            continue
+
+        cleaned = [_clean_text(line) for line in lines]
+        cleaned = [line for line in cleaned if line]
+        new_lines = [line for line in cleaned if line not in previous_lines]
+        words.extend(_spread_words(' '.join(new_lines), start, end))
+        previous_lines = cleaned
+
+    return _build_transcription(words)
+
+
+def parse_srv(content: str) -> Dict[str, Any]:
+    """
+    Converte uma legenda SRV (XML timedtext do YouTube) na estrutura de transcrição.
+
+    Suporta o formato srv1/srv2 (`<text start dur>` em segundos ou `<text t d>` em ms) e o
+    srv3 (`<p t d>` em ms, com `<s t>` por palavra relativo ao início do parágrafo).
+
+    Args:
+        content: Conteúdo do arquivo .srv1/.srv2/.srv3
+
+    Returns:
+        Dict com 'text', 'duration' e 'words'
+    """
+    root = ET.fromstring(content)
+    words: List[List[Any]] = []
+
+    for element in root.iter():
+        if element.tag == 'text':
+            if 'start' in element.attrib:
+                start = float(element.get('start'))
+                end = start + float(element.get('dur', 0))
+            else:
+                start = int(element.get('t', 0)) / 1000
+                end = start + int(element.get('d', 0)) / 1000
+            words.extend(_spread_words(_clean_text(element.text or ''), start, end))
+
+        elif element.tag == 'p':
+            start = int(element.get('t', 0)) / 1000
+            end = start + int(element.get('d', 0)) / 1000
+            spans = list(element.iter('s'))
+            if not spans:
+                words.extend(_spread_words(_clean_text(''.join(element.itertext())), start, end))
+                continue
+
+            times = [start + int(span.get('t', 0)) / 1000 for span in spans]
+            for i, span in enumerate(spans):
+                span_end = times[i + 1] if i + 1 < len(times) else end
+                words.extend(_spread_words(_clean_text(span.text or ''), times[i], span_end))
+
+    words.sort(key=lambda word: word[1])
+    return _build_transcription(words)
+
+
+def parse_captions(path: str) -> Dict[str, Any]:
+    """
+    Converte um arquivo de legenda, escolhendo o parser pela extensão.
+
+    Args:
+        path: Caminho do arquivo (.vtt, .srv1, .srv2 ou .srv3)
+
+    Returns:
+        Dict com 'text', 'duration' e 'words'
+    """
+    content = Path(path).read_text(encoding='utf-8')
+    if Path(path).suffix.lower() == '.vtt':
+        return parse_vtt(content)
+    return parse_srv(content)
+
+
+def caption_track_languages(languages: Sequence[str]) -> List[str]:
+    """Idiomas a pedir ao yt-dlp: os aceitos e suas faixas automáticas originais ('<idioma>-orig')."""
+    return list(languages) + [f'{language}-orig' for language in languages]
+
+
+def is_original_caption(track_language: str, video_language: Optional[str]) -> bool:
+    """
+    Indica se uma faixa automática está no idioma original do vídeo.
+
+    O YouTube oferece legendas automáticas traduzidas por máquina para vários idiomas; o
+    yt-dlp marca a faixa reconhecida do próprio áudio como '<idioma>-orig'. Sem essa marca,
+    a faixa só é aceita se o idioma coincidir com o do vídeo (campo 'language' do yt-dlp).
+
+    Args:
+        track_language: Código da faixa (ex.: 'pt', 'en-orig')
+        video_language: Idioma do vídeo informado pelo yt-dlp, se conhecido
+
+    Returns:
+        True se a faixa não é uma tradução automática
+    """
+    if track_language.endswith('-orig'):
+        return True
+    if not video_language:
+        return False
+    return track_language.split('-')[0].lower() == video_language.split('-')[0].lower()
+
+
+def select_caption_track(
+    requested_subtitles: Dict[str, Dict[str, Any]],
+    manual_languages: Sequence[str],
+    languages: Sequence[str],
+    video_language: Optional[str] = None,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Escolhe a legenda baixada mais adequada, preferindo legendas manuais.
+
+    Faixas automáticas só são aceitas no idioma original do vídeo (veja is_original_caption);
+    traduções automáticas são ignoradas.
+
+    Args:
+        requested_subtitles: Campo 'requested_subtitles' do yt-dlp (idioma -> faixa)
+        manual_languages: Idiomas com legenda manual disponível
+        languages: Idiomas aceitos, em ordem de preferência
+        video_language: Idioma do vídeo informado pelo yt-dlp, se conhecido
+
+    Returns:
+        Tupla (idioma, faixa) ou None se nenhuma legenda aceita foi baixada
+    """
+    requested_subtitles = requested_subtitles or {}
+    available = []
+    for track_language in caption_track_languages(languages):
+        if not requested_subtitles.get(track_language, {}).get('filepath'):
+            continue
+        if track_language in manual_languages or is_original_caption(track_language, video_language):
+            available.append(track_language)
+    if not available:
+        return None
+    available.sort(key=lambda lang: lang not in manual_languages)
+    return available[0], requested_subtitles[available[0]]
+
+
+def is_caption_usable(transcription: Dict[str, Any], duration: float, min_words_per_minute: float) -> bool:
+    """
+    Verifica se a legenda cobre o vídeo com densidade de palavras suficiente.
+
+    Args:
+        transcription: Transcrição obtida da legenda
+        duration: Duração do vídeo em segundos (0 se desconhecida)
+        min_words_per_minute: Mínimo de palavras por minuto de vídeo
+
+    Returns:
+        True se a legenda pode substituir a transcrição do áudio
+    """
+    words = transcription.get('words') or []
+    duration = duration or transcription.get('duration') or 0
+    if not words or duration <= 0:
+        return False
+    return len(words) / (duration / 60) >= min_words_per_minute
@@ -0,0 +1,85 @@
+"""
+Checkpoints de transcrição por segmento.
+
+Cada job de transcrição segmentada tem um diretório próprio, fora do diretório temporário,
+onde a transcrição de cada segmento é gravada assim que retorna. Se o job falhar, uma nova
+execução com o mesmo áudio e o mesmo plano de segmentos envia apenas os segmentos que faltam.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionCheckpoint:
+    """Armazena as transcrições concluídas de cada segmento de um job."""
+
+    def __init__(self, checkpoint_dir: str, job_id: str):
+        """
+        Inicializa o checkpoint do job.
+
+        Args:
+            checkpoint_dir: Diretório base dos checkpoints
+            job_id: Identificador do job (ex.: hash do áudio e das configurações)
+        """
+        self.job_dir = Path(checkpoint_dir) / job_id
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+
+    def _segment_file(self, index: int) -> Path:
+        """Retorna o arquivo de checkpoint de um segmento (índice a partir de 1)."""
+        return self.job_dir / f'segment_{index:03d}.json'
+
+    def bind_plan(self, plan: List[Tuple[float, float]]) -> int:
+        """
+        Associa o plano de segmentos ao job, descartando checkpoints de um plano diferente.
+
+        Args:
+            plan: Lista de tuplas (início, duração) dos segmentos
+
+        Returns:
+            Número de segmentos já concluídos que serão reaproveitados
+        """
+        plan_file = self.job_dir / 'plan.json'
+        normalized = [[round(start, 3), round(duration, 3)] for start, duration in plan]
+
+        if plan_file.exists():
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored != normalized:
+                logger.info('Plano de segmentos mudou, descartando checkpoints anteriores')
+                for segment_file in self.job_dir.glob('segment_*.json'):
+                    segment_file.unlink()
+
+        with open(plan_file, 'w', encoding='utf-8') as f:
+            json.dump(normalized, f)
+
+        return len(list(self.job_dir.glob('segment_*.json')))
+
+    def load(self, index: int) -> Optional[Dict[str, Any]]:
+        """Retorna a transcrição salva de um segmento ou None se ainda não foi concluída."""
+        segment_file = self._segment_file(index)
+        if not segment_file.exists():
+            return None
+
+        try:
+            with open(segment_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def save(self, index: int, result: Dict[str, Any]) -> None:
+        """Grava a transcrição de um segmento de forma atômica."""
+        segment_file = self._segment_file(index)
+        tmp_file = segment_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_file, segment_file)
+
+    def clear(self) -> None:
+        """Remove o diretório do job (chamado quando a transcrição termina com sucesso)."""
+        shutil.rmtree(self.job_dir, ignore_errors=True)
@@ -0,0 +1,100 @@
+"""
+Divisão de transcrições longas em partes para a geração do ebook por capítulos.
+
+As partes respeitam o fim das frases sempre que possível, para que cada chamada ao GPT
+receba trechos com sentido completo. Uma frase maior que o limite é dividida por palavras.
+No modo com esboço, as partes são blocos numerados e o esboço indica onde cada capítulo começa.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+_SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?…])\s+')
+
+
+def split_transcript(text: str, max_chars: int) -> List[str]:
+    """
+    Divide a transcrição em partes de até max_chars caracteres, quebrando no fim das frases.
+
+    Args:
+        text: Texto completo da transcrição
+        max_chars: Tamanho máximo de cada parte em caracteres
+
+    Returns:
+        Lista de partes, na ordem original (vazia se o texto estiver vazio)
+    """
+    if not text.strip():
+        return []
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    def flush() -> None:
+        nonlocal current, current_len
+        if current:
+            chunks.append(' '.join(current))
+        current, current_len = [], 0
+
+    for sentence in _SENTENCE_END_PATTERN.split(text.strip()):
+        pieces = [sentence]
+        if len(sentence) > max_chars:
+            # Frase maior que o limite: divide por palavras
+            pieces, words = [], []
+            for word in sentence.split():
+                if words and len(' '.join(words)) + 1 + len(word) > max_chars:
+                    pieces.append(' '.join(words))
+                    words = []
+                words.append(word)
+            if words:
+                pieces.append(' '.join(words))
+
+        for piece in pieces:
+            if current and current_len + 1 + len(piece) > max_chars:
+                flush()
+            current.append(piece)
+            current_len += len(piece) + (1 if current_len else 0)
+
+    flush()
+    return chunks
+
+
+def assign_outline_spans(outline_chapters: List[Dict[str, Any]], block_count: int) -> List[Tuple[int, int]]:
+    """
+    Converte os blocos indicados no esboço em intervalos contíguos que cobrem toda a transcrição.
+
+    O esboço indica o primeiro bloco de cada capítulo ('start_block', a partir de 1). Cada
+    capítulo vai do seu primeiro bloco até o bloco anterior ao início do seguinte, de modo que
+    nenhum trecho fica de fora ou é repetido, mesmo que o modelo erre os limites. Blocos
+    inválidos são substituídos por uma divisão igual da transcrição entre os capítulos.
+
+    Args:
+        outline_chapters: Capítulos do esboço, na ordem do ebook
+        block_count: Quantidade de blocos numerados da transcrição
+
+    Returns:
+        Lista de tuplas (início, fim) de índices de blocos (fim exclusivo, base 0)
+    """
+    total = len(outline_chapters)
+    starts = []
+    for i, chapter in enumerate(outline_chapters):
+        try:
+            start = int(chapter.get('start_block')) - 1
+        except (TypeError, ValueError):
+            start = -1
+        if not 0 <= start < block_count:
+            start = i * block_count // total
+        starts.append(start)
+
+    # Mantém os inícios em ordem crescente (ao menos um bloco por capítulo, se houver blocos
+    # suficientes) e o primeiro capítulo a partir do bloco 0
+    starts[0] = 0
+    step = 1 if block_count >= total else 0
+    for i in range(1, total):
+        starts[i] = max(starts[i], starts[i - 1] + step)
+    for i in range(total - 1, 0, -1):
+        limit = starts[i + 1] - step if i + 1 < total else block_count - 1
+        starts[i] = max(min(starts[i], limit), 0)
+
+    ends = starts[1:] + [block_count]
+    return [(start, max(end, min(start + 1, block_count))) for start, end in zip(starts, ends)]
@@ -0,0 +1,129 @@
+"""
+Correção tolerante de JSON gerado pelo GPT.
+
+Corrige em uma única passada, em tempo linear, os problemas mais comuns das respostas:
+blocos de código markdown e texto antes ou depois do JSON, vírgulas sobrando antes de
+'}' ou ']', chaves e valores entre aspas simples, quebras de linha e caracteres de
+controle dentro das strings. O trecho entre aspas é copiado em blocos (sem backtracking),
+o que mantém o custo baixo mesmo em respostas de dezenas de KB.
+"""
+
+import re
+from typing import List
+
+# Trechos de string sem aspas, barras invertidas ou caracteres de controle
+_STRING_RUNS = {
+    '"': re.compile(r'[^"\\\x00-\x1f]+'),
+    "'": re.compile(r'[^\'"\\\x00-\x1f]+'),
+}
+# Fora das strings: espaços, números, true/false/null e ':' são copiados em blocos
+_PLAIN_RUN = re.compile(r'[ \t\n\r0-9A-Za-z.:+\-]+')
+_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+
+
+def _copy_string(text: str, pos: int, quote: str, out: List[str]) -> int:
+    """
+    Copia a string que começa em `pos` como string JSON entre aspas duplas.
+
+    Returns:
+        Posição logo após a aspa de fechamento (ou o fim do texto se a string não fechar)
+    """
+    run = _STRING_RUNS[quote]
+    end = len(text)
+    out.append('"')
+    pos += 1
+
+    while pos < end:
+        match = run.match(text, pos)
+        if match:
+            out.append(match.group())
+            pos = match.end()
+            if pos >= end:
+                break
+
+        char = text[pos]
+        if char == quote:
+            out.append('"')
+            return pos + 1
+        if char == '\\':
+            escaped = text[pos + 1 : pos + 2]
+            # \' só é válido dentro de aspas simples; em JSON vira apenas '
+            out.append("'" if escaped == "'" else '\\' + escaped)
+            pos += 2
+            continue
+        if char == '"':
+            # Aspas duplas dentro de uma string entre aspas simples
+            out.append('\\"')
+        elif char in _CONTROL_ESCAPES:
+            out.append(_CONTROL_ESCAPES[char])
+        # Demais caracteres de controle são descartados
+        pos += 1
+
+    return end
+
+
+def repair_json(text: str) -> str:
+    """
+    Corrige uma resposta JSON malformada em uma única passada.
+
+    O texto antes do primeiro '{' ou '[' e depois do fechamento do valor raiz é ignorado.
+    Uma resposta truncada não é completada: o resultado continua inválido e o erro
+    aparece no json.loads, em vez de um ebook com o final cortado.
+
+    Args:
+        text: Resposta textual do GPT
+
+    Returns:
+        Texto JSON corrigido (pode continuar inválido se o problema não for reconhecido)
+    """
+    starts = [index for index in (text.find('{'), text.find('[')) if index >= 0]
+    if not starts:
+        return text
+
+    out: List[str] = []
+    depth = 0
+    pending_comma = None  # Índice em `out` da última vírgula ainda sem valor depois dela
+    pos = min(starts)
+    end = len(text)
+
+    while pos < end:
+        char = text[pos]
+
+        if char == '"' or char == "'":
+            pos = _copy_string(text, pos, char, out)
+            pending_comma = None
+            continue
+
+        match = _PLAIN_RUN.match(text, pos)
+        if match:
+            run = match.group()
+            out.append(run)
+            if not run.isspace():
+                pending_comma = None
+            pos = match.end()
+            continue
+
+        pos += 1
+        if char == ',':
+            pending_comma = len(out)
+            out.append(char)
+            continue
+        if char.isspace():
+            out.append(char)
+            continue
+        if not char.isprintable():
+            continue
+
+        if char in '{[':
+            depth += 1
+        elif char in '}]':
+            if pending_comma is not None:
+                out[pending_comma] = ''
+            depth -= 1
+
+        pending_comma = None
+        out.append(char)
+        if depth == 0:
+            break
+
+    return ''.join(out)
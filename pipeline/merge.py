@@ -0,0 +1,136 @@
+"""
+Combinação das transcrições de segmentos sobrepostos.
+
+Quando os segmentos têm sobreposição, o trecho repetido aparece duas vezes se os textos
+forem simplesmente concatenados. Aqui os timestamps por palavra e o offset de cada
+segmento são usados para localizar a região duplicada, alinhar as palavras repetidas e
+manter apenas uma cópia delas.
+"""
+
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Quantidade mínima de palavras iguais em sequência para aceitar um alinhamento
+MIN_ALIGNMENT_WORDS = 2
+
+_NORMALIZE_PATTERN = re.compile(r'[^\w]+', re.UNICODE)
+
+
+def _normalize(word: str) -> str:
+    """Normaliza uma palavra para comparação (minúsculas, sem pontuação)."""
+    return _NORMALIZE_PATTERN.sub('', word).lower()
+
+
+def _longest_common_run(left: Sequence[str], right: Sequence[str]) -> Tuple[int, int, int]:
+    """
+    Encontra a maior sequência contígua de palavras comum às duas listas.
+
+    Returns:
+        Tupla (início em left, início em right, tamanho)
+    """
+    best = (0, 0, 0)
+    previous = [0] * (len(right) + 1)
+    for i in range(1, len(left) + 1):
+        current = [0] * (len(right) + 1)
+        for j in range(1, len(right) + 1):
+            if left[i - 1] and left[i - 1] == right[j - 1]:
+                current[j] = previous[j - 1] + 1
+                if current[j] > best[2]:
+                    best = (i - current[j], j - current[j], current[j])
+        previous = current
+    return best
+
+
+def _word_positions(text: str, words: Sequence[Sequence[Any]]) -> List[int]:
+    """
+    Localiza no texto o início de cada palavra dos timestamps, em ordem.
+
+    Os tokens do texto e as palavras com timestamp nem sempre coincidem (palavras com hífen,
+    números e pontuação são divididos de formas diferentes), por isso o corte do texto é feito
+    pela posição de cada palavra, e não pela quantidade de tokens. Uma palavra não encontrada
+    fica na posição corrente.
+
+    Returns:
+        Índice do caractere de início de cada palavra em `text`
+    """
+    positions = []
+    cursor = 0
+    for word in words:
+        token = str(word[0]).strip()
+        match = re.compile(rf'(?<!\w){re.escape(token)}', re.IGNORECASE).search(text, cursor) if token else None
+        if match:
+            positions.append(match.start())
+            cursor = match.end()
+        else:
+            positions.append(cursor)
+    return positions
+
+
+def merge_segment_transcripts(results: List[Dict[str, Any]], offsets: List[float]) -> Dict[str, Any]:
+    """
+    Combina transcrições de segmentos removendo as palavras duplicadas na sobreposição.
+
+    Para cada par de segmentos consecutivos, a região sobreposta vai do início do segmento
+    seguinte ao fim do anterior. Nessa região, as palavras dos dois lados são alinhadas pela
+    maior sequência comum; sem alinhamento confiável, o corte é feito no meio da região.
+    O texto (com pontuação) é cortado na posição das palavras removidas.
+
+    Args:
+        results: Transcrições dos segmentos ('text', 'duration' e 'words' relativos ao segmento)
+        offsets: Início de cada segmento no áudio original, em segundos
+
+    Returns:
+        Dict com 'text', 'words' (na linha do tempo original) e 'overlap_words_removed'
+    """
+    merged_words: List[List[Any]] = []
+    merged_text = ''
+    merged_positions: List[int] = []  # Início de cada palavra de merged_words em merged_text
+    removed = 0
+    previous_end = None
+
+    for result, offset in zip(results, offsets):
+        words = [[word, start + offset, end + offset] for word, start, end in result.get('words', [])]
+        text = result['text'].strip()
+        positions = _word_positions(text, words)
+        drop_previous = drop_next = 0
+
+        if previous_end is not None and offset < previous_end and words:
+            tail_start = len(merged_words)
+            while tail_start > 0 and merged_words[tail_start - 1][1] >= offset:
+                tail_start -= 1
+            tail = merged_words[tail_start:]
+            head = [w for w in words if w[1] < previous_end]
+
+            left, right, size = _longest_common_run([_normalize(w[0]) for w in tail], [_normalize(w[0]) for w in head])
+            if size >= MIN_ALIGNMENT_WORDS:
+                # Mantém o segmento anterior até o trecho alinhado e o seguinte a partir dele
+                drop_previous = len(tail) - left
+                drop_next = right
+            else:
+                cut = (offset + previous_end) / 2
+                drop_previous = sum(1 for w in tail if w[1] >= cut)
+                drop_next = sum(1 for w in head if w[1] < cut)
+
+        if drop_previous:
+            merged_text = merged_text[: merged_positions[-drop_previous]].rstrip()
+            del merged_words[-drop_previous:]
+            del merged_positions[-drop_previous:]
+
+        if not drop_next:
+            text_start = 0
+        else:
+            text_start = positions[drop_next] if drop_next < len(positions) else len(text)
+        piece = text[text_start:]
+        separator = ' ' if merged_text and piece else ''
+        base = len(merged_text) + len(separator) - text_start
+        merged_text += separator + piece
+        merged_words.extend(words[drop_next:])
+        merged_positions.extend(base + position for position in positions[drop_next:])
+        removed += drop_previous + drop_next
+        previous_end = offset + result.get('duration', 0)
+
+    return {
+        'text': merged_text,
+        'words': merged_words,
+        'overlap_words_removed': removed,
+    }
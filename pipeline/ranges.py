@@ -0,0 +1,144 @@
+"""
+Seleção de um trecho do vídeo (intervalo de tempo ou capítulo do YouTube).
+
+O trecho é resolvido a partir das informações do yt-dlp (duração e capítulos) e usado
+para baixar apenas a parte selecionada do áudio. As transcrições do trecho usam a linha
+do tempo do vídeo original, deslocando ou recortando os timestamps por palavra.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Um trecho resolvido como (início, fim, título do capítulo ou None)
+TimeRange = Tuple[float, float, Optional[str]]
+
+
+def parse_time(value: Union[str, float, int, None]) -> Optional[float]:
+    """
+    Converte um instante em segundos.
+
+    Args:
+        value: Segundos (número ou texto) ou 'hh:mm:ss' / 'mm:ss', com fração opcional
+
+    Returns:
+        Segundos ou None se o valor estiver vazio
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    seconds = 0.0
+    for part in str(value).strip().split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def extract_chapters(info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extrai os capítulos do YouTube das informações do yt-dlp, contíguos e ordenados.
+
+    O primeiro capítulo passa a começar em 0 e cada um termina onde o seguinte começa, de
+    modo que os capítulos cobrem o vídeo inteiro e podem ser cortados em uma única passada.
+
+    Args:
+        info: Dict de informações do yt-dlp
+
+    Returns:
+        Lista de dicts com 'title', 'start_time' e 'end_time' (vazia se o vídeo não tiver capítulos)
+    """
+    raw = sorted(info.get('chapters') or [], key=lambda c: c.get('start_time') or 0)
+    duration = float(info.get('duration') or (raw[-1].get('end_time') if raw else 0) or 0)
+
+    chapters = []
+    for i, chapter in enumerate(raw):
+        start = 0.0 if i == 0 else float(chapter.get('start_time') or 0)
+        end = float(raw[i + 1]['start_time']) if i + 1 < len(raw) else duration
+        if end > start:
+            chapters.append(
+                {'title': chapter.get('title') or f'Capítulo {i + 1}', 'start_time': start, 'end_time': end}
+            )
+    return chapters
+
+
+def resolve_time_range(
+    start: Union[str, float, None] = None,
+    end: Union[str, float, None] = None,
+    chapter: Optional[str] = None,
+    chapters: Optional[List[Dict[str, Any]]] = None,
+    duration: Optional[float] = None,
+) -> Optional[TimeRange]:
+    """
+    Resolve o trecho selecionado a partir de início/fim ou de um capítulo.
+
+    Args:
+        start: Início do trecho (segundos ou 'hh:mm:ss')
+        end: Fim do trecho (segundos ou 'hh:mm:ss'); sem fim, vai até o final do vídeo
+        chapter: Número (a partir de 1) ou parte do título de um capítulo do YouTube
+        chapters: Capítulos do yt-dlp ('title', 'start_time', 'end_time')
+        duration: Duração total do vídeo em segundos
+
+    Returns:
+        Tupla (início, fim, título do capítulo) ou None se nenhum trecho foi selecionado
+
+    Raises:
+        ValueError: Se o capítulo não existir ou o intervalo for inválido
+    """
+    if chapter:
+        chapters = chapters or []
+        if str(chapter).isdigit() and 1 <= int(chapter) <= len(chapters):
+            selected = chapters[int(chapter) - 1]
+        else:
+            matches = [c for c in chapters if str(chapter).lower() in (c.get('title') or '').lower()]
+            if not matches:
+                raise ValueError(f'Capítulo não encontrado: {chapter}')
+            selected = matches[0]
+        return float(selected['start_time']), float(selected['end_time']), selected.get('title')
+
+    start_seconds = parse_time(start)
+    end_seconds = parse_time(end)
+    if start_seconds is None and end_seconds is None:
+        return None
+
+    start_seconds = start_seconds or 0.0
+    if end_seconds is None:
+        end_seconds = float(duration) if duration else float('inf')
+    elif duration:
+        end_seconds = min(end_seconds, float(duration))
+
+    if start_seconds < 0 or end_seconds <= start_seconds:
+        raise ValueError(f'Intervalo inválido: {start_seconds}s a {end_seconds}s')
+    return start_seconds, end_seconds, None
+
+
+def offset_transcription(transcription: Dict[str, Any], offset: float) -> Dict[str, Any]:
+    """
+    Desloca os timestamps por palavra de uma transcrição do trecho para a linha do tempo do vídeo.
+
+    Args:
+        transcription: Transcrição com 'words' relativos ao início do trecho
+        offset: Início do trecho no vídeo, em segundos
+
+    Returns:
+        Nova transcrição com os timestamps deslocados
+    """
+    if not offset or not transcription.get('words'):
+        return transcription
+    words = [[word, start + offset, end + offset] for word, start, end in transcription['words']]
+    return {**transcription, 'words': words}
+
+
+def slice_transcription(transcription: Dict[str, Any], start: float, end: float) -> Dict[str, Any]:
+    """
+    Recorta de uma transcrição completa apenas as palavras que começam dentro do trecho.
+
+    Args:
+        transcription: Transcrição do vídeo inteiro com 'words'
+        start: Início do trecho em segundos
+        end: Fim do trecho em segundos
+
+    Returns:
+        Nova transcrição com 'text', 'duration' e 'words' do trecho
+    """
+    words = [word for word in transcription.get('words') or [] if start <= word[1] < end]
+    duration = (end if end != float('inf') else transcription.get('duration', start)) - start
+    return {'text': ' '.join(word[0] for word in words), 'duration': max(duration, 0), 'words': words}
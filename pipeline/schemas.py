@@ -0,0 +1,117 @@
+"""
+Schemas JSON das respostas do GPT para o modo de saída estruturada.
+
+Os schemas seguem a estrutura validada antes de gerar o PDF (campos obrigatórios do ebook,
+capítulos com subseções e pontos importantes). Enviados com a requisição, fazem a API
+gerar sempre JSON válido nesse formato, e a resposta é lida na primeira tentativa de parse.
+No modo estrito todas as propriedades são obrigatórias e não são aceitos campos extras.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+_STRING = {'type': 'string'}
+_STRING_LIST = {'type': 'array', 'items': _STRING}
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Monta um objeto estrito com todas as propriedades obrigatórias."""
+    return {
+        'type': 'object',
+        'properties': properties,
+        'required': list(properties),
+        'additionalProperties': False,
+    }
+
+
+def _array(items: Dict[str, Any]) -> Dict[str, Any]:
+    """Monta uma lista com o schema dos itens."""
+    return {'type': 'array', 'items': items}
+
+
+# Capítulo do ebook (template: título, conteúdo, subseções, citação e pontos importantes)
+CHAPTER_SCHEMA = _object(
+    {
+        'title': _STRING,
+        'content': _STRING,
+        'subsections': _array(_object({'title': _STRING, 'content': _STRING})),
+        'highlight_quote': _STRING,
+        'important_points': _STRING_LIST,
+    }
+)
+
+# Elementos que envolvem os capítulos (gerados em chamada separada nos modos em paralelo)
+_FRAME_PROPERTIES = {
+    'title': _STRING,
+    'subtitle': _STRING,
+    'author': _STRING,
+    'description': _STRING,
+}
+_CLOSING_PROPERTIES = {
+    'conclusion': _STRING,
+    'key_points': _STRING_LIST,
+}
+
+EBOOK_SCHEMA = _object({**_FRAME_PROPERTIES, 'chapters': _array(CHAPTER_SCHEMA), **_CLOSING_PROPERTIES})
+
+EBOOK_FRAME_SCHEMA = _object({**_FRAME_PROPERTIES, **_CLOSING_PROPERTIES})
+
+EBOOK_OUTLINE_SCHEMA = _object(
+    {
+        **_FRAME_PROPERTIES,
+        'chapters': _array(
+            _object(
+                {
+                    'title': _STRING,
+                    'summary': _STRING,
+                    'start_block': {'type': 'integer'},
+                    'end_block': {'type': 'integer'},
+                }
+            )
+        ),
+    }
+)
+
+
+def missing_ebook_fields(received_fields: Iterable[str]) -> List[str]:
+    """
+    Lista os campos obrigatórios do ebook (fora 'chapters') ainda não recebidos.
+
+    Args:
+        received_fields: Campos do ebook já recebidos
+
+    Returns:
+        Campos que faltam, na ordem de EBOOK_SCHEMA['required']
+    """
+    received = set(received_fields)
+    return [field for field in EBOOK_SCHEMA['required'] if field != 'chapters' and field not in received]
+
+
+def ebook_continuation_schema(received_fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Monta o schema da continuação de uma resposta interrompida do ebook.
+
+    Pede apenas os capítulos restantes e os campos ainda não recebidos: com o schema completo,
+    o modo estrito obrigaria o modelo a repetir os campos que já chegaram.
+
+    Args:
+        received_fields: Campos do ebook já recebidos (fora 'chapters')
+
+    Returns:
+        Schema JSON com 'chapters' e os campos que faltam
+    """
+    missing = {field: EBOOK_SCHEMA['properties'][field] for field in missing_ebook_fields(received_fields)}
+    return _object({'chapters': EBOOK_SCHEMA['properties']['chapters'], **missing})
+
+
+def json_schema_response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Monta o parâmetro response_format da API de chat para saída estruturada.
+
+    Args:
+        name: Nome do schema (letras, números, '_' ou '-')
+        schema: Schema JSON da resposta
+
+    Returns:
+        Dict para o parâmetro response_format
+    """
+    return {'type': 'json_schema', 'json_schema': {'name': name, 'strict': True, 'schema': schema}}
@@ -0,0 +1,143 @@
+"""
+Configurações das etapas de otimização do pipeline.
+
+Complementa o `config.py` com os parâmetros de cache e desempenho. Todos os valores
+podem ser sobrescritos por variáveis de ambiente (ou pelo arquivo `.env`).
+"""
+
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Lê uma variável de ambiente booleana ('1', 'true', 'sim', 'yes', 'on')."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'sim', 'yes', 'on')
+
+
+# Diretório base dos caches persistentes
+CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
+
+# Cache de áudio baixado (chaveado pelo ID do vídeo + formato/codec/qualidade)
+AUDIO_CACHE_ENABLED = _env_bool('AUDIO_CACHE_ENABLED', True)
+AUDIO_CACHE_DIR = os.getenv('AUDIO_CACHE_DIR', os.path.join(CACHE_DIR, 'audio'))
+AUDIO_CACHE_MAX_SIZE_MB = float(os.getenv('AUDIO_CACHE_MAX_SIZE_MB', '2048'))
+
+# Download em passagem única (extrai metadados e baixa com uma única resolução do yt-dlp)
+YT_DLP_SINGLE_PASS = _env_bool('YT_DLP_SINGLE_PASS', True)
+
+# Cache de metadados do vídeo (título, duração, canal) com tempo de expiração
+METADATA_CACHE_ENABLED = _env_bool('METADATA_CACHE_ENABLED', True)
+METADATA_CACHE_DIR = os.getenv('METADATA_CACHE_DIR', os.path.join(CACHE_DIR, 'metadata'))
+METADATA_CACHE_TTL_HOURS = float(os.getenv('METADATA_CACHE_TTL_HOURS', '24'))
+
+# Modo passthrough: mantém o codec nativo do áudio (sem recodificar para MP3)
+AUDIO_PASSTHROUGH = _env_bool('AUDIO_PASSTHROUGH', False)
+AUDIO_PASSTHROUGH_FORMAT = os.getenv(
+    'AUDIO_PASSTHROUGH_FORMAT', 'bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio[ext=mp3]/bestaudio'
+)
+
+# Segmentação em pausas: ajusta os cortes para o silêncio mais próximo (reduz a sobreposição)
+AUDIO_SILENCE_SPLIT = _env_bool('AUDIO_SILENCE_SPLIT', True)
+AUDIO_SILENCE_NOISE_DB = float(os.getenv('AUDIO_SILENCE_NOISE_DB', '-35'))
+AUDIO_SILENCE_MIN_DURATION = float(os.getenv('AUDIO_SILENCE_MIN_DURATION', '0.4'))
+AUDIO_SILENCE_SEARCH_WINDOW_SECONDS = float(os.getenv('AUDIO_SILENCE_SEARCH_WINDOW_SECONDS', '120'))
+# Duração mínima do último segmento (um resto mais curto é juntado ao segmento anterior)
+AUDIO_SILENCE_MIN_LAST_SEGMENT_SECONDS = float(os.getenv('AUDIO_SILENCE_MIN_LAST_SEGMENT_SECONDS', '30'))
+
+# Planejamento de segmentos pelo bitrate real (menor número de envios abaixo do limite da API)
+AUDIO_SEGMENT_BITRATE_AWARE = _env_bool('AUDIO_SEGMENT_BITRATE_AWARE', True)
+AUDIO_SEGMENT_SIZE_SAFETY_MARGIN = float(os.getenv('AUDIO_SEGMENT_SIZE_SAFETY_MARGIN', '0.1'))
+
+# Perfil de fala: converte o áudio para mono/16 kHz/Opus de baixo bitrate antes da transcrição
+AUDIO_SPEECH_PROFILE = _env_bool('AUDIO_SPEECH_PROFILE', True)
+AUDIO_SPEECH_SAMPLE_RATE = int(os.getenv('AUDIO_SPEECH_SAMPLE_RATE', '16000'))
+AUDIO_SPEECH_BITRATE = os.getenv('AUDIO_SPEECH_BITRATE', '24k')
+
+# Transcrição paralela (número máximo de envios simultâneos ao Whisper em todo o job, inclusive
+# entre capítulos processados em paralelo)
+TRANSCRIPTION_MAX_WORKERS = int(os.getenv('TRANSCRIPTION_MAX_WORKERS', '4'))
+
+# Pipeline segmentação -> transcrição: envia cada segmento assim que é cortado
+TRANSCRIPTION_PIPELINE = _env_bool('TRANSCRIPTION_PIPELINE', True)
+PIPELINE_MAX_PENDING_SEGMENTS = int(os.getenv('PIPELINE_MAX_PENDING_SEGMENTS', '4'))
+
+# Cache de transcrições (chaveado pelo hash do áudio + modelo + formato de resposta), com despejo LRU
+TRANSCRIPTION_CACHE_ENABLED = _env_bool('TRANSCRIPTION_CACHE_ENABLED', True)
+TRANSCRIPTION_CACHE_DIR = os.getenv('TRANSCRIPTION_CACHE_DIR', os.path.join(CACHE_DIR, 'transcriptions'))
+TRANSCRIPTION_CACHE_MAX_SIZE_MB = float(os.getenv('TRANSCRIPTION_CACHE_MAX_SIZE_MB', '512'))
+TRANSCRIPTION_RESPONSE_FORMAT = os.getenv('TRANSCRIPTION_RESPONSE_FORMAT', 'verbose_json')
+
+# Cache de respostas do GPT (chaveado pelo hash dos prompts + modelo + temperatura + max_tokens),
+# com despejo LRU. Com COMPLETION_CACHE_BYPASS o cache não é lido e a resposta nova o substitui
+COMPLETION_CACHE_ENABLED = _env_bool('COMPLETION_CACHE_ENABLED', True)
+COMPLETION_CACHE_DIR = os.getenv('COMPLETION_CACHE_DIR', os.path.join(CACHE_DIR, 'completions'))
+COMPLETION_CACHE_MAX_SIZE_MB = float(os.getenv('COMPLETION_CACHE_MAX_SIZE_MB', '256'))
+COMPLETION_CACHE_BYPASS = _env_bool('COMPLETION_CACHE_BYPASS', False)
+
+# Checkpoints por segmento (diretório que sobrevive a falhas, para retomar transcrições longas)
+TRANSCRIPTION_CHECKPOINTS = _env_bool('TRANSCRIPTION_CHECKPOINTS', True)
+TRANSCRIPTION_CHECKPOINT_DIR = os.getenv('TRANSCRIPTION_CHECKPOINT_DIR', os.path.join(CACHE_DIR, 'checkpoints'))
+
+# Timestamps por palavra (timestamp_granularities=['word']), salvos em formato colunar compacto
+TRANSCRIPTION_WORD_TIMESTAMPS = _env_bool('TRANSCRIPTION_WORD_TIMESTAMPS', True)
+
+# Backend de transcrição: 'openai' (API Whisper) ou 'local' (faster-whisper em CPU, int8)
+TRANSCRIPTION_BACKEND = os.getenv('TRANSCRIPTION_BACKEND', 'openai')
+LOCAL_WHISPER_MODEL_SIZE = os.getenv('LOCAL_WHISPER_MODEL_SIZE', 'small')
+LOCAL_WHISPER_THREADS = int(os.getenv('LOCAL_WHISPER_THREADS', str(os.cpu_count() or 4)))
+LOCAL_WHISPER_COMPUTE_TYPE = os.getenv('LOCAL_WHISPER_COMPUTE_TYPE', 'int8')
+
+# Atalho por legendas: usa legendas do YouTube (manuais ou automáticas) e dispensa o download
+# do áudio e a transcrição quando há uma faixa com densidade de palavras suficiente
+CAPTIONS_FAST_PATH = _env_bool('CAPTIONS_FAST_PATH', True)
+CAPTIONS_ALLOW_AUTOMATIC = _env_bool('CAPTIONS_ALLOW_AUTOMATIC', True)
+CAPTIONS_LANGUAGES = [lang.strip() for lang in os.getenv('CAPTIONS_LANGUAGES', 'pt,pt-BR,pt-PT,en').split(',')]
+CAPTIONS_FORMAT = os.getenv('CAPTIONS_FORMAT', 'vtt/srv3/srv1/best')
+CAPTIONS_MIN_WORDS_PER_MINUTE = float(os.getenv('CAPTIONS_MIN_WORDS_PER_MINUTE', '60'))
+
+# Trecho do vídeo a processar: início/fim (segundos ou 'hh:mm:ss') ou capítulo do YouTube
+# (número ou parte do título). Apenas o trecho é baixado, transcrito e enviado ao GPT
+TIME_RANGE_START = os.getenv('TIME_RANGE_START') or None
+TIME_RANGE_END = os.getenv('TIME_RANGE_END') or None
+TIME_RANGE_CHAPTER = os.getenv('TIME_RANGE_CHAPTER') or None
+
+# Processamento por capítulos do YouTube: em vídeos longos com capítulos, cada capítulo é
+# transcrito e expandido em um capítulo do ebook em paralelo, e o ebook é montado na ordem original
+CHAPTER_PARALLEL = _env_bool('CHAPTER_PARALLEL', True)
+CHAPTER_PARALLEL_MIN_CHAPTERS = int(os.getenv('CHAPTER_PARALLEL_MIN_CHAPTERS', '3'))
+CHAPTER_PARALLEL_MIN_DURATION_MINUTES = float(os.getenv('CHAPTER_PARALLEL_MIN_DURATION_MINUTES', '30'))
+CHAPTER_MAX_WORKERS = int(os.getenv('CHAPTER_MAX_WORKERS', '4'))
+
+# Geração do ebook em map-reduce: transcrições acima do limite são divididas em partes, cada
+# parte vira um capítulo em paralelo e uma chamada final menor gera título, conclusão e pontos-chave
+EBOOK_MAP_REDUCE = _env_bool('EBOOK_MAP_REDUCE', True)
+EBOOK_MAP_REDUCE_THRESHOLD_CHARS = int(os.getenv('EBOOK_MAP_REDUCE_THRESHOLD_CHARS', '60000'))
+EBOOK_MAP_CHUNK_CHARS = int(os.getenv('EBOOK_MAP_CHUNK_CHARS', '24000'))
+EBOOK_MAP_MAX_WORKERS = int(os.getenv('EBOOK_MAP_MAX_WORKERS', '4'))
+
+# Geração com esboço: uma chamada curta define os capítulos (e os blocos da transcrição que cada
+# um cobre) e os capítulos são escritos em paralelo, uma chamada por capítulo. Desativada por
+# padrão: a chamada única com streaming (EBOOK_STREAMING) já regenera só o que falhou
+EBOOK_OUTLINE_FIRST = _env_bool('EBOOK_OUTLINE_FIRST', False)
+EBOOK_OUTLINE_BLOCK_CHARS = int(os.getenv('EBOOK_OUTLINE_BLOCK_CHARS', '1500'))
+EBOOK_OUTLINE_MAX_WORKERS = int(os.getenv('EBOOK_OUTLINE_MAX_WORKERS', '6'))
+
+# Streaming da geração do ebook em chamada única: capítulos registrados à medida que chegam e,
+# em caso de falha, a nova tentativa pede apenas os capítulos e campos que faltam
+EBOOK_STREAMING = _env_bool('EBOOK_STREAMING', True)
+
+# Correção seletiva: se a resposta em chamada única tiver capítulos inválidos ou campos
+# ausentes, apenas essas partes são geradas de novo e o restante do ebook é mantido
+EBOOK_REPAIR_INVALID = _env_bool('EBOOK_REPAIR_INVALID', True)
+
+# Saída estruturada: envia o schema JSON do ebook (ou do capítulo/esboço) com a requisição,
+# para que a resposta seja sempre JSON válido e não precise das estratégias de correção
+OPENAI_STRUCTURED_OUTPUT = _env_bool('OPENAI_STRUCTURED_OUTPUT', True)
+
+# Orçamento de tokens: janela de contexto do modelo (entrada + saída) usada para decidir, antes
+# do envio, entre chamada única e geração em partes; e custo dos tokens de saída (os de entrada
+# usam OPENAI_GPT_COST_PER_1K_TOKENS do config.py)
+OPENAI_GPT_CONTEXT_WINDOW = int(os.getenv('OPENAI_GPT_CONTEXT_WINDOW', '128000'))
+OPENAI_GPT_OUTPUT_COST_PER_1K_TOKENS = float(os.getenv('OPENAI_GPT_OUTPUT_COST_PER_1K_TOKENS', '0.0006'))
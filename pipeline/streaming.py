@@ -0,0 +1,138 @@
+"""
+Parse incremental do JSON do ebook durante uma resposta em streaming.
+
+O texto chega em pedaços arbitrários. O parser percorre cada caractere uma única vez,
+acompanhando strings, escapes e a profundidade de objetos/listas, e extrai os campos do
+objeto raiz assim que cada valor termina. Os itens da lista escolhida (os capítulos) são
+emitidos um a um, assim que cada objeto fecha, o que permite mostrar o progresso e manter
+o resultado parcial se a conexão cair antes do fim da resposta.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+# Marca trechos malformados (diferente de null, que é um valor JSON válido)
+_INVALID = object()
+
+
+class IncrementalJSONParser:
+    """Extrai campos e itens de lista de um objeto JSON que chega em pedaços."""
+
+    def __init__(self, array_key: str = 'chapters'):
+        """
+        Inicializa o parser.
+
+        Args:
+            array_key: Campo do objeto raiz cuja lista tem os itens emitidos um a um
+        """
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self.items: List[Any] = []
+
+        self._buffer: List[str] = []
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: Optional[str] = None
+        self._expect_key = False
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Texto recebido até agora."""
+        return ''.join(self._buffer)
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Processa um novo pedaço da resposta.
+
+        Args:
+            chunk: Pedaço de texto recebido
+
+        Returns:
+            Itens de `array_key` que ficaram completos com este pedaço
+        """
+        completed = []
+        self._buffer.append(chunk)
+        text = None
+
+        for char in chunk:
+            pos = self._pos
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._expect_key and len(self._stack) == 1:
+                        text = text or self.text
+                        key = self._decode(text[self._string_start : pos + 1])
+                        self._key = key if isinstance(key, str) else None
+                continue
+
+            if not self._stack:
+                # Ignora qualquer texto antes do objeto raiz (ex.: ```json)
+                if char == '{':
+                    self._stack.append('{')
+                    self._expect_key = True
+                continue
+
+            depth = len(self._stack)
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+                if depth == 1 and not self._expect_key and self._value_start is None:
+                    self._value_start = pos
+            elif char == ':' and depth == 1:
+                self._expect_key = False
+                self._value_start = None
+            elif char in '{[':
+                if depth == 1 and self._value_start is None:
+                    self._value_start = pos
+                if depth == 2 and self._key == self.array_key and self._stack[-1] == '[' and char == '{':
+                    self._item_start = pos
+                self._stack.append(char)
+            elif char in '}]':
+                self._stack.pop()
+                if len(self._stack) == 2 and self._item_start is not None and char == '}':
+                    text = text or self.text
+                    item = self._decode(text[self._item_start : pos + 1])
+                    self._item_start = None
+                    if item is not _INVALID:
+                        self.items.append(item)
+                        completed.append(item)
+                elif not self._stack:
+                    text = text or self.text
+                    self._close_field(text, pos)
+            elif char == ',' and depth == 1:
+                text = text or self.text
+                self._close_field(text, pos)
+                self._expect_key = True
+            elif depth == 1 and not char.isspace() and not self._expect_key and self._value_start is None:
+                # Início de número, true, false ou null
+                self._value_start = pos
+
+        return completed
+
+    def _close_field(self, text: str, end: int) -> None:
+        """Registra o valor do campo atual do objeto raiz, terminado na posição `end`."""
+        if self._key is not None and self._value_start is not None:
+            value = self._decode(text[self._value_start : end])
+            if value is not _INVALID and self._key != self.array_key:
+                self.fields[self._key] = value
+        self._key = None
+        self._value_start = None
+
+    @staticmethod
+    def _decode(raw: str) -> Any:
+        """Decodifica um trecho JSON (_INVALID se estiver malformado)."""
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return _INVALID
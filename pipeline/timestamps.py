@@ -0,0 +1,173 @@
+"""
+Armazenamento compacto de timestamps por palavra.
+
+As palavras de uma transcrição ficam em colunas paralelas: início e fim (float64) e um
+índice de offsets (uint32) para um único buffer de texto UTF-8. O arquivo gravado pode
+ser mapeado em memória (mmap), então uma transcrição de ~30 mil palavras carrega em
+milissegundos e ocupa uma fração da memória de uma lista de dicts por palavra.
+
+Formato do arquivo (little-endian):
+    cabeçalho: b'WTS1', quantidade de palavras (uint32), tamanho do texto (uint64)
+    início de cada palavra (float64 * n)
+    fim de cada palavra (float64 * n)
+    offsets no texto (uint32 * (n + 1))
+    texto UTF-8 de todas as palavras concatenadas
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple, Union
+
+MAGIC = b'WTS1'
+HEADER = struct.Struct('<4sIQ')
+
+# Uma palavra como (texto, início, fim)
+Word = Tuple[str, float, float]
+
+
+class WordTimestampStore:
+    """Colunas de timestamps por palavra, em memória ou mapeadas de um arquivo."""
+
+    def __init__(
+        self, starts: Sequence[float], ends: Sequence[float], offsets: Sequence[int], text: Union[bytes, memoryview]
+    ):
+        """
+        Inicializa o armazenamento a partir das colunas.
+
+        Args:
+            starts: Início de cada palavra em segundos
+            ends: Fim de cada palavra em segundos
+            offsets: Offsets (em bytes) de cada palavra no texto, com n + 1 posições
+            text: Buffer UTF-8 com todas as palavras concatenadas
+        """
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text = text
+        self._mmap = None
+
+    @classmethod
+    def from_words(cls, words: Sequence[Sequence]) -> 'WordTimestampStore':
+        """
+        Cria o armazenamento a partir de uma lista de palavras.
+
+        Args:
+            words: Lista de (texto, início, fim)
+
+        Returns:
+            WordTimestampStore em memória
+        """
+        starts = array('d')
+        ends = array('d')
+        offsets = array('I', [0])
+        buffer = bytearray()
+
+        for word, start, end in words:
+            buffer += word.encode('utf-8')
+            starts.append(float(start))
+            ends.append(float(end))
+            offsets.append(len(buffer))
+
+        return cls(starts, ends, offsets, bytes(buffer))
+
+    @classmethod
+    def load(cls, path: str) -> 'WordTimestampStore':
+        """
+        Mapeia um arquivo de timestamps em memória, sem copiar as colunas.
+
+        Args:
+            path: Caminho do arquivo gravado por `save`
+
+        Returns:
+            WordTimestampStore apoiado no arquivo mapeado
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, text_len = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            mapped.close()
+            raise ValueError(f'Arquivo de timestamps inválido: {path}')
+
+        view = memoryview(mapped)
+        pos = HEADER.size
+        starts = view[pos : pos + 8 * count].cast('d')
+        pos += 8 * count
+        ends = view[pos : pos + 8 * count].cast('d')
+        pos += 8 * count
+        offsets = view[pos : pos + 4 * (count + 1)].cast('I')
+        pos += 4 * (count + 1)
+        text = view[pos : pos + text_len]
+
+        store = cls(starts, ends, offsets, text)
+        store._mmap = mapped
+        return store
+
+    def save(self, path: str) -> str:
+        """
+        Grava as colunas em um arquivo binário mapeável.
+
+        Args:
+            path: Caminho do arquivo de saída
+
+        Returns:
+            Caminho do arquivo gravado
+        """
+        starts = array('d', self.starts)
+        ends = array('d', self.ends)
+        offsets = array('I', self.offsets)
+        if sys.byteorder != 'little':
+            for column in (starts, ends, offsets):
+                column.byteswap()
+
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(starts), len(self.text)))
+            f.write(starts.tobytes())
+            f.write(ends.tobytes())
+            f.write(offsets.tobytes())
+            f.write(bytes(self.text))
+
+        return str(Path(path))
+
+    def close(self) -> None:
+        """Libera o arquivo mapeado (se houver)."""
+        if self._mmap is not None:
+            for column in (self.starts, self.ends, self.offsets, self.text):
+                if isinstance(column, memoryview):
+                    column.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'WordTimestampStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def word(self, index: int) -> str:
+        """Retorna o texto da palavra na posição informada."""
+        return bytes(self.text[self.offsets[index] : self.offsets[index + 1]]).decode('utf-8')
+
+    def __getitem__(self, index: int) -> Word:
+        if index < 0:
+            index += len(self)
+        return self.word(index), self.starts[index], self.ends[index]
+
+    def __iter__(self) -> Iterator[Word]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def index_at(self, seconds: float) -> int:
+        """Retorna o índice da última palavra que começa até o instante informado (busca binária)."""
+        return max(0, bisect_right(self.starts, seconds) - 1)
+
+    def to_list(self) -> List[Word]:
+        """Converte para lista de (texto, início, fim)."""
+        return list(self)
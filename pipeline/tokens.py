@@ -0,0 +1,75 @@
+"""
+Contagem local de tokens dos prompts e respostas do GPT.
+
+Usa o tokenizador BPE do tiktoken correspondente ao modelo (o200k_base para modelos
+desconhecidos). A contagem de uma lista de mensagens inclui os tokens de formatação que a
+API de chat acrescenta a cada mensagem e ao início da resposta, o que permite saber antes
+do envio se o prompt cabe na janela de contexto. Sem o tiktoken, a contagem volta a ser
+estimada em ~3 caracteres por token.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Tokens de formatação do formato de chat: por mensagem e para iniciar a resposta do assistente
+_TOKENS_PER_MESSAGE = 3
+_REPLY_PRIMING_TOKENS = 3
+_FALLBACK_ENCODING = 'o200k_base'
+_FALLBACK_CHARS_PER_TOKEN = 3
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Carrega (uma vez por modelo) o tokenizador do tiktoken, ou None se indisponível."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning('Pacote tiktoken não instalado: tokens estimados pelo número de caracteres')
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(_FALLBACK_ENCODING)
+    except Exception as e:
+        # O tiktoken baixa o vocabulário no primeiro uso; sem rede, usa a estimativa
+        logger.warning(f'Não foi possível carregar o tokenizador de {model}: {e}')
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Conta os tokens de um texto com o tokenizador do modelo.
+
+    Args:
+        text: Texto a contar
+        model: Nome do modelo (ex.: 'gpt-4o-mini')
+
+    Returns:
+        Número de tokens
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // _FALLBACK_CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict[str, Any]], model: str) -> int:
+    """
+    Conta os tokens de entrada de uma chamada de chat, incluindo a formatação das mensagens.
+
+    Args:
+        messages: Mensagens no formato da API ('role' e 'content')
+        model: Nome do modelo
+
+    Returns:
+        Número de tokens de entrada da chamada
+    """
+    total = _REPLY_PRIMING_TOKENS
+    for message in messages:
+        total += _TOKENS_PER_MESSAGE
+        total += sum(count_tokens(str(value), model) for value in message.values())
+    return total
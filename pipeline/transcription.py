@@ -0,0 +1,167 @@
+"""
+Backends de transcrição de áudio.
+
+Todos os backends seguem o mesmo contrato: `transcribe(audio_path)` retorna um dict com
+'text', 'duration' e, quando habilitado, 'words' como lista de [texto, início, fim].
+Isso permite trocar a API da OpenAI por um modelo local (CPU) sem alterar o pipeline.
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionBackend(ABC):
+    """Interface dos backends de transcrição."""
+
+    # Nome usado na configuração TRANSCRIPTION_BACKEND
+    name = ''
+    # Custo por minuto de áudio em USD (0 para backends locais)
+    cost_per_minute = 0.0
+    # Tamanho máximo de arquivo aceito em MB (None = sem limite, não precisa segmentar)
+    max_file_size_mb: Optional[float] = None
+
+    @property
+    @abstractmethod
+    def cache_tag(self) -> str:
+        """Identifica backend e modelo nas chaves de cache de transcrição."""
+
+    @abstractmethod
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Transcreve um arquivo de áudio.
+
+        Args:
+            audio_path: Caminho do arquivo de áudio
+
+        Returns:
+            Dict com 'text', 'duration' e opcionalmente 'words'
+        """
+
+
+class OpenAITranscriptionBackend(TranscriptionBackend):
+    """Transcrição pela API Whisper da OpenAI."""
+
+    name = 'openai'
+
+    def __init__(
+        self,
+        model: str,
+        response_format: str,
+        word_timestamps: bool,
+        cost_per_minute: float,
+        max_file_size_mb: float,
+    ):
+        """
+        Inicializa o backend.
+
+        Args:
+            model: Modelo de transcrição (ex.: 'whisper-1')
+            response_format: Formato de resposta da API (ex.: 'verbose_json')
+            word_timestamps: Solicita timestamps por palavra (exige 'verbose_json', que passa a ser usado)
+            cost_per_minute: Custo por minuto de áudio em USD
+            max_file_size_mb: Limite de tamanho de arquivo da API em MB
+        """
+        if word_timestamps and response_format != 'verbose_json':
+            # A API só aceita timestamp_granularities com response_format='verbose_json'
+            logger.warning(f"Formato '{response_format}' não traz timestamps por palavra; usando 'verbose_json'")
+            response_format = 'verbose_json'
+        self.model = model
+        self.response_format = response_format
+        self.word_timestamps = word_timestamps
+        self.cost_per_minute = cost_per_minute
+        self.max_file_size_mb = max_file_size_mb
+
+    @property
+    def cache_tag(self) -> str:
+        return f'{self.name}:{self.model}:{self.response_format}:{self.word_timestamps}'
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        import openai
+
+        options = {}
+        if self.word_timestamps:
+            options['timestamp_granularities'] = ['word']
+
+        with open(audio_path, 'rb') as audio_file:
+            response = openai.audio.transcriptions.create(
+                model=self.model,
+                file=audio_file,
+                response_format=self.response_format,
+                **options,
+            )
+
+        result = {
+            'text': response.text,
+            'duration': response.duration if hasattr(response, 'duration') else 0,
+        }
+        if self.word_timestamps:
+            # Palavras como [texto, início, fim], bem mais compacto que um dict por palavra
+            result['words'] = [[w.word, w.start, w.end] for w in getattr(response, 'words', None) or []]
+        return result
+
+
+class LocalWhisperBackend(TranscriptionBackend):
+    """Transcrição local em CPU com faster-whisper (CTranslate2, quantização int8)."""
+
+    name = 'local'
+
+    def __init__(self, model_size: str, threads: int, compute_type: str, word_timestamps: bool):
+        """
+        Inicializa o backend (o modelo é carregado no primeiro uso).
+
+        Args:
+            model_size: Tamanho do modelo (ex.: 'tiny', 'base', 'small', 'medium', 'large-v3')
+            threads: Número de threads de CPU usadas pelo CTranslate2
+            compute_type: Tipo de computação (ex.: 'int8', 'int8_float32', 'float32')
+            word_timestamps: Gera timestamps por palavra
+        """
+        self.model_size = model_size
+        self.threads = threads
+        self.compute_type = compute_type
+        self.word_timestamps = word_timestamps
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_tag(self) -> str:
+        return f'{self.name}:{self.model_size}:{self.compute_type}:{self.word_timestamps}'
+
+    def _load_model(self):
+        """Carrega o modelo uma única vez (compartilhado entre threads)."""
+        with self._lock:
+            if self._model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as e:
+                    raise ImportError(
+                        'Backend local requer o pacote faster-whisper. '
+                        "Instale com: pip install 'content-video-generator[local]'"
+                    ) from e
+
+                logger.info(
+                    f'Carregando modelo local {self.model_size} ({self.compute_type}, {self.threads} threads)...'
+                )
+                self._model = WhisperModel(
+                    self.model_size, device='cpu', compute_type=self.compute_type, cpu_threads=self.threads
+                )
+        return self._model
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        model = self._load_model()
+        segments, info = model.transcribe(audio_path, word_timestamps=self.word_timestamps)
+
+        texts = []
+        words = []
+        for segment in segments:
+            texts.append(segment.text.strip())
+            for word in segment.words or []:
+                words.append([word.word, word.start, word.end])
+
+        result = {'text': ' '.join(texts), 'duration': info.duration}
+        if self.word_timestamps:
+            result['words'] = words
+        return result
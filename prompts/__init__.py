@@ -4,7 +4,21 @@ Módulo de prompts para o Content Video Generator.
 Este módulo contém todos os prompts utilizados pelo sistema de geração de ebooks.
 """
 
+from .system_prompt_chapter import SYSTEM_PROMPT_EBOOK_CHAPTER, SYSTEM_PROMPT_EBOOK_FRAME
 from .system_prompt_ebook import SYSTEM_PROMPT_EBOOK
-from .user_prompt_ebook import get_user_prompt_ebook
+from .system_prompt_outline import SYSTEM_PROMPT_EBOOK_OUTLINE
+from .user_prompt_chapter import get_user_prompt_ebook_chapter, get_user_prompt_ebook_frame
+from .user_prompt_ebook import get_user_prompt_ebook, get_user_prompt_ebook_continuation
+from .user_prompt_outline import get_user_prompt_ebook_outline
 
-__all__ = ['SYSTEM_PROMPT_EBOOK', 'get_user_prompt_ebook']
+__all__ = [
+    'SYSTEM_PROMPT_EBOOK',
+    'SYSTEM_PROMPT_EBOOK_CHAPTER',
+    'SYSTEM_PROMPT_EBOOK_FRAME',
+    'SYSTEM_PROMPT_EBOOK_OUTLINE',
+    'get_user_prompt_ebook',
+    'get_user_prompt_ebook_chapter',
+    'get_user_prompt_ebook_continuation',
+    'get_user_prompt_ebook_frame',
+    'get_user_prompt_ebook_outline',
+]
@@ -0,0 +1,61 @@
+def get_user_prompt_ebook_chapter(
+    video_info, chapter_title, chapter_number, total_chapters, transcription_text, chapter_summary=None
+):
+    """
+    Gera o prompt do usuário para expandir a transcrição de um capítulo do vídeo em um capítulo do ebook.
+    """
+    # Sem título (parte de uma transcrição longa), o modelo cria o título do capítulo
+    if chapter_title:
+        chapter_header = f'CAPÍTULO {chapter_number} DE {total_chapters}: {chapter_title}'
+    else:
+        chapter_header = f'PARTE {chapter_number} DE {total_chapters} DA TRANSCRIÇÃO (crie um título descritivo)'
+    if chapter_summary:
+        chapter_header += f'\nO QUE ESTE CAPÍTULO DEVE COBRIR: {chapter_summary}'
+
+    return f"""INFORMAÇÕES DO VÍDEO:
+Título: {video_info['title']}
+Canal: {video_info['uploader']}
+
+{chapter_header}
+
+TRANSCRIÇÃO DO CAPÍTULO:
+{transcription_text}
+
+INSTRUÇÕES ESPECÍFICAS:
+1. Escreva apenas este capítulo; os demais capítulos são gerados separadamente
+2. Identifique TODOS os conceitos, dados, estratégias e insights mencionados neste trecho
+3. Expanda cada conceito com explicações detalhadas e contexto
+4. Use **negrito** extensivamente para destacar informações importantes
+
+IMPORTANTE: Responda APENAS com o JSON válido do capítulo, sem texto adicional antes ou depois. Use aspas duplas para todas as strings e certifique-se de que o JSON esteja bem formatado."""
+
+
+def get_user_prompt_ebook_frame(video_info, chapters, format_duration_func):
+    """
+    Gera o prompt do usuário para criar título, descrição, conclusão e pontos-chave a partir dos capítulos
+    prontos ou do esboço dos capítulos.
+    """
+
+    def describe(number, chapter):
+        # Capítulos prontos trazem citação e pontos importantes; capítulos do esboço, apenas o resumo
+        lines = [f'{number}. {chapter["title"]}']
+        if chapter.get('summary'):
+            lines.append(f'Resumo: {chapter["summary"]}')
+        if chapter.get('highlight_quote'):
+            lines.append(f'Citação: {chapter["highlight_quote"]}')
+        if chapter.get('important_points'):
+            lines.append('Pontos importantes:')
+            lines.extend(f'- {point}' for point in chapter['important_points'])
+        return '\n'.join(lines)
+
+    chapter_summaries = '\n\n'.join(describe(i, chapter) for i, chapter in enumerate(chapters, 1))
+
+    return f"""INFORMAÇÕES DO VÍDEO:
+Título: {video_info['title']}
+Canal: {video_info['uploader']}
+Duração: {format_duration_func(video_info['duration'])}
+
+CAPÍTULOS DO EBOOK:
+{chapter_summaries}
+
+IMPORTANTE: Responda APENAS com o JSON válido, sem texto adicional antes ou depois. Use aspas duplas para todas as strings e certifique-se de que o JSON esteja bem formatado."""
@@ -29,3 +29,21 @@ INSTRUÇÕES ESPECÍFICAS PARA ESTA TRANSCRIÇÃO:
 RESULTADO ESPERADO: Um ebook educacional completo, detalhado e profissional que transforme esta transcrição em um material de referência valioso.
 
 IMPORTANTE: Responda APENAS com o JSON válido, sem texto adicional antes ou depois. Use aspas duplas para todas as strings e certifique-se de que o JSON esteja bem formatado."""
+
+
+def get_user_prompt_ebook_continuation(user_prompt, missing_fields, received_chapters):
+    """
+    Gera o prompt de continuação após uma resposta interrompida, pedindo apenas o que falta do ebook
+    (os capítulos seguintes e os campos em missing_fields, calculados a partir do schema do ebook).
+    """
+    chapter_titles = '\n'.join(f'{i}. {chapter.get("title", "")}' for i, chapter in enumerate(received_chapters, 1))
+
+    return f"""{user_prompt}
+
+CONTINUAÇÃO DE UMA RESPOSTA INTERROMPIDA:
+Os seguintes capítulos já foram gerados e NÃO devem ser repetidos:
+{chapter_titles or '(nenhum)'}
+
+Gere apenas o que falta: os capítulos seguintes (a partir do capítulo {len(received_chapters) + 1}), em "chapters", e os campos {', '.join(missing_fields) or '(nenhum)'}.
+
+IMPORTANTE: Responda APENAS com o JSON válido no mesmo formato, contendo somente "chapters" com os capítulos restantes e os campos que faltam."""
@@ -0,0 +1,15 @@
+def get_user_prompt_ebook_outline(video_info, transcription_blocks, format_duration_func):
+    """
+    Gera o prompt do usuário para o esboço do ebook, com a transcrição dividida em blocos numerados.
+    """
+    numbered_blocks = '\n\n'.join(f'[{i}] {block}' for i, block in enumerate(transcription_blocks, 1))
+
+    return f"""INFORMAÇÕES DO VÍDEO:
+Título: {video_info['title']}
+Canal: {video_info['uploader']}
+Duração: {format_duration_func(video_info['duration'])}
+
+TRANSCRIÇÃO COMPLETA ({len(transcription_blocks)} BLOCOS NUMERADOS):
+{numbered_blocks}
+
+IMPORTANTE: Responda APENAS com o JSON válido do esboço, sem texto adicional antes ou depois. Use aspas duplas para todas as strings e certifique-se de que o JSON esteja bem formatado."""
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark da correção de JSON das respostas do GPT
+
+Monta um corpus de respostas malformadas a partir do exemplo de conteúdo do ebook (blocos
+de código, vírgulas sobrando, aspas simples, quebras de linha e caracteres de controle em
+strings), em vários tamanhos, e compara a correção antiga (regex + filtro com unicodedata,
+como no teste de debug de JSON) com a correção em uma única passada de `pipeline.json_repair`.
+
+Uso: python tests/benchmark_json.py [tamanho_kb ...]
+"""
+
+import json
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.json_repair import repair_json
+
+EXAMPLE_FILE = Path(__file__).parent.parent / 'template' / 'ebook_content_example.json'
+REPEATS = 5
+
+
+def legacy_clean_json_content(json_str: str) -> str:
+    """Reproduz a limpeza antiga por expressões regulares."""
+    json_str = re.sub(r'```json\s*', '', json_str)
+    json_str = re.sub(r'```\s*$', '', json_str)
+    json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
+    if json_match:
+        json_str = json_match.group()
+    json_str = re.sub(r"'([^']*)':", r'"\1":', json_str)
+    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+    json_str = re.sub(r'"\s*\n\s*([^"]*)\s*\n\s*"', r'"\1"', json_str)
+    return json_str
+
+
+def legacy_parse(content: str):
+    """Reproduz as três estratégias antigas de parse."""
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(legacy_clean_json_content(content))
+    except json.JSONDecodeError:
+        pass
+    cleaned = ''.join(ch for ch in content if unicodedata.category(ch)[0] != 'C' or ch in '\n\r\t')
+    return json.loads(legacy_clean_json_content(cleaned))
+
+
+def new_parse(content: str):
+    """Parse direto e, se falhar, correção em uma única passada."""
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return json.loads(repair_json(content))
+
+
+def build_ebook(size_kb: float) -> dict:
+    """Repete os capítulos do exemplo até atingir aproximadamente o tamanho informado."""
+    example = json.loads(EXAMPLE_FILE.read_text(encoding='utf-8'))
+    chapters = example['chapters']
+    ebook = {**example, 'chapters': []}
+    while len(json.dumps(ebook, ensure_ascii=False)) < size_kb * 1024:
+        ebook['chapters'].append(chapters[len(ebook['chapters']) % len(chapters)])
+    return ebook
+
+
+def build_corpus(ebook: dict) -> dict:
+    """Gera as variações malformadas da resposta."""
+    text = json.dumps(ebook, ensure_ascii=False, indent=2)
+
+    def fenced(value):
+        return f'Aqui está o ebook solicitado:\n```json\n{value}\n```\nEspero que ajude!'
+
+    def trailing_commas(value):
+        return re.sub(r'("|\]|\})(\n\s*[\]}])', r'\1,\2', value)
+
+    def single_quoted_keys(value):
+        return re.sub(r'"(\w+)":', r"'\1':", value)
+
+    def raw_newlines(value):
+        return value.replace('\\n', '\n')
+
+    def control_chars(value):
+        return value.replace('. ', '.\x0b ')
+
+    corpus = {
+        'bloco de código': fenced(text),
+        'vírgulas sobrando': trailing_commas(text),
+        'aspas simples': single_quoted_keys(text),
+        'quebras de linha': raw_newlines(text),
+        'caracteres de controle': control_chars(text),
+    }
+    corpus['tudo junto'] = fenced(control_chars(raw_newlines(single_quoted_keys(trailing_commas(text)))))
+    return corpus
+
+
+def run(parse, content: str, expected: dict):
+    """Executa o parse várias vezes e retorna (melhor tempo em ms, resultado correto)."""
+    best = float('inf')
+    ok = False
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        try:
+            result = parse(content)
+            ok = result == expected
+        except json.JSONDecodeError:
+            ok = False
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, ok
+
+
+def benchmark(sizes_kb):
+    """Executa o benchmark para cada tamanho e imprime tempo e acerto de cada estratégia."""
+    print('=' * 78)
+    print('BENCHMARK: CORREÇÃO DE JSON')
+    print('=' * 78)
+    print(f'{"KB":>5} {"Variação":<24} {"Antigo (ms)":>12} {"OK":>4} {"Novo (ms)":>10} {"OK":>4}')
+
+    for size_kb in sizes_kb:
+        ebook = build_ebook(size_kb)
+        # Quebras de linha e caracteres de controle fazem parte do conteúdo esperado
+        for name, content in build_corpus(ebook).items():
+            expected = ebook
+            if name in ('caracteres de controle', 'tudo junto'):
+                expected = json.loads(json.dumps(ebook).replace('. ', '.\\u000b ').replace('\\u000b', ''))
+            legacy_ms, legacy_ok = run(legacy_parse, content, expected)
+            new_ms, new_ok = run(new_parse, content, expected)
+            print(
+                f'{size_kb:>5g} {name:<24} {legacy_ms:>12.2f} {"✅" if legacy_ok else "❌":>3} '
+                f'{new_ms:>10.2f} {"✅" if new_ok else "❌":>3}'
+            )
+
+    print('\nA correção nova percorre a resposta uma única vez: o tempo cresce linearmente com o tamanho.')
+
+
+def main():
+    """Função principal do benchmark."""
+    sizes_kb = [float(size) for size in sys.argv[1:]] or [20, 50, 200]
+    benchmark(sizes_kb)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark da segmentação de áudio
+
+Gera arquivos de áudio sintéticos de várias horas e compara o tempo da segmentação
+antiga (um processo FFmpeg por segmento, com -ss depois de -i) com a segmentação
+em passagem única de `pipeline.audio.cut_segments`.
+
+Uso: python tests/benchmark_segmentacao.py [horas ...]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.audio import cut_segments, plan_fixed_segments
+
+SEGMENT_SECONDS = 20 * 60
+OVERLAP_SECONDS = 10
+
+
+def generate_synthetic_audio(path: Path, hours: float) -> None:
+    """Gera um MP3 mono de voz sintética (tom + ruído) com a duração informada."""
+    duration = int(hours * 3600)
+    cmd = [
+        'ffmpeg',
+        '-v',
+        'error',
+        '-f',
+        'lavfi',
+        '-i',
+        f'sine=frequency=220:duration={duration}',
+        '-ac',
+        '1',
+        '-b:a',
+        '64k',
+        '-y',
+        str(path),
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def legacy_segmentation(audio_path: Path, plan, output_dir: Path) -> None:
+    """Reproduz a segmentação antiga: -ss após -i, um processo por segmento."""
+    for i, (start, duration) in enumerate(plan, 1):
+        cmd = [
+            'ffmpeg',
+            '-v',
+            'error',
+            '-i',
+            str(audio_path),
+            '-ss',
+            str(start),
+            '-t',
+            str(duration),
+            '-acodec',
+            'copy',
+            '-y',
+            str(output_dir / f'legacy_{i:02d}.mp3'),
+        ]
+        subprocess.run(cmd, check=True)
+
+
+def benchmark(hours_list):
+    """Executa o benchmark para cada duração e imprime o tempo por hora de áudio."""
+    print('=' * 60)
+    print('BENCHMARK: SEGMENTAÇÃO DE ÁUDIO')
+    print('=' * 60)
+    print(f'{"Horas":>6} {"Segmentos":>10} {"Antigo (s)":>12} {"Novo (s)":>10} {"Novo s/h":>10}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for hours in hours_list:
+            audio_path = tmp_dir / f'sintetico_{hours}h.mp3'
+            generate_synthetic_audio(audio_path, hours)
+            plan = plan_fixed_segments(hours * 3600, SEGMENT_SECONDS, OVERLAP_SECONDS)
+
+            legacy_dir = tmp_dir / f'legacy_{hours}'
+            legacy_dir.mkdir()
+            start = time.perf_counter()
+            legacy_segmentation(audio_path, plan, legacy_dir)
+            legacy_elapsed = time.perf_counter() - start
+
+            new_dir = tmp_dir / f'novo_{hours}'
+            new_dir.mkdir()
+            start = time.perf_counter()
+            segments = cut_segments(str(audio_path), plan, str(new_dir))
+            new_elapsed = time.perf_counter() - start
+
+            assert len(segments) == len(plan) and all(Path(s).exists() for s in segments)
+            print(
+                f'{hours:>6} {len(plan):>10} {legacy_elapsed:>12.2f} {new_elapsed:>10.2f} {new_elapsed / hours:>10.2f}'
+            )
+
+    print('\nO tempo por hora da segmentação nova deve permanecer aproximadamente constante (escala linear).')
+
+
+def main():
+    """Função principal do benchmark."""
+    hours_list = [float(h) for h in sys.argv[1:]] or [1, 2, 4]
+    try:
+        benchmark(hours_list)
+        return 0
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        print(f'❌ Erro ao executar o FFmpeg: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
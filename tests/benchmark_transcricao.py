@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos backends de transcrição
+
+Transcreve o mesmo arquivo de áudio com o backend local (faster-whisper em CPU) e,
+opcionalmente, com a API da OpenAI, mostrando o tempo total e o fator de tempo real
+(segundos de processamento por segundo de áudio) de cada um.
+
+Uso: python tests/benchmark_transcricao.py <audio> [--openai]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import MAX_AUDIO_FILE_SIZE_MB, OPENAI_WHISPER_COST_PER_MINUTE, OPENAI_WHISPER_MODEL
+
+from pipeline.audio import probe_audio
+from pipeline.settings import (
+    LOCAL_WHISPER_COMPUTE_TYPE,
+    LOCAL_WHISPER_MODEL_SIZE,
+    LOCAL_WHISPER_THREADS,
+    TRANSCRIPTION_RESPONSE_FORMAT,
+)
+from pipeline.transcription import LocalWhisperBackend, OpenAITranscriptionBackend
+
+
+def run_backend(backend, audio_path: str, audio_seconds: float) -> None:
+    """Transcreve o áudio com um backend e imprime tempo e fator de tempo real."""
+    start = time.perf_counter()
+    result = backend.transcribe(audio_path)
+    elapsed = time.perf_counter() - start
+
+    rtf = elapsed / audio_seconds if audio_seconds else 0
+    cost = audio_seconds / 60 * backend.cost_per_minute
+    print(
+        f'{backend.cache_tag:<45} {elapsed:>8.1f}s  RTF {rtf:>5.2f}  '
+        f'{len(result["text"].split()):>6} palavras  ${cost:.4f}'
+    )
+
+
+def main():
+    """Função principal do benchmark."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print(__doc__)
+        return 1
+
+    audio_path = args[0]
+    audio_seconds = probe_audio(audio_path).get('duration') or 0
+    print(f'Áudio: {audio_path} ({audio_seconds / 60:.1f} min)')
+
+    backends = [
+        LocalWhisperBackend(LOCAL_WHISPER_MODEL_SIZE, LOCAL_WHISPER_THREADS, LOCAL_WHISPER_COMPUTE_TYPE, True),
+    ]
+    if '--openai' in sys.argv:
+        backends.append(
+            OpenAITranscriptionBackend(
+                OPENAI_WHISPER_MODEL,
+                TRANSCRIPTION_RESPONSE_FORMAT,
+                True,
+                OPENAI_WHISPER_COST_PER_MINUTE,
+                MAX_AUDIO_FILE_SIZE_MB,
+            )
+        )
+
+    for backend in backends:
+        run_backend(backend, audio_path, audio_seconds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Teste do cache de respostas do GPT
+
+Verifica acertos e falhas do cache de completions: a mesma chamada não é enviada duas vezes,
+prompts ou parâmetros diferentes geram outra chamada, respostas inválidas não são guardadas
+e uma resposta descartada é gerada de novo. A API é substituída por uma função local.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Adiciona o diretório raiz ao path para importar main
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openai
+
+from main import YouTubeEbookGenerator
+from pipeline.cache import LRUDiskCache
+from pipeline.schemas import CHAPTER_SCHEMA
+
+SCHEMA = ('ebook_chapter', CHAPTER_SCHEMA)
+
+
+def _make_generator(work_dir, bypass=False):
+    """Cria o gerador com cache de completions próprio e a API substituída; `requests` registra as chamadas."""
+    openai.api_key = openai.api_key or 'sk-teste'
+    generator = YouTubeEbookGenerator(output_dir=str(Path(work_dir) / 'output'), bypass_completion_cache=bypass)
+    generator.completion_cache = LRUDiskCache(str(Path(work_dir) / 'completions'), 10)
+    generator.structured_output = True
+    requests = []
+    responses = {}
+
+    def create_completion(system_prompt, user_prompt, on_text, options):
+        requests.append((user_prompt, 'response_format' in options))
+        content = responses.get(user_prompt, json.dumps({'prompt': user_prompt}))
+        if on_text is not None:
+            on_text(content)
+        return content, SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+
+    generator._create_completion = create_completion
+    return generator, requests, responses
+
+
+def test_hit_and_miss():
+    """Testa que a mesma chamada vem do cache e chamadas diferentes vão à API."""
+    print('🧪 Testando acertos e falhas do cache...')
+    with tempfile.TemporaryDirectory() as work_dir:
+        generator, requests, _ = _make_generator(work_dir)
+
+        first = generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert len(requests) == 1
+
+        # Mesmos prompts e parâmetros: acerto no cache, sem nova chamada nem custo
+        cost = generator.total_cost_usd
+        received = []
+        assert generator._request_completion('sistema', 'prompt A', received.append, SCHEMA) == first
+        assert received == [first]
+        assert len(requests) == 1
+        assert generator.total_cost_usd == cost
+
+        # Outro prompt, outro sistema ou outro schema: falha no cache
+        generator._request_completion('sistema', 'prompt B', schema=SCHEMA)
+        generator._request_completion('outro sistema', 'prompt A', schema=SCHEMA)
+        generator._request_completion('sistema', 'prompt A')
+        assert len(requests) == 4
+
+        # Uma nova execução do gerador reaproveita as respostas gravadas em disco
+        generator, requests, _ = _make_generator(work_dir)
+        assert generator._request_completion('sistema', 'prompt A', schema=SCHEMA) == first
+        assert requests == []
+
+        # Com bypass, a chamada vai à API mesmo com a resposta no cache
+        generator, requests, _ = _make_generator(work_dir, bypass=True)
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert len(requests) == 1
+    print('✅ Cache reaproveita apenas chamadas idênticas')
+    return True
+
+
+def test_invalid_responses():
+    """Testa que respostas que não formam JSON não são guardadas e que respostas descartadas são geradas de novo."""
+    print('🧪 Testando respostas inválidas...')
+    with tempfile.TemporaryDirectory() as work_dir:
+        generator, requests, responses = _make_generator(work_dir)
+
+        responses['prompt texto'] = 'Desculpe, não consegui gerar o capítulo.'
+        generator._request_completion('sistema', 'prompt texto', schema=SCHEMA)
+        generator._request_completion('sistema', 'prompt texto', schema=SCHEMA)
+        assert len(requests) == 2
+
+        # Uma resposta guardada que se mostra inválida depois do parse sai do cache
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        generator._discard_cached_completion('sistema', 'prompt A')
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert len(requests) == 4
+    print('✅ Respostas inválidas geradas de novo')
+    return True
+
+
+def test_discard_after_fallback():
+    """Testa o descarte da chave usada quando o schema é recusado e a chamada segue sem ele."""
+    print('🧪 Testando descarte após desligar a saída estruturada...')
+    with tempfile.TemporaryDirectory() as work_dir:
+        generator, requests, _ = _make_generator(work_dir)
+        create_completion = generator._create_completion
+
+        def create_without_schema(system_prompt, user_prompt, on_text, options):
+            # Simula o modelo recusando o schema: o modo é desligado e a chamada vai sem response_format
+            generator.structured_output = False
+            return create_completion(system_prompt, user_prompt, on_text, {})
+
+        generator._create_completion = create_without_schema
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert requests == [('prompt A', False)]
+
+        # A resposta foi guardada com a chave da chamada sem schema e é reaproveitada
+        generator._create_completion = create_completion
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert len(requests) == 1
+
+        # O descarte remove exatamente essa chave
+        generator._discard_cached_completion('sistema', 'prompt A')
+        generator._request_completion('sistema', 'prompt A', schema=SCHEMA)
+        assert len(requests) == 2
+    print('✅ Chave descartada é a da resposta entregue')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_hit_and_miss()
+        test_invalid_responses()
+        test_discard_after_fallback()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Teste do cache LRU em disco
+
+Verifica, com arquivos em um diretório temporário, que o cache respeita o limite de
+tamanho, despeja primeiro as entradas acessadas há mais tempo e preserva a entrada
+recém-criada.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.cache import LRUDiskCache
+
+KB = 1024
+
+
+def _put_file(cache, key, size, work_dir):
+    """Cria um arquivo de `size` bytes e o move para uma nova entrada do cache."""
+    file_path = Path(work_dir) / f'{key}.mp3'
+    file_path.write_bytes(b'\0' * size)
+    return cache.put(key, [file_path])
+
+
+def _set_access(cache, key, timestamp):
+    """Define o horário de último acesso de uma entrada."""
+    os.utime(cache.entry_dir(key), (timestamp, timestamp))
+
+
+def test_put_and_get():
+    """Testa o armazenamento, a leitura e a remoção de entradas."""
+    print('🧪 Testando leitura e gravação...')
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as work_dir:
+        cache = LRUDiskCache(cache_dir, 0)
+
+        entry = _put_file(cache, 'video1', 10 * KB, work_dir)
+        assert cache.get('video1') == entry
+        assert (entry / 'video1.mp3').stat().st_size == 10 * KB
+        assert cache.get('ausente') is None
+
+        cache.put_json('resposta', 'completion.json', {'content': 'olá'})
+        assert cache.get_json('resposta', 'completion.json') == {'content': 'olá'}
+        assert cache.get_json('resposta', 'outro.json') is None
+
+        cache.remove('video1')
+        assert cache.get('video1') is None
+        # Diretórios temporários não contam como entradas
+        assert not any(p.name.startswith('.') for p in Path(cache_dir).iterdir())
+    print('✅ Entradas gravadas e lidas')
+    return True
+
+
+def test_eviction_order():
+    """Testa o despejo das entradas menos usadas recentemente."""
+    print('🧪 Testando ordem de despejo LRU...')
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as work_dir:
+        cache = LRUDiskCache(cache_dir, 100 * KB / (1024 * 1024))
+        now = time.time()
+
+        for i, key in enumerate(['a', 'b', 'c']):
+            _put_file(cache, key, 30 * KB, work_dir)
+            _set_access(cache, key, now - 300 + i * 60)
+
+        # Um acesso a 'a' a torna a entrada mais recente; 'b' passa a ser a menos usada
+        assert cache.get('a') is not None
+
+        _put_file(cache, 'd', 30 * KB, work_dir)
+
+        assert cache.get('b') is None
+        assert all(cache.get(key) is not None for key in ('a', 'c', 'd'))
+        assert cache.size_bytes() <= cache.max_size_bytes
+    print('✅ Entrada menos usada removida primeiro')
+    return True
+
+
+def test_size_limit():
+    """Testa o limite de tamanho e a preservação da entrada recém-criada."""
+    print('🧪 Testando limite de tamanho...')
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as work_dir:
+        cache = LRUDiskCache(cache_dir, 100 * KB / (1024 * 1024))
+        now = time.time()
+
+        for i in range(5):
+            _put_file(cache, f'video{i}', 30 * KB, work_dir)
+            _set_access(cache, f'video{i}', now - 300 + i * 60)
+        assert cache.size_bytes() <= cache.max_size_bytes
+        assert [cache.get(f'video{i}') is not None for i in range(5)] == [False, False, True, True, True]
+
+        # Uma entrada maior que o limite é mantida; as demais são despejadas
+        _put_file(cache, 'grande', 150 * KB, work_dir)
+        assert cache.get('grande') is not None
+        assert cache.size_bytes() == 150 * KB
+
+        # Sem limite (0), nada é despejado
+        unlimited = LRUDiskCache(cache_dir, 0)
+        assert unlimited.evict() == []
+    print('✅ Limite de tamanho respeitado')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_put_and_get()
+        test_eviction_order()
+        test_size_limit()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
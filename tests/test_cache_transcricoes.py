@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Teste do cache de transcrições
+
+Verifica, sem acessar a API, que a chave do cache depende apenas do conteúdo do áudio e do
+backend (modelo e formato), que as transcrições respeitam o limite de tamanho do cache LRU,
+que os documentos do cache JSON expiram após o TTL e que gravações simultâneas não colidem.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.cache import JSONTTLCache, LRUDiskCache, hash_file, make_cache_key
+
+
+def test_cache_key():
+    """Testa a chave gerada pelo hash do conteúdo e pelas configurações do backend."""
+    print('🧪 Testando chave do cache...')
+    with tempfile.TemporaryDirectory() as work_dir:
+        first = Path(work_dir) / 'segmento_001.mp3'
+        copy = Path(work_dir) / 'outro_nome.mp3'
+        other = Path(work_dir) / 'segmento_002.mp3'
+        first.write_bytes(b'audio' * 100000)
+        copy.write_bytes(b'audio' * 100000)
+        other.write_bytes(b'audio' * 100001)
+
+        # O nome do arquivo não importa; o conteúdo sim
+        assert hash_file(str(first)) == hash_file(str(copy))
+        assert hash_file(str(first)) != hash_file(str(other))
+        assert hash_file(str(first), chunk_size=7) == hash_file(str(first))
+
+        audio_hash = hash_file(str(first))
+        key = make_cache_key('transcription', audio_hash, 'openai:whisper-1:verbose_json')
+        assert key == make_cache_key('transcription', audio_hash, 'openai:whisper-1:verbose_json')
+        assert key != make_cache_key('transcription', audio_hash, 'local:small:verbose_json')
+        # Partes separadas não se confundem com a concatenação
+        assert make_cache_key('ab', 'c') != make_cache_key('a', 'bc')
+    print('✅ Chave depende do conteúdo e do backend')
+    return True
+
+
+def test_ttl_expiry():
+    """Testa a expiração dos documentos após o TTL."""
+    print('🧪 Testando expiração do cache JSON...')
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = JSONTTLCache(cache_dir, 3600)
+        cache.put('video1', {'title': 'Vídeo'})
+        assert cache.get('video1') == {'title': 'Vídeo'}
+        assert cache.get('ausente') is None
+
+        # Documento gravado há mais tempo que o TTL é descartado
+        path = cache._path('video1')
+        record = json.loads(path.read_text(encoding='utf-8'))
+        record['stored_at'] = time.time() - 3601
+        path.write_text(json.dumps(record), encoding='utf-8')
+        assert cache.get('video1') is None
+        assert not path.exists()
+
+        # TTL 0 não expira
+        permanent = JSONTTLCache(cache_dir, 0)
+        permanent.put('transcricao', {'text': 'olá'})
+        path = permanent._path('transcricao')
+        record = json.loads(path.read_text(encoding='utf-8'))
+        record['stored_at'] = 0
+        path.write_text(json.dumps(record), encoding='utf-8')
+        assert permanent.get('transcricao') == {'text': 'olá'}
+
+        # Documento corrompido é tratado como ausente
+        path.write_text('{"stored_at": ', encoding='utf-8')
+        assert permanent.get('transcricao') is None
+    print('✅ Documentos expiram após o TTL')
+    return True
+
+
+def test_transcription_size_limit():
+    """Testa o despejo das transcrições mais antigas quando o limite é ultrapassado."""
+    print('🧪 Testando limite do cache de transcrições...')
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = LRUDiskCache(cache_dir, 100 * 1024 / (1024 * 1024))
+        now = time.time()
+        transcription = {'text': 'palavra ' * 5000, 'duration': 600}
+
+        for i in range(4):
+            cache.put_json(f'segmento{i}', 'transcription.json', transcription)
+            entry = cache.entry_dir(f'segmento{i}')
+            os.utime(entry, (now - 300 + i * 60, now - 300 + i * 60))
+
+        assert cache.size_bytes() <= cache.max_size_bytes
+        assert cache.get_json('segmento0', 'transcription.json') is None
+        assert cache.get_json('segmento3', 'transcription.json') == transcription
+    print('✅ Cache de transcrições limitado')
+    return True
+
+
+def test_concurrent_put():
+    """Testa gravações simultâneas da mesma chave no cache JSON."""
+    print('🧪 Testando gravações simultâneas...')
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = JSONTTLCache(cache_dir, 0)
+        documents = [{'writer': i, 'text': str(i) * 20000} for i in range(8)]
+        errors = []
+
+        def put(document):
+            try:
+                cache.put('video1', document)
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=put, args=(document,)) for document in documents]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors
+        # O documento final é um dos gravados, inteiro, e nenhum temporário sobra no diretório
+        assert cache.get('video1') in documents
+        assert [path.suffix for path in Path(cache_dir).iterdir()] == ['.json']
+    print('✅ Gravações simultâneas não colidem')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_cache_key()
+        test_ttl_expiry()
+        test_transcription_size_limit()
+        test_concurrent_put()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
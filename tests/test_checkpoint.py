@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Teste dos checkpoints de transcrição
+
+Verifica que as transcrições salvas por segmento são reaproveitadas quando o job é retomado
+com o mesmo plano de segmentos e descartadas quando o plano muda.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.checkpoint import TranscriptionCheckpoint
+
+PLAN = [(0.0, 600.0), (598.0, 600.0), (1196.0, 304.0)]
+
+
+def test_resume_same_plan():
+    """Testa a retomada de um job com o mesmo plano."""
+    print('🧪 Testando retomada com o mesmo plano...')
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        checkpoint = TranscriptionCheckpoint(checkpoint_dir, 'job1')
+        assert checkpoint.bind_plan(PLAN) == 0
+        checkpoint.save(1, {'text': 'primeiro', 'duration': 600})
+        checkpoint.save(3, {'text': 'terceiro', 'duration': 304})
+
+        # Nova execução do mesmo job: os segmentos 1 e 3 não são enviados de novo
+        resumed = TranscriptionCheckpoint(checkpoint_dir, 'job1')
+        # Diferenças de arredondamento abaixo de 1 ms não mudam o plano
+        assert resumed.bind_plan([(start + 1e-5, duration) for start, duration in PLAN]) == 2
+        assert resumed.load(1) == {'text': 'primeiro', 'duration': 600}
+        assert resumed.load(2) is None
+        assert resumed.load(3)['text'] == 'terceiro'
+
+        # Outro job não vê os checkpoints
+        assert TranscriptionCheckpoint(checkpoint_dir, 'job2').load(1) is None
+
+        resumed.clear()
+        assert not resumed.job_dir.exists()
+    print('✅ Segmentos concluídos reaproveitados')
+    return True
+
+
+def test_plan_change_invalidates():
+    """Testa o descarte dos checkpoints quando o plano de segmentos muda."""
+    print('🧪 Testando mudança de plano...')
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        checkpoint = TranscriptionCheckpoint(checkpoint_dir, 'job1')
+        checkpoint.bind_plan(PLAN)
+        checkpoint.save(1, {'text': 'primeiro', 'duration': 600})
+        checkpoint.save(2, {'text': 'segundo', 'duration': 600})
+
+        # Cortes ajustados às pausas: os índices não correspondem mais aos mesmos trechos
+        new_plan = [(0.0, 591.0), (591.0, 560.0), (1151.0, 349.0)]
+        resumed = TranscriptionCheckpoint(checkpoint_dir, 'job1')
+        assert resumed.bind_plan(new_plan) == 0
+        assert resumed.load(1) is None and resumed.load(2) is None
+
+        # O novo plano fica associado ao job
+        resumed.save(1, {'text': 'novo', 'duration': 591})
+        assert TranscriptionCheckpoint(checkpoint_dir, 'job1').bind_plan(new_plan) == 1
+
+        # Checkpoint corrompido é tratado como segmento não concluído
+        resumed._segment_file(2).write_text('{"text": ', encoding='utf-8')
+        assert resumed.load(2) is None
+    print('✅ Checkpoints de outro plano descartados')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_resume_same_plan()
+        test_plan_change_invalidates()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Teste da contagem local de tokens
+
+Verifica a contagem de tokens de textos e de mensagens de chat (com os tokens de formatação
+do formato de chat), sem acessar a API da OpenAI. Funciona com o tiktoken instalado ou com
+a estimativa por caracteres.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.tokens import count_message_tokens, count_tokens
+
+MODEL = 'gpt-4o-mini'
+
+
+def test_count_tokens():
+    """Testa que a contagem cresce com o texto e é zero para texto vazio."""
+    print('🧪 Testando contagem de tokens de texto...')
+    short = count_tokens('Marketing digital para pequenas empresas.', MODEL)
+    long = count_tokens('Marketing digital para pequenas empresas. ' * 50, MODEL)
+    assert count_tokens('', MODEL) == 0
+    assert 0 < short < long
+    assert count_tokens('<|endoftext|>', MODEL) > 0  # Tokens especiais contados como texto
+    print(f'✅ {short} e {long} tokens')
+    return True
+
+
+def test_count_message_tokens():
+    """Testa que as mensagens incluem os tokens de formatação do chat."""
+    print('🧪 Testando contagem de mensagens...')
+    messages = [
+        {'role': 'system', 'content': 'Você é um especialista em ebooks.'},
+        {'role': 'user', 'content': 'Transforme a transcrição em um ebook.'},
+    ]
+    content_tokens = sum(count_tokens(m['role'], MODEL) + count_tokens(m['content'], MODEL) for m in messages)
+    total = count_message_tokens(messages, MODEL)
+    assert total == content_tokens + 3 * len(messages) + 3, total
+    print(f'✅ {total} tokens de entrada ({total - content_tokens} de formatação)')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_count_tokens()
+        test_count_message_tokens()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,7 +9,9 @@ import sys
 from pathlib import Path
 
 # Adiciona o diretório do projeto ao path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.json_repair import repair_json
 
 
 def test_json_parsing():
@@ -37,55 +39,10 @@ def test_json_parsing():
 
             print('\n🔧 Testando estratégias de correção...')
 
-            # Função de limpeza (copiada do main.py)
-            def clean_json_content(json_str: str) -> str:
-                """Limpa e corrige problemas comuns em JSON gerado por IA."""
-                import re
-
-                print(f'📝 JSON original (primeiros 200 chars): {json_str[:200]}...')
-
-                # Remove markdown code blocks se existirem
-                json_str = re.sub(r'```json\s*', '', json_str)
-                json_str = re.sub(r'```\s*$', '', json_str)
-                print('✓ Removidos code blocks markdown')
-
-                # Remove texto antes e depois do JSON
-                json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
-                    print('✓ Extraído apenas o JSON')
-
-                # Corrige aspas simples para duplas (problema comum)
-                original_len = len(json_str)
-                json_str = re.sub(r"'([^']*)':", r'"\1":', json_str)
-                if len(json_str) != original_len:
-                    print('✓ Corrigidas aspas simples para duplas')
-
-                # Corrige trailing commas
-                original_len = len(json_str)
-                json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-                if len(json_str) != original_len:
-                    print('✓ Removidas trailing commas')
-
-                # Corrige quebras de linha dentro de strings
-                original_len = len(json_str)
-                json_str = re.sub(r'"\s*\n\s*([^"]*)\s*\n\s*"', r'"\1"', json_str)
-                if len(json_str) != original_len:
-                    print('✓ Corrigidas quebras de linha em strings')
-
-                print(f'📝 JSON limpo (primeiros 200 chars): {json_str[:200]}...')
-                return json_str
-
-            # Testa estratégias
+            # Testa estratégias (as mesmas do main.py)
             strategies = [
                 ('Parse direto', lambda x: json.loads(x)),
-                ('Com limpeza', lambda x: json.loads(clean_json_content(x))),
-                (
-                    'Com limpeza de caracteres',
-                    lambda x: json.loads(
-                        clean_json_content(''.join(ch for ch in x if ord(ch) >= 32 or ch in '\n\r\t'))
-                    ),
-                ),
+                ('Com correção tolerante', lambda x: json.loads(repair_json(x))),
             ]
 
             for strategy_name, strategy_func in strategies:
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Teste da divisão de transcrições longas
+
+Verifica que a transcrição é dividida em partes dentro do limite de tamanho, quebrando
+no fim das frases e sem perder texto, e que o esboço cobre toda a transcrição, sem
+acessar a API da OpenAI.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.chunking import assign_outline_spans, split_transcript
+
+
+def test_split_on_sentences():
+    """Testa a divisão no fim das frases, preservando todo o texto."""
+    print('🧪 Testando divisão por frases...')
+    text = ' '.join(f'Esta é a frase número {i}.' for i in range(2000))
+
+    chunks = split_transcript(text, 1000)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.endswith('.') for chunk in chunks)
+    assert ' '.join(chunks) == text
+    print(f'✅ {len(chunks)} partes geradas')
+    return True
+
+
+def test_split_long_sentence():
+    """Testa a divisão por palavras de uma frase maior que o limite."""
+    print('🧪 Testando frase maior que o limite...')
+    text = ' '.join(['palavra'] * 500)
+
+    chunks = split_transcript(text, 100)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert ' '.join(chunks) == text
+    assert split_transcript('   ', 100) == []
+    print('✅ Frase longa dividida por palavras')
+    return True
+
+
+def test_outline_spans():
+    """Testa a conversão dos blocos do esboço em intervalos contíguos."""
+    print('🧪 Testando intervalos do esboço...')
+    outline = [{'start_block': 2}, {'start_block': 5}, {'start_block': 4}, {'start_block': 'x'}]
+
+    spans = assign_outline_spans(outline, 12)
+
+    assert spans[0][0] == 0 and spans[-1][1] == 12
+    assert all(prev[1] == cur[0] for prev, cur in zip(spans, spans[1:]))
+    assert spans == [(0, 4), (4, 5), (5, 9), (9, 12)], spans
+    assert all(end > start for start, end in assign_outline_spans(outline, 2))
+    print('✅ Intervalos cobrem toda a transcrição')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_split_on_sentences()
+        test_split_long_sentence()
+        test_outline_spans()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
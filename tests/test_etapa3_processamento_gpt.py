@@ -14,7 +14,9 @@ from pathlib import Path
 # Adiciona o diretório raiz ao path para importar main
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config import OPENAI_GPT_COST_PER_1K_TOKENS, OPENAI_GPT_MODEL
 from main import YouTubeEbookGenerator
+from pipeline.tokens import count_tokens
 
 
 def find_latest_transcription():
@@ -61,8 +63,8 @@ def test_gpt_processing():
         print(f'📝 Palavras: {len(transcription_text.split())}')
 
         # Estima custo do processamento GPT
-        estimated_tokens = len(transcription_text) // 3  # Estimativa aproximada
-        estimated_cost = (estimated_tokens / 1000) * 0.00015  # Custo GPT-4o-mini
+        estimated_tokens = count_tokens(transcription_text, OPENAI_GPT_MODEL)
+        estimated_cost = (estimated_tokens / 1000) * OPENAI_GPT_COST_PER_1K_TOKENS
         cost_brl = estimated_cost * 5.48
 
         print('\n💰 Custo estimado do processamento GPT:')
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Teste das importações do main.py
+
+Verifica, sem importar o main.py (que depende da OpenAI, do yt-dlp e do WeasyPrint), que
+toda configuração de `pipeline.settings` e todo nome exportado por `pipeline` usados no
+código estão nas importações explícitas. Um nome usado e não importado só aparece como
+NameError quando aquele trecho roda.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pipeline
+import pipeline.settings as settings
+
+MAIN_FILE = Path(__file__).parent.parent / 'main.py'
+
+
+def _check_import_block(module_name, names):
+    """Compara os nomes usados no main.py com os importados no bloco `from <módulo> import (...)`."""
+    source = MAIN_FILE.read_text(encoding='utf-8')
+    block = re.search(rf'^from {re.escape(module_name)} import \((.*?)\)', source, re.S | re.M)
+    assert block, f'bloco de importação de {module_name} não encontrado'
+
+    imported = {name.strip() for name in block.group(1).split(',') if name.strip()}
+    code = source.replace(block.group(0), '')
+    used = {name for name in names if re.search(rf'\b{name}\b', code)}
+
+    missing = used - imported
+    unused = imported - used
+    assert not missing, f'usados sem importação de {module_name}: {sorted(missing)}'
+    assert not unused, f'importados sem uso de {module_name}: {sorted(unused)}'
+    return used
+
+
+def test_settings_imports():
+    """Testa as configurações de pipeline.settings usadas no main.py."""
+    print('🧪 Testando importações de pipeline.settings...')
+    names = [name for name in dir(settings) if name.isupper()]
+    used = _check_import_block('pipeline.settings', names)
+    print(f'✅ {len(used)} configurações importadas e usadas')
+    return True
+
+
+def test_pipeline_imports():
+    """Testa os nomes de pipeline usados no main.py."""
+    print('🧪 Testando importações de pipeline...')
+    used = _check_import_block('pipeline', pipeline.__all__)
+    print(f'✅ {len(used)} nomes importados e usados')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_settings_imports()
+        test_pipeline_imports()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
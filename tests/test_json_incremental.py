@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Teste do parser incremental de JSON
+
+Verifica que os capítulos são emitidos assim que cada objeto fecha, independentemente de
+como a resposta é dividida em pedaços, e que o resultado parcial é preservado quando a
+resposta é interrompida.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.streaming import IncrementalJSONParser
+
+EXAMPLE_FILE = Path(__file__).parent.parent / 'template' / 'ebook_content_example.json'
+
+
+def _example_text():
+    """Carrega o exemplo de conteúdo do ebook como texto JSON."""
+    return EXAMPLE_FILE.read_text(encoding='utf-8')
+
+
+def _feed_in_chunks(parser, text, seed):
+    """Alimenta o parser com pedaços de tamanho aleatório."""
+    rng = random.Random(seed)
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 40)
+        parser.feed(text[pos : pos + size])
+        pos += size
+
+
+def test_random_chunks():
+    """Testa que qualquer divisão em pedaços produz o mesmo resultado do json.loads."""
+    print('🧪 Testando divisão aleatória em pedaços...')
+    text = _example_text()
+    expected = json.loads(text)
+    expected_fields = {key: value for key, value in expected.items() if key != 'chapters'}
+
+    for seed in range(20):
+        parser = IncrementalJSONParser('chapters')
+        _feed_in_chunks(parser, '```json\n' + text + '\n```', seed)
+        assert parser.items == expected['chapters'], f'capítulos divergentes (seed {seed})'
+        assert parser.fields == expected_fields, f'campos divergentes (seed {seed})'
+    print(f'✅ {len(expected["chapters"])} capítulos e {len(expected_fields)} campos em todas as divisões')
+    return True
+
+
+def test_chapter_emitted_on_close():
+    """Testa que cada capítulo é emitido no pedaço em que o objeto fecha."""
+    print('🧪 Testando emissão por capítulo...')
+    parser = IncrementalJSONParser('chapters')
+    assert parser.feed('{"title": "Livro", "chapters": [{"title": "Um", "content": "a}b"') == []
+    assert parser.feed('}, {"title": "Do') == [{'title': 'Um', 'content': 'a}b'}]
+    assert parser.feed('is", "note": null}') == [{'title': 'Dois', 'note': None}]
+    assert parser.fields == {'title': 'Livro'}
+    print('✅ Capítulos emitidos assim que fecham')
+    return True
+
+
+def test_partial_result_kept():
+    """Testa que uma resposta interrompida mantém os capítulos e campos completos."""
+    print('🧪 Testando resposta interrompida...')
+    text = _example_text()
+    expected = json.loads(text)
+    cut = text.index('"chapters"') + len(json.dumps(expected['chapters'][0])) + 40
+
+    parser = IncrementalJSONParser('chapters')
+    parser.feed(text[:cut])
+    assert parser.items == expected['chapters'][:1], parser.items
+    assert 'chapters' not in parser.fields
+    print(f'✅ {len(parser.items)} capítulo(s) e {len(parser.fields)} campo(s) preservados')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_random_chunks()
+        test_chapter_emitted_on_close()
+        test_partial_result_kept()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
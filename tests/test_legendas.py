@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Teste da conversão de legendas do YouTube
+
+Verifica que legendas WebVTT (manuais e automáticas) e SRV3 são convertidas para a
+estrutura de transcrição com timestamps por palavra, sem acessar a rede.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.captions import is_caption_usable, is_original_caption, parse_srv, parse_vtt, select_caption_track
+
+AUTO_VTT = """WEBVTT
+Kind: captions
+Language: pt
+
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+\x20
+olá<00:00:00.500><c> pessoal</c><00:00:01.000><c> tudo</c><00:00:01.500><c> bem</c>
+
+00:00:02.000 --> 00:00:02.010 align:start position:0%
+olá pessoal tudo bem
+\x20
+
+00:00:02.010 --> 00:00:04.000 align:start position:0%
+olá pessoal tudo bem
+hoje<00:00:02.500><c> vamos</c><00:00:03.000><c> falar</c>
+"""
+
+MANUAL_VTT = """WEBVTT
+
+1
+00:00:01.000 --> 00:00:03.000
+Bem-vindos ao <i>curso</i>
+
+2
+00:00:03.000 --> 00:00:05.000
+Perguntas &amp; respostas
+"""
+
+SRV3 = """<?xml version="1.0" encoding="utf-8" ?><timedtext format="3"><body>
+<p t="0" d="2000" w="1"><s ac="0">olá</s><s t="1000" ac="0"> mundo</s></p>
+<p t="2000" d="1000">segunda linha</p>
+</body></timedtext>"""
+
+
+def test_automatic_vtt():
+    """Testa legendas automáticas com tempo por palavra e linhas repetidas."""
+    print('🧪 Testando VTT automático...')
+    result = parse_vtt(AUTO_VTT)
+
+    assert result['text'] == 'olá pessoal tudo bem hoje vamos falar', result['text']
+    assert result['words'][1] == ['pessoal', 0.5, 1.0]
+    assert result['words'][4] == ['hoje', 2.01, 2.5]
+    assert result['duration'] == 4.0
+    print('✅ VTT automático convertido')
+    return True
+
+
+def test_manual_vtt():
+    """Testa legendas manuais, com tags e entidades HTML."""
+    print('🧪 Testando VTT manual...')
+    result = parse_vtt(MANUAL_VTT)
+
+    assert result['text'] == 'Bem-vindos ao curso Perguntas & respostas', result['text']
+    assert result['words'][0][1] == 1.0
+    assert result['words'][-1][2] == 5.0
+    print('✅ VTT manual convertido')
+    return True
+
+
+def test_srv3():
+    """Testa o formato SRV3 com tempos por palavra relativos ao parágrafo."""
+    print('🧪 Testando SRV3...')
+    result = parse_srv(SRV3)
+
+    assert result['text'] == 'olá mundo segunda linha', result['text']
+    assert result['words'][1] == ['mundo', 1.0, 2.0]
+    print('✅ SRV3 convertido')
+    return True
+
+
+def test_track_selection_and_quality():
+    """Testa a preferência por legendas manuais e o limite de densidade de palavras."""
+    print('🧪 Testando escolha da legenda...')
+    requested = {'en': {'filepath': 'a.en.vtt'}, 'pt': {'filepath': 'a.pt.vtt'}}
+
+    assert select_caption_track(requested, ['en'], ['pt', 'en'])[0] == 'en'
+    assert select_caption_track(requested, [], ['pt', 'en'], 'pt')[0] == 'pt'
+    assert select_caption_track(requested, [], ['es'], 'es') is None
+
+    result = parse_vtt(AUTO_VTT)
+    assert is_caption_usable(result, 4, 60)
+    assert not is_caption_usable(result, 600, 60)
+    print('✅ Escolha da legenda OK')
+    return True
+
+
+def test_translated_automatic_track():
+    """Testa que traduções automáticas do YouTube não são usadas como legenda."""
+    print('🧪 Testando faixa automática traduzida...')
+    # Vídeo em inglês: 'pt' é tradução automática; 'en-orig' é o reconhecimento do áudio
+    requested = {
+        'pt': {'filepath': 'a.pt.vtt'},
+        'en': {'filepath': 'a.en.vtt'},
+        'en-orig': {'filepath': 'a.en-orig.vtt'},
+    }
+    assert select_caption_track(requested, [], ['pt', 'en'], 'en')[0] == 'en'
+    assert select_caption_track(requested, [], ['pt'], 'en') is None
+    # Sem o idioma do vídeo, só a faixa '-orig' é aceita
+    assert select_caption_track(requested, [], ['pt', 'en'])[0] == 'en-orig'
+    # Legenda manual em português continua tendo preferência
+    assert select_caption_track(requested, ['pt'], ['pt', 'en'], 'en')[0] == 'pt'
+
+    assert is_original_caption('en-orig', None)
+    assert is_original_caption('pt-BR', 'pt')
+    assert not is_original_caption('pt', 'en')
+    print('✅ Tradução automática ignorada')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_automatic_vtt()
+        test_manual_vtt()
+        test_srv3()
+        test_track_selection_and_quality()
+        test_translated_automatic_track()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste da combinação de segmentos com sobreposição
+
+Verifica que as palavras repetidas na região sobreposta entre dois segmentos aparecem
+apenas uma vez no texto combinado, sem acessar a API da OpenAI.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.merge import merge_segment_transcripts
+
+
+def _segment(words, duration):
+    """Cria o resultado de um segmento com uma palavra por segundo (timestamps relativos)."""
+    return {
+        'text': ' '.join(words),
+        'duration': duration,
+        'words': [[word, float(i), i + 0.5] for i, word in enumerate(words)],
+    }
+
+
+def test_overlap_alignment():
+    """Testa a remoção da sobreposição quando as palavras se alinham."""
+    print('🧪 Testando alinhamento da sobreposição...')
+    first = [f'p{i}' for i in range(12)]  # 0s a 12s
+    second = [f'p{i}' for i in range(10, 20)]  # 10s a 20s (2s sobrepostos)
+
+    merged = merge_segment_transcripts([_segment(first, 12), _segment(second, 10)], [0, 10])
+
+    assert merged['text'] == ' '.join(f'p{i}' for i in range(20)), merged['text']
+    assert merged['overlap_words_removed'] == 2
+    assert [w[1] for w in merged['words']] == sorted(w[1] for w in merged['words'])
+    print('✅ Palavras duplicadas removidas')
+    return True
+
+
+def test_overlap_without_alignment():
+    """Testa o corte no meio da sobreposição quando não há alinhamento confiável."""
+    print('🧪 Testando corte sem alinhamento...')
+    first = [f'a{i}' for i in range(12)]
+    second = [f'b{i}' for i in range(10, 20)]
+
+    merged = merge_segment_transcripts([_segment(first, 12), _segment(second, 10)], [0, 10])
+
+    assert len(merged['text'].split()) == 20
+    assert merged['overlap_words_removed'] == 2
+    print('✅ Corte no meio da sobreposição')
+    return True
+
+
+def test_text_differs_from_words():
+    """Testa o corte do texto quando os tokens do texto e as palavras com timestamp não coincidem."""
+    print('🧪 Testando texto com hífens e pontuação...')
+    first = {
+        'text': 'hoje falamos de redes neurais e do estado-da-arte.',
+        'duration': 10,
+        'words': [
+            [word, float(i), i + 0.5]
+            for i, word in enumerate(['hoje', 'falamos', 'de', 'redes', 'neurais', 'e', 'do', 'estado', 'da', 'arte'])
+        ],
+    }
+    second = {
+        'text': 'do estado-da-arte em visão computacional.',
+        'duration': 7,
+        'words': [
+            [word, float(i), i + 0.5]
+            for i, word in enumerate(['do', 'estado', 'da', 'arte', 'em', 'visão', 'computacional'])
+        ],
+    }
+
+    merged = merge_segment_transcripts([first, second], [0, 6])
+
+    assert merged['text'] == 'hoje falamos de redes neurais e do estado-da-arte em visão computacional.', merged['text']
+    assert merged['overlap_words_removed'] == 4
+    assert [w[0] for w in merged['words']][4:8] == ['neurais', 'e', 'do', 'estado']
+
+    # Palavra com timestamp ausente do texto ('1500' escrito como '1.500'); a sobreposição vem do segmento seguinte
+    first = _segment([f'p{i}' for i in range(10)] + ['custa', '1500'], 12)
+    first['text'] = ' '.join(f'p{i}' for i in range(10)) + ', custa 1.500'
+    second = {
+        'text': 'Custa 1.500 reais, à vista.',
+        'duration': 6,
+        'words': [[word, float(i), i + 0.5] for i, word in enumerate(['custa', '1500', 'reais', 'à', 'vista'])],
+    }
+
+    merged = merge_segment_transcripts([first, second], [0, 10])
+
+    assert merged['text'] == 'p0 p1 p2 p3 p4 p5 p6 p7 p8 p9, Custa 1.500 reais, à vista.', merged['text']
+    print('✅ Texto cortado na posição das palavras removidas')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_overlap_alignment()
+        test_overlap_without_alignment()
+        test_text_differs_from_words()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Teste do planejamento dos segmentos de áudio
+
+Verifica, sem FFmpeg nem acesso à API, os cortes planejados pelo bitrate real do arquivo e
+o ajuste dos cortes às pausas da fala, inclusive a junção de um último segmento curto.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.audio import plan_segments_by_size, plan_silence_segments
+
+MB = 1024 * 1024
+
+
+def _assert_covers(plan, duration):
+    """Confere que o plano começa em 0, termina no fim do áudio e não deixa buracos."""
+    assert plan[0][0] == 0
+    assert abs(plan[-1][0] + plan[-1][1] - duration) < 1e-6
+    assert all(start + length >= next_start for (start, length), (next_start, _) in zip(plan, plan[1:]))
+
+
+def test_plan_by_size():
+    """Testa o número de segmentos e o tamanho estimado dentro do limite da API."""
+    print('🧪 Testando planejamento pelo bitrate...')
+    # 2 horas a 128 kbps (~115 MB) com limite de 25 MB e 10% de margem
+    size_plan = plan_segments_by_size(7200, 128000, 25 * MB, 0.1, 2)
+
+    assert size_plan['count'] == len(size_plan['plan']) == 5, size_plan['count']
+    assert all(size <= 25 * MB * 0.9 for size in size_plan['estimated_bytes'])
+    assert all(length <= size_plan['max_segment_seconds'] for _, length in size_plan['plan'])
+    _assert_covers(size_plan['plan'], 7200)
+
+    single = plan_segments_by_size(600, 64000, 25 * MB, 0.1, 2)
+    assert single['count'] == 1 and single['plan'] == [(0.0, 600)]
+
+    try:
+        plan_segments_by_size(600, 10**9, 25 * MB, 0.1, 2)
+        raise AssertionError('bitrate acima do limite deveria falhar')
+    except ValueError:
+        pass
+    print(f'✅ {size_plan["count"]} segmentos abaixo do limite')
+    return True
+
+
+def test_plan_on_silence():
+    """Testa os cortes nas pausas e a sobreposição só nos cortes sem pausa."""
+    print('🧪 Testando cortes nas pausas...')
+    silences = [(100, 101), (590, 592), (1150, 1152)]
+
+    plan = plan_silence_segments(1500, silences, 600, 2, 120)
+
+    # Corte em 591 (pausa), em 1151 (pausa) e nenhum corte fixo
+    assert plan == [(0.0, 591.0), (591.0, 560.0), (1151.0, 349.0)], plan
+    _assert_covers(plan, 1500)
+
+    no_pause = plan_silence_segments(1500, [], 600, 2, 120)
+    assert no_pause[:2] == [(0.0, 600), (598.0, 600)], no_pause
+    _assert_covers(no_pause, 1500)
+    print('✅ Cortes ajustados às pausas')
+    return True
+
+
+def test_short_last_segment():
+    """Testa a junção de um último segmento mais curto que o mínimo."""
+    print('🧪 Testando último segmento curto...')
+    # Sem mínimo, sobra um último segmento de 14s
+    plan = plan_silence_segments(1210, [], 600, 2, 120)
+    assert plan[-1][1] < 30
+
+    # Sem pausa que respeite o mínimo, os dois últimos são divididos de novo ao meio
+    assert plan_silence_segments(610, [(595, 597)], 600, 2, 120, 30) == [(0.0, 305.0), (303.0, 307.0)]
+    plan = plan_silence_segments(1210, [], 600, 2, 120, 30)
+    assert len(plan) == 3 and all(length >= 30 for _, length in plan), plan
+    assert all(length <= 600 for _, length in plan)
+    _assert_covers(plan, 1210)
+
+    # Com pausa disponível, o novo corte é feito na pausa mais tardia que respeita o mínimo
+    silences = [(595, 597), (1099, 1101), (1189, 1191)]
+    assert plan_silence_segments(1210, silences, 600, 2, 120)[-1] == (1190.0, 20.0)
+    plan = plan_silence_segments(1210, silences, 600, 2, 120, 30)
+    assert plan == [(0.0, 596.0), (596.0, 504.0), (1100.0, 110.0)], plan
+    print('✅ Nenhum segmento abaixo da duração mínima')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_plan_by_size()
+        test_plan_on_silence()
+        test_short_last_segment()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
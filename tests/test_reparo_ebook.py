@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Teste da correção parcial do ebook
+
+Verifica que apenas os capítulos inválidos e os campos ausentes são gerados de novo, com o
+trecho da transcrição correspondente a cada capítulo, e que o restante da resposta é mantido.
+As chamadas ao GPT são substituídas por funções locais (sem acesso à API).
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar main
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openai
+
+from main import YouTubeEbookGenerator
+
+VIDEO_INFO = {'title': 'Vídeo de Teste', 'uploader': 'Canal', 'duration': 600}
+TRANSCRIPTION = ' '.join(f'Frase número {i} da transcrição.' for i in range(600))
+
+
+def _make_generator(output_dir):
+    """Cria o gerador com as chamadas ao GPT registradas em `calls` em vez de enviadas à API."""
+    openai.api_key = openai.api_key or 'sk-teste'
+    generator = YouTubeEbookGenerator(output_dir=output_dir)
+    calls = []
+    lock = threading.Lock()
+
+    def generate_ebook_chapter(video_info, chapter_title, chapter_number, total, text, summary=None):
+        with lock:
+            calls.append(('chapter', chapter_title, chapter_number, total, text))
+        return {'title': f'Capítulo {chapter_number} refeito', 'content': text[:50]}
+
+    def request_ebook_frame(video_info, chapters):
+        with lock:
+            calls.append(('frame', [chapter['title'] for chapter in chapters]))
+        return {'title': 'Outro título', 'conclusion': 'Conclusão gerada', 'key_points': ['Ponto']}
+
+    generator.generate_ebook_chapter = generate_ebook_chapter
+    generator._request_ebook_frame = request_ebook_frame
+    return generator, calls
+
+
+def _ebook(chapters, **fields):
+    """Monta um ebook completo com os capítulos informados."""
+    ebook = {
+        'title': 'Título',
+        'subtitle': 'Subtítulo',
+        'author': 'Autor',
+        'description': 'Descrição',
+        'chapters': chapters,
+        'conclusion': 'Conclusão',
+        'key_points': ['Ponto'],
+    }
+    ebook.update(fields)
+    return ebook
+
+
+def test_regenerates_only_invalid():
+    """Testa a regeneração apenas do capítulo inválido e do campo ausente."""
+    print('🧪 Testando correção de um capítulo e um campo...')
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator, calls = _make_generator(output_dir)
+        first = {'title': 'Um', 'content': 'Conteúdo 1'}
+        third = {'title': 'Três', 'content': 'Conteúdo 3'}
+        ebook = _ebook([first, {'title': 'Dois'}, third])
+        del ebook['conclusion']
+
+        repaired = generator._repair_ebook_structure(ebook, VIDEO_INFO, TRANSCRIPTION)
+
+        chapter_calls = [call for call in calls if call[0] == 'chapter']
+        assert len(chapter_calls) == 1, calls
+        _, title, number, total, text = chapter_calls[0]
+        assert (title, number, total) == ('Dois', 2, 3)
+        # O capítulo 2 recebe o terço do meio da transcrição
+        assert text and text in TRANSCRIPTION
+        assert 'Frase número 0 ' not in text and 'Frase número 599 ' not in text
+
+        assert repaired['chapters'][0] is first and repaired['chapters'][2] is third
+        assert repaired['chapters'][1]['title'] == 'Capítulo 2 refeito'
+
+        # Os campos ausentes vêm de uma chamada baseada nos capítulos válidos; os presentes são mantidos
+        assert ('frame', ['Um', 'Três']) in calls
+        assert repaired['conclusion'] == 'Conclusão gerada'
+        assert repaired['title'] == 'Título'
+        generator._check_ebook_structure(repaired)
+    print('✅ Apenas o capítulo e o campo inválidos foram gerados de novo')
+    return True
+
+
+def test_nothing_to_repair():
+    """Testa que um ebook válido, ou sem capítulo aproveitável, não gera chamadas."""
+    print('🧪 Testando ebook sem correção possível ou necessária...')
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator, calls = _make_generator(output_dir)
+
+        valid = _ebook([{'title': 'Um', 'content': 'Conteúdo'}])
+        assert generator._repair_ebook_structure(valid, VIDEO_INFO, TRANSCRIPTION) is valid
+
+        all_invalid = _ebook([{'title': 'Um'}, 'texto solto'])
+        assert generator._repair_ebook_structure(all_invalid, VIDEO_INFO, TRANSCRIPTION) is all_invalid
+
+        no_chapters = _ebook([])
+        assert generator._repair_ebook_structure(no_chapters, VIDEO_INFO, TRANSCRIPTION) is no_chapters
+        assert calls == []
+    print('✅ Nenhuma chamada desnecessária')
+    return True
+
+
+def test_non_object_chapter():
+    """Testa a regeneração de um capítulo que não veio como objeto."""
+    print('🧪 Testando capítulo que não é objeto...')
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator, calls = _make_generator(output_dir)
+        ebook = _ebook([{'title': 'Um', 'content': 'Conteúdo'}, 'texto solto'])
+
+        repaired = generator._repair_ebook_structure(ebook, VIDEO_INFO, TRANSCRIPTION)
+
+        assert calls == [('chapter', None, 2, 2, calls[0][4])]
+        assert repaired['chapters'][1]['title'] == 'Capítulo 2 refeito'
+    print('✅ Capítulo gerado de novo sem título')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_regenerates_only_invalid()
+        test_nothing_to_repair()
+        test_non_object_chapter()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
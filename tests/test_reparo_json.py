@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Teste da correção tolerante de JSON
+
+Verifica que as respostas malformadas mais comuns do GPT (blocos de código, vírgulas
+sobrando, aspas simples, quebras de linha e caracteres de controle em strings) são
+corrigidas em uma única passada, sem alterar o conteúdo.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.json_repair import repair_json
+
+
+def _loads(text):
+    """Corrige e faz o parse do texto."""
+    return json.loads(repair_json(text))
+
+
+def test_code_fence_and_surrounding_text():
+    """Testa a remoção de blocos de código e texto ao redor do JSON."""
+    print('🧪 Testando bloco de código e texto ao redor...')
+    text = 'Aqui está o ebook:\n```json\n{"title": "Livro {1}", "chapters": []}\n```\nEspero que ajude!'
+    assert _loads(text) == {'title': 'Livro {1}', 'chapters': []}
+    print('✅ Texto ao redor ignorado')
+    return True
+
+
+def test_trailing_commas():
+    """Testa a remoção de vírgulas antes de '}' e ']', preservando vírgulas em strings."""
+    print('🧪 Testando vírgulas sobrando...')
+    text = '{"points": ["a, ]", "b",\n ],\n "n": {"x": 1,},}'
+    assert _loads(text) == {'points': ['a, ]', 'b'], 'n': {'x': 1}}
+    print('✅ Vírgulas removidas')
+    return True
+
+
+def test_single_quotes():
+    """Testa chaves e valores entre aspas simples."""
+    print('🧪 Testando aspas simples...')
+    text = "{'title': 'O \"melhor\" livro', 'author': 'D\\'Ávila', \"quote\": \"it's\"}"
+    assert _loads(text) == {'title': 'O "melhor" livro', 'author': "D'Ávila", 'quote': "it's"}
+    print('✅ Aspas simples convertidas')
+    return True
+
+
+def test_control_characters_in_strings():
+    """Testa quebras de linha cruas e caracteres de controle dentro de strings."""
+    print('🧪 Testando caracteres de controle...')
+    text = '{"content": "Primeiro parágrafo.\n\nSegundo\tparágrafo.\x00\x08", "ok": "a\\"b"}'
+    assert _loads(text) == {'content': 'Primeiro parágrafo.\n\nSegundo\tparágrafo.', 'ok': 'a"b'}
+    print('✅ Caracteres de controle corrigidos')
+    return True
+
+
+def test_valid_json_unchanged():
+    """Testa que um JSON válido continua com o mesmo conteúdo após a correção."""
+    print('🧪 Testando JSON válido...')
+    example_file = Path(__file__).parent.parent / 'template' / 'ebook_content_example.json'
+    text = example_file.read_text(encoding='utf-8')
+    assert _loads(text) == json.loads(text)
+    print('✅ Conteúdo preservado')
+    return True
+
+
+def test_truncated_response_still_fails():
+    """Testa que uma resposta truncada não é completada silenciosamente."""
+    print('🧪 Testando resposta truncada...')
+    try:
+        _loads('{"title": "Livro", "chapters": [{"title": "Um", "content": "texto cort')
+    except json.JSONDecodeError:
+        print('✅ Resposta truncada continua inválida')
+        return True
+    raise AssertionError('resposta truncada foi aceita')
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_code_fence_and_surrounding_text()
+        test_trailing_commas()
+        test_single_quotes()
+        test_control_characters_in_strings()
+        test_valid_json_unchanged()
+        test_truncated_response_still_fails()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Teste dos schemas de saída estruturada
+
+Verifica que o exemplo de conteúdo do ebook segue o schema enviado à API e que os schemas
+atendem às regras do modo estrito (todas as propriedades obrigatórias, sem campos extras).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.schemas import (
+    CHAPTER_SCHEMA,
+    EBOOK_FRAME_SCHEMA,
+    EBOOK_OUTLINE_SCHEMA,
+    EBOOK_SCHEMA,
+    ebook_continuation_schema,
+    json_schema_response_format,
+    missing_ebook_fields,
+)
+from prompts.user_prompt_ebook import get_user_prompt_ebook_continuation
+
+EXAMPLE_FILE = Path(__file__).parent.parent / 'template' / 'ebook_content_example.json'
+
+_TYPES = {'string': str, 'integer': int, 'array': list, 'object': dict}
+
+
+def _errors(value, schema, path='$'):
+    """Valida um valor contra o subconjunto de JSON Schema usado nos schemas do ebook."""
+    if not isinstance(value, _TYPES[schema['type']]):
+        return [f'{path}: esperado {schema["type"]}']
+    errors = []
+    if schema['type'] == 'object':
+        for key in schema['required']:
+            if key not in value:
+                errors.append(f'{path}.{key}: ausente')
+        for key, item in value.items():
+            if key not in schema['properties']:
+                errors.append(f'{path}.{key}: campo extra')
+            else:
+                errors.extend(_errors(item, schema['properties'][key], f'{path}.{key}'))
+    elif schema['type'] == 'array':
+        for i, item in enumerate(value):
+            errors.extend(_errors(item, schema['items'], f'{path}[{i}]'))
+    return errors
+
+
+def _strict_errors(schema, path='$'):
+    """Verifica as regras do modo estrito em todos os objetos do schema."""
+    errors = []
+    if schema['type'] == 'object':
+        if schema.get('additionalProperties') is not False:
+            errors.append(f'{path}: additionalProperties deve ser false')
+        if sorted(schema['required']) != sorted(schema['properties']):
+            errors.append(f'{path}: todas as propriedades devem ser obrigatórias')
+        for key, item in schema['properties'].items():
+            errors.extend(_strict_errors(item, f'{path}.{key}'))
+    elif schema['type'] == 'array':
+        errors.extend(_strict_errors(schema['items'], f'{path}[]'))
+    return errors
+
+
+def test_example_matches_schema():
+    """Testa que o exemplo do template é aceito pelo schema do ebook."""
+    print('🧪 Testando exemplo do template contra o schema...')
+    example = json.loads(EXAMPLE_FILE.read_text(encoding='utf-8'))
+    errors = _errors(example, EBOOK_SCHEMA)
+    assert not errors, errors
+    for chapter in example['chapters']:
+        assert not _errors(chapter, CHAPTER_SCHEMA)
+    print(f'✅ Exemplo válido ({len(example["chapters"])} capítulos)')
+    return True
+
+
+def test_strict_mode_rules():
+    """Testa que todos os schemas atendem ao modo estrito da API."""
+    print('🧪 Testando regras do modo estrito...')
+    for name, schema in [
+        ('ebook', EBOOK_SCHEMA),
+        ('ebook_chapter', CHAPTER_SCHEMA),
+        ('ebook_frame', EBOOK_FRAME_SCHEMA),
+        ('ebook_outline', EBOOK_OUTLINE_SCHEMA),
+        ('ebook_continuation', ebook_continuation_schema(['title', 'subtitle'])),
+    ]:
+        errors = _strict_errors(schema)
+        assert not errors, f'{name}: {errors}'
+        response_format = json_schema_response_format(name, schema)
+        assert response_format['type'] == 'json_schema'
+        assert response_format['json_schema']['strict'] is True
+    print('✅ Schemas compatíveis com o modo estrito')
+    return True
+
+
+def test_continuation_schema():
+    """Testa o schema da continuação, que pede só os capítulos e os campos que faltam."""
+    print('🧪 Testando schema da continuação...')
+    schema = ebook_continuation_schema(['title', 'subtitle', 'author', 'description'])
+
+    assert sorted(schema['properties']) == ['chapters', 'conclusion', 'key_points']
+    assert schema['properties']['chapters'] == EBOOK_SCHEMA['properties']['chapters']
+    assert not _errors({'chapters': [], 'conclusion': 'Fim', 'key_points': ['a']}, schema)
+    assert _errors({'title': 'Repetido', 'chapters': [], 'conclusion': 'Fim', 'key_points': []}, schema)
+
+    # Sem nada recebido, pede o ebook inteiro
+    assert sorted(ebook_continuation_schema([])['properties']) == sorted(EBOOK_SCHEMA['properties'])
+
+    # O prompt pede os mesmos campos que o schema, derivados de EBOOK_SCHEMA['required']
+    missing = missing_ebook_fields(['title', 'subtitle', 'author', 'description'])
+    assert missing == ['conclusion', 'key_points']
+    assert sorted(missing_ebook_fields([])) == sorted(set(EBOOK_SCHEMA['required']) - {'chapters'})
+    prompt = get_user_prompt_ebook_continuation('PROMPT', missing, [{'title': 'Um'}])
+    assert 'os campos conclusion, key_points.' in prompt and '1. Um' in prompt
+    print('✅ Continuação sem campos repetidos')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_example_matches_schema()
+        test_strict_mode_rules()
+        test_continuation_schema()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Teste do armazenamento compacto de timestamps por palavra
+
+Verifica a gravação e o carregamento (via mmap) do formato colunar usado pela
+transcrição e o formato de resposta pedido à API para obter as palavras, sem acessar a
+API da OpenAI.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.timestamps import WordTimestampStore
+from pipeline.transcription import OpenAITranscriptionBackend
+
+
+def test_word_timestamp_store():
+    """Testa ida e volta do armazenamento e a busca por instante."""
+    print('=' * 60)
+    print('TESTE: TIMESTAMPS POR PALAVRA')
+    print('=' * 60)
+
+    # ~3 horas de fala com 30 mil palavras
+    words = [(f' palavra{i}ção', i * 0.36, i * 0.36 + 0.3) for i in range(30000)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = Path(tmp) / 'transcricao.words'
+        WordTimestampStore.from_words(words).save(str(words_file))
+        print(f'💾 Arquivo gravado: {words_file.stat().st_size / 1024:.1f} KB')
+
+        start = time.perf_counter()
+        store = WordTimestampStore.load(str(words_file))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f'⏱️  Carregado em {elapsed_ms:.2f} ms')
+
+        with store:
+            assert len(store) == len(words)
+            assert store[0] == words[0]
+            assert store[-1] == words[-1]
+            assert store.to_list() == words
+            assert store[store.index_at(100.0)][1] <= 100.0 < store[store.index_at(100.0) + 1][1]
+
+    print('✅ Armazenamento de timestamps OK')
+    return True
+
+
+def test_word_timestamps_response_format():
+    """Testa que os timestamps por palavra forçam o formato 'verbose_json'."""
+    print('🧪 Testando formato de resposta com timestamps por palavra...')
+    backend = OpenAITranscriptionBackend('whisper-1', 'json', True, 0.006, 25)
+    assert backend.response_format == 'verbose_json'
+    assert backend.cache_tag == 'openai:whisper-1:verbose_json:True'
+
+    # Sem timestamps por palavra, o formato configurado é mantido
+    assert OpenAITranscriptionBackend('whisper-1', 'json', False, 0.006, 25).response_format == 'json'
+    print('✅ Formato ajustado para verbose_json')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_word_timestamp_store()
+        test_word_timestamps_response_format()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
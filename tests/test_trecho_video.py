@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Teste da seleção de trechos do vídeo
+
+Verifica a resolução de intervalos de tempo e capítulos do YouTube, a extração dos
+capítulos e o ajuste dos timestamps por palavra para a linha do tempo do vídeo
+original, sem acessar a rede.
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para importar o pipeline
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.ranges import extract_chapters, offset_transcription, parse_time, resolve_time_range, slice_transcription
+
+CHAPTERS = [
+    {'title': 'Introdução', 'start_time': 0.0, 'end_time': 600.0},
+    {'title': 'Perguntas e Respostas', 'start_time': 600.0, 'end_time': 3600.0},
+]
+
+
+def test_resolve_time_range():
+    """Testa a resolução por início/fim e por capítulo."""
+    print('🧪 Testando resolução de trechos...')
+    assert parse_time('1:02:03.5') == 3723.5
+    assert parse_time('90') == 90.0
+    assert resolve_time_range() is None
+    assert resolve_time_range('10:00', None, duration=3600) == (600.0, 3600.0, None)
+    assert resolve_time_range(None, '5000', duration=3600) == (0.0, 3600.0, None)
+    assert resolve_time_range(chapter='perguntas', chapters=CHAPTERS) == (600.0, 3600.0, 'Perguntas e Respostas')
+    assert resolve_time_range(chapter='1', chapters=CHAPTERS)[2] == 'Introdução'
+
+    for args in (('20', '10'), (None, None, 'inexistente')):
+        try:
+            resolve_time_range(*args, chapters=CHAPTERS)
+        except ValueError:
+            continue
+        raise AssertionError(f'Trecho inválido aceito: {args}')
+
+    print('✅ Trechos resolvidos')
+    return True
+
+
+def test_transcription_timeline():
+    """Testa o recorte de legendas e o deslocamento de transcrições do trecho."""
+    print('🧪 Testando linha do tempo das transcrições...')
+    full = {'text': 'a b c d', 'duration': 40, 'words': [[w, i * 10.0, i * 10.0 + 5] for i, w in enumerate('abcd')]}
+
+    sliced = slice_transcription(full, 10, 30)
+    assert sliced['text'] == 'b c'
+    assert sliced['duration'] == 20
+
+    shifted = offset_transcription({'text': 'b c', 'duration': 20, 'words': [['b', 0.0, 5.0]]}, 10)
+    assert shifted['words'] == [['b', 10.0, 15.0]]
+    print('✅ Linha do tempo ajustada')
+    return True
+
+
+def test_extract_chapters():
+    """Testa a normalização dos capítulos do yt-dlp para cobrir o vídeo inteiro."""
+    print('🧪 Testando extração de capítulos...')
+    info = {
+        'duration': 3700,
+        'chapters': [
+            {'title': 'Parte 2', 'start_time': 600.0, 'end_time': 3600.0},
+            {'title': 'Parte 1', 'start_time': 5.0, 'end_time': 600.0},
+        ],
+    }
+
+    chapters = extract_chapters(info)
+    assert [c['title'] for c in chapters] == ['Parte 1', 'Parte 2']
+    assert chapters[0]['start_time'] == 0.0
+    assert chapters[-1]['end_time'] == 3700.0
+    assert extract_chapters({'duration': 60}) == []
+    print('✅ Capítulos extraídos')
+    return True
+
+
+def main():
+    """Função principal do teste."""
+    try:
+        test_resolve_time_range()
+        test_transcription_timeline()
+        test_extract_chapters()
+        return 0
+    except AssertionError as e:
+        print(f'❌ Falha: {e}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())